@@ -0,0 +1,702 @@
+import argparse
+import asyncio
+import gc
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import sysconfig
+import tempfile
+import threading
+import time
+
+from number_extract import *
+from number_extract import _NUMBER_STAGES, _detect_negative, _understand_normalized
+from number_extract_server import ExtractionServer
+from test_number_extract import test_cases
+
+# Réponses typiques d'enquête : beaucoup de doublons exacts et de quasi-doublons
+SURVEY_ANSWERS = [
+    "la moitié", "La moitie.", "la moitié du temps", "aucun", "Aucun", "rien",
+    "50%", "50 %", "cinquante pour cent", "trois quarts", "un tiers", "deux tiers",
+    "presque tout", "presque rien", "tout", "tous", "la totalité", "un quart",
+    "je ne sais pas", "nous sommes mardi", "vingt-cinq", "quatre-vingt-dix pour cent",
+    "moins dix", "-5", "3/4", "un sur deux", "environ un tiers", "100%", "zero",
+    "j'en ai bu les trois quarts", "il y a deux pommes", "une dizaine",
+]
+
+
+def build_survey_corpus(size, seed=0):
+    """
+    Construit un corpus synthétique de réponses d'enquête, avec répétitions.
+
+    Args:
+        size (int): Nombre de réponses
+        seed (int): Graine du générateur aléatoire
+
+    Returns:
+        List[str]: Les réponses
+    """
+    random_generator = random.Random(seed)
+    return [random_generator.choice(SURVEY_ANSWERS) for _ in range(size)]
+
+
+def build_varied_corpus(size, seed=0):
+    """
+    Construit un corpus de phrases peu redondantes (nombres variés dans des phrases variées).
+
+    Args:
+        size (int): Nombre de phrases
+        seed (int): Graine du générateur aléatoire
+
+    Returns:
+        List[str]: Les phrases
+    """
+    random_generator = random.Random(seed)
+    templates = [
+        "il y a {} pommes", "cela coute {} euros", "{} pour cent des gens", "environ {}",
+        "{} sur 1000", "j en veux {}", "moins {}", "{} %",
+    ]
+    return [
+        random_generator.choice(templates).format(random_generator.randint(0, 10 ** 6))
+        + " " + random_generator.choice(SURVEY_ANSWERS)
+        for _ in range(size)
+    ]
+
+
+# Mots de remplissage sans valeur numérique (ni nombre, ni indicateur comme "tout" ou "rien")
+FILLER_WORDS = [
+    "nous", "sommes", "mardi", "la", "librairie", "marche", "bien", "je", "suis", "content",
+    "comme", "pouvons", "le", "voir", "dans", "cette", "phrase", "il", "fait", "beau",
+    "aujourd'hui", "les", "enfants", "jouent", "au", "parc", "avec", "leurs", "parents",
+]
+
+
+def build_long_corpus(size, words_per_text=400, seed=0):
+    """
+    Construit des textes longs : du remplissage, puis une réponse d'enquête en fin de texte.
+
+    Args:
+        size (int): Nombre de textes
+        words_per_text (int): Nombre de mots de remplissage par texte
+        seed (int): Graine du générateur aléatoire
+
+    Returns:
+        List[str]: Les textes
+    """
+    random_generator = random.Random(seed)
+    return [
+        " ".join(random_generator.choice(FILLER_WORDS) for _ in range(words_per_text))
+        + " " + random_generator.choice(SURVEY_ANSWERS)
+        for _ in range(size)
+    ]
+
+
+def build_no_number_corpus(size, seed=0, max_words=15):
+    """
+    Construit des phrases sans aucun nombre (cas le plus fréquent en production).
+
+    Args:
+        size (int): Nombre de phrases
+        seed (int): Graine du générateur aléatoire
+        max_words (int): Nombre maximal de mots par phrase
+
+    Returns:
+        List[str]: Les phrases
+    """
+    random_generator = random.Random(seed)
+    return [
+        " ".join(random_generator.choice(FILLER_WORDS) for _ in range(random_generator.randint(3, max_words)))
+        for _ in range(size)
+    ]
+
+
+def build_stage_corpora():
+    """
+    Corpus du benchmark par étape : les phrases de test, des textes longs, des phrases sans nombre.
+
+    Returns:
+        Dict[str, List[str]]: Nom du corpus -> textes
+    """
+    return {
+        "test_cases": list(test_cases),
+        "long": build_long_corpus(100),
+        "no_number": build_no_number_corpus(1000),
+    }
+
+
+def measure_function(function, inputs, rounds=5):
+    """
+    Mesure le débit et les quantiles de latence d'une fonction appelée sur chaque entrée.
+
+    Le débit est celui du passage le plus rapide (comme timeit) : les passages plus
+    lents mesurent surtout le bruit de la machine. Les quantiles portent sur tous les appels.
+
+    Args:
+        function (Callable): La fonction mesurée (un argument)
+        inputs (List): Les arguments, un appel par élément et par passage
+        rounds (int): Nombre de passages sur les entrées
+
+    Returns:
+        Dict[str, float]: calls, ops_per_sec, p50_us, p95_us, p99_us
+    """
+    latencies = []
+    fastest_round_ns = None
+    gc_was_enabled = gc.isenabled()
+    gc.disable()  # comme timeit : pas de collecte au milieu d'une mesure
+    for _ in range(rounds):
+        round_start = len(latencies)
+        for item in inputs:
+            start_time = time.perf_counter_ns()
+            function(item)
+            latencies.append(time.perf_counter_ns() - start_time)
+        round_ns = sum(latencies[round_start:])
+        fastest_round_ns = round_ns if fastest_round_ns is None else min(fastest_round_ns, round_ns)
+    if gc_was_enabled:
+        gc.enable()
+    quantiles = statistics.quantiles(latencies, n=100)
+    return {
+        "calls": len(latencies),
+        "ops_per_sec": len(inputs) / (fastest_round_ns / 1e9),
+        "p50_us": quantiles[49] / 1000,
+        "p95_us": quantiles[94] / 1000,
+        "p99_us": quantiles[98] / 1000,
+    }
+
+
+def run_stage_benchmark(rounds=5, output_path=None):
+    """
+    Benchmark de text_to_understanding et de chaque étape de text_to_number, par corpus.
+
+    Les étapes reçoivent le texte déjà normalisé, comme dans la cascade ; le cache de
+    résultats est désactivé pour mesurer le calcul.
+
+    Args:
+        rounds (int): Nombre de passages sur chaque corpus
+        output_path (Optional[str]): Fichier JSON où enregistrer les mesures
+
+    Returns:
+        Dict[str, Dict[str, float]]: "corpus/fonction" -> mesures (voir measure_function)
+    """
+    disable_result_cache()
+    results = {}
+    print("--- Benchmark par étape ---")
+    print(f"{'corpus/fonction':45s} {'ops/s':>12s} {'p50 µs':>9s} {'p95 µs':>9s} {'p99 µs':>9s}")
+    for corpus_name, texts in build_stage_corpora().items():
+        normalized_texts = [NormalizedText.from_input(text) for text in texts]
+        targets = [("text_to_understanding", text_to_understanding, texts), ("prefilter", may_contain_number, texts)]
+        targets += [(stage_name, stage_function, normalized_texts) for stage_name, stage_function in _NUMBER_STAGES]
+        for target_name, function, inputs in targets:
+            for item in inputs:  # mise en route
+                function(item)
+            stats = measure_function(function, inputs, rounds)
+            key = f"{corpus_name}/{target_name}"
+            results[key] = stats
+            print(f"{key:45s} {stats['ops_per_sec']:12.0f} {stats['p50_us']:9.1f} "
+                  f"{stats['p95_us']:9.1f} {stats['p99_us']:9.1f}")
+
+    if output_path:
+        report = {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "results": results,
+        }
+        with open(output_path, "w", encoding="utf-8") as output_file:
+            json.dump(report, output_file, indent=2)
+        print(f"Mesures enregistrées dans {output_path}")
+    return results
+
+
+def compare_stage_benchmarks(baseline, current, threshold=0.2):
+    """
+    Compare deux séries de mesures et liste les régressions de débit.
+
+    Une mesure de référence absente des mesures à vérifier (étape renommée ou supprimée,
+    corpus manquant) compte comme une régression.
+
+    Args:
+        baseline (Dict[str, Dict[str, float]]): Mesures de référence
+        current (Dict[str, Dict[str, float]]): Mesures à vérifier
+        threshold (float): Ralentissement toléré (0.2 : débit jusqu'à 20 % plus faible)
+
+    Returns:
+        List[str]: Les clés "corpus/fonction" dont le ralentissement dépasse le seuil ou
+            qui manquent dans current
+    """
+    regressions = []
+    print(f"--- Comparaison (seuil {threshold:.0%}) ---")
+    for key, baseline_stats in baseline.items():
+        current_stats = current.get(key)
+        if current_stats is None:
+            regressions.append(key)
+            print(f"❌ {key:45s} {baseline_stats['ops_per_sec']:12.0f} -> mesure absente")
+            continue
+        slowdown = baseline_stats["ops_per_sec"] / current_stats["ops_per_sec"] - 1
+        regressed = slowdown > threshold
+        if regressed:
+            regressions.append(key)
+        print(f"{'❌' if regressed else '✅'} {key:45s} {baseline_stats['ops_per_sec']:12.0f} -> "
+              f"{current_stats['ops_per_sec']:12.0f} ops/s ({current_stats['ops_per_sec'] / baseline_stats['ops_per_sec'] - 1:+.1%})")
+    return regressions
+
+
+def _load_results(path):
+    with open(path, encoding="utf-8") as input_file:
+        return json.load(input_file)["results"]
+
+
+def _understanding_without_prefilter(input_text):
+    return _understand_normalized(NormalizedText.from_input(input_text), _detect_negative(input_text))
+
+
+def run_prefilter_benchmark(rounds=5):
+    """
+    Benchmark du préfiltre may_contain_number sur des corpus sans nombre.
+
+    Compare le préfiltre seul, text_to_understanding (qui l'utilise) et la cascade
+    complète sans préfiltre ; vérifie au passage qu'aucun texte n'est écarté à tort.
+
+    Args:
+        rounds (int): Nombre de passages sur chaque corpus
+    """
+    disable_result_cache()
+    corpora = {
+        "no_number": build_no_number_corpus(5000),
+        "no_number_long": build_no_number_corpus(500, max_words=400),
+        "survey": build_survey_corpus(5000),
+    }
+    print("--- Préfiltre sans nombre ---")
+    for corpus_name, texts in corpora.items():
+        rejected = [text for text in texts if not may_contain_number(text)]
+        assert all(_understanding_without_prefilter(text).no_number for text in rejected)
+        print(f"{corpus_name} : {len(rejected) / len(texts):.0%} des textes écartés par le préfiltre")
+        for target_name, function in (("may_contain_number", may_contain_number),
+                                      ("text_to_understanding", text_to_understanding),
+                                      ("cascade sans préfiltre", _understanding_without_prefilter)):
+            stats = measure_function(function, texts, rounds)
+            print(f"  {target_name:25s} {stats['ops_per_sec']:12.0f} ops/s   p50 {stats['p50_us']:7.1f} µs   "
+                  f"p99 {stats['p99_us']:7.1f} µs")
+
+
+# Script exécuté dans un interpréteur neuf : durée de l'import puis du premier résultat
+_COLD_START_SCRIPT = (
+    "import time; start = time.perf_counter(); import number_extract; imported = time.perf_counter(); "
+    "number_extract.text_to_understanding('trois quarts'); first = time.perf_counter(); "
+    "print(imported - start, first - imported)"
+)
+
+
+def _cold_start_run(snapshot_path=None):
+    """
+    Un démarrage à froid dans un sous-processus.
+
+    Returns:
+        dict: import_ms (import complet), module_ms (corps du module seul, d'après -X importtime)
+            et first_call_ms (premier text_to_understanding)
+    """
+    environment = dict(os.environ)
+    environment.pop(ENGINE_SNAPSHOT_ENV, None)
+    if snapshot_path:
+        environment[ENGINE_SNAPSHOT_ENV] = snapshot_path
+    completed = subprocess.run([sys.executable, "-X", "importtime", "-c", _COLD_START_SCRIPT],
+                               capture_output=True, text=True, check=True, env=environment,
+                               cwd=os.path.dirname(os.path.abspath(__file__)))
+    import_seconds, first_call_seconds = map(float, completed.stdout.split())
+    module_line = next(line for line in completed.stderr.splitlines() if line.rstrip().endswith("| number_extract"))
+    return {
+        "import_ms": import_seconds * 1000,
+        "module_ms": int(module_line.split("|")[0].split(":")[1]) / 1000,
+        "first_call_ms": first_call_seconds * 1000,
+    }
+
+
+def run_cold_start_benchmark(runs=10):
+    """
+    Coût du démarrage à froid : import puis premier résultat, sans et avec instantané du moteur.
+
+    Chaque mesure est faite dans un interpréteur neuf ; la médiane de runs démarrages est affichée.
+
+    Args:
+        runs (int): Nombre de démarrages par configuration
+    """
+    print("--- Démarrage à froid (médiane de %d interpréteurs) ---" % runs)
+    if sys.flags.dont_write_bytecode:
+        print("(PYTHONDONTWRITEBYTECODE : sans .pyc en cache, l'import recompile aussi le source)")
+    with tempfile.TemporaryDirectory() as directory:
+        snapshot_path = os.path.join(directory, "moteur.snapshot")
+        save_engine_snapshot(snapshot_path)
+        for label, path in (("index construits à l'import", None), ("instantané du moteur", snapshot_path)):
+            measures = [_cold_start_run(path) for _ in range(runs)]
+            medians = {key: statistics.median(measure[key] for measure in measures) for key in measures[0]}
+            print(f"{label:28s} import {medians['import_ms']:6.1f} ms (corps du module "
+                  f"{medians['module_ms']:5.1f} ms)   premier résultat {medians['first_call_ms']:5.2f} ms")
+
+
+def build_transcript(word_count, seed=0):
+    """
+    Construit une transcription parlée : du remplissage, puis un nombre dicté mot à mot.
+
+    Args:
+        word_count (int): Nombre total de mots
+        seed (int): Graine du générateur aléatoire
+
+    Returns:
+        List[str]: Les mots, dans l'ordre d'arrivée
+    """
+    random_generator = random.Random(seed)
+    number_words = "moins deux cent quatre vingt dix sept mille trois cent pour cent".split()
+    filler_count = max(word_count - len(number_words), 0)
+    words = [random_generator.choice(FILLER_WORDS) for _ in range(filler_count)] + number_words
+    return words[:word_count]
+
+
+def run_incremental_benchmark(word_counts=(10, 50, 200, 1000), rounds=5):
+    """
+    Lecture d'une transcription en direct : coût moyen par mot reçu.
+
+    Compare la relecture complète de la transcription à chaque mot (text_to_understanding
+    sur le préfixe, coût quadratique) et IncrementalExtractor.append (coût constant par mot).
+
+    Args:
+        word_counts (Iterable[int]): Longueurs de transcription mesurées
+        rounds (int): Nombre de passages par mesure (la médiane est retenue)
+    """
+    disable_result_cache()
+    print("--- Transcription en direct (µs par mot reçu) ---")
+    for word_count in word_counts:
+        words = build_transcript(word_count)
+        prefixes = [" ".join(words[:index + 1]) for index in range(len(words))]
+        extractor = IncrementalExtractor()
+        timings = {"relecture": [], "incrémental": []}
+        for _ in range(rounds):
+            start = time.perf_counter()
+            for prefix in prefixes:
+                rescanned = text_to_understanding(prefix)
+            timings["relecture"].append(time.perf_counter() - start)
+            start = time.perf_counter()
+            for word in words:
+                extractor.append(word)
+            streamed = format_understanding(extractor.finalize())
+            timings["incrémental"].append(time.perf_counter() - start)
+        assert streamed == rescanned, (streamed, rescanned)
+        per_word = {label: statistics.median(values) / word_count * 1e6 for label, values in timings.items()}
+        print(f"{word_count:5d} mots   relecture {per_word['relecture']:9.1f} µs   "
+              f"incrémental {per_word['incrémental']:6.1f} µs   "
+              f"x{per_word['relecture'] / per_word['incrémental']:.0f}")
+
+
+# Phrases dont les dizaines 70, 80, 90 s'écrivent selon le système de chaque profil régional
+_LOCALE_TENS_SPELLINGS = {
+    LOCALE_FRANCE: ("soixante-dix", "quatre-vingts", "quatre-vingt-dix"),
+    LOCALE_BELGIUM: ("septante", "quatre-vingts", "nonante"),
+    LOCALE_SWITZERLAND: ("septante", "huitante", "nonante"),
+}
+_LOCALE_TEMPLATES = (
+    "{} pour cent des gens", "il y a {}-deux pommes", "cela coute mille {} euros", "environ {}",
+    "un sur {}", "moins {}-sept", "deux cent {}", "les {} habitants du village",
+)
+
+
+def build_locale_corpus(locale, size, seed=0):
+    """
+    Construit des phrases dont les dizaines (70, 80, 90) suivent le système d'un profil régional.
+
+    Args:
+        locale (str): Profil régional (France, Belgique ou Suisse)
+        size (int): Nombre de phrases
+        seed (int): Graine du générateur aléatoire
+
+    Returns:
+        List[str]: Les phrases
+    """
+    random_generator = random.Random(seed)
+    return [
+        random_generator.choice(_LOCALE_TEMPLATES).format(random_generator.choice(_LOCALE_TENS_SPELLINGS[locale]))
+        for _ in range(size)
+    ]
+
+
+def run_locale_benchmark(rounds=5):
+    """
+    Benchmark par profil régional : compilation du moteur, puis débit de text_to_understanding.
+
+    Chaque profil est mesuré sur les phrases de son système de dizaines, sur les
+    réponses d'enquête et sur des phrases sans nombre ; le profil "mixed" (défaut)
+    sert de référence sur les mêmes corpus. Les résultats des deux profils sont
+    comparés au passage.
+
+    Args:
+        rounds (int): Nombre de passages sur chaque corpus
+    """
+    disable_result_cache()
+    previous_locale = get_locale_profile()
+    shared_corpora = {"survey": build_survey_corpus(2000), "no_number": build_no_number_corpus(2000)}
+    print("--- Profils régionaux (ops/s de text_to_understanding) ---")
+    try:
+        for locale in LOCALE_PROFILES[1:]:
+            corpora = {"dialect": build_locale_corpus(locale, 2000), **shared_corpora}
+            measures = {}
+            for measured_locale in (LOCALE_MIXED, locale):
+                start = time.perf_counter()
+                set_locale_profile(measured_locale)
+                compile_ms = (time.perf_counter() - start) * 1000
+                outputs = {name: [text_to_understanding(text) for text in texts] for name, texts in corpora.items()}
+                rates = {name: measure_function(text_to_understanding, texts, rounds)["ops_per_sec"]
+                         for name, texts in corpora.items()}
+                measures[measured_locale] = (compile_ms, outputs, rates)
+            differences = sum(reference != result
+                              for name in corpora
+                              for reference, result in zip(measures[LOCALE_MIXED][1][name], measures[locale][1][name]))
+            for measured_locale, (compile_ms, _, rates) in measures.items():
+                print(f"{locale:12s} {measured_locale:12s} compilation {compile_ms:6.1f} ms   " + "   ".join(
+                    f"{name} {rate:9.0f}" for name, rate in rates.items()))
+            print(f"{locale:12s} {differences} résultat(s) différent(s) du profil mixed")
+    finally:
+        set_locale_profile(previous_locale)
+
+
+def run_persistent_cache_benchmark(corpus_size=50000):
+    """
+    Retraitement d'un corpus déjà vu (traitement de nuit) avec le cache persistant.
+
+    Mesure le lot sans cache, le premier passage (cache vide, rempli au passage), puis
+    un nouveau passage depuis une autre connexion, comme un processus qui démarre à
+    froid : sur le même corpus, puis sur ses variantes de casse et de ponctuation
+    (servies par la clé normalisée). La boucle text_to_understanding est aussi mesurée
+    avec le cache actif.
+
+    Args:
+        corpus_size (int): Nombre de phrases (peu redondantes, voir build_varied_corpus)
+    """
+    disable_result_cache()
+    corpus = build_varied_corpus(corpus_size)
+    variants = [text.upper() + "." for text in corpus]
+    reference_results = text_to_understanding_many(corpus)
+    variant_results = text_to_understanding_many(variants)
+
+    def measure(label, function, texts, expected):
+        start_time = time.perf_counter()
+        results = function(texts)
+        rate = len(texts) / (time.perf_counter() - start_time)
+        assert results == expected, label
+        print(f"{label:34s}: {rate:10.0f} textes/s")
+
+    print("--- Cache persistant (SQLite) ---")
+    measure("Sans cache", text_to_understanding_many, corpus, reference_results)
+    measure("Variantes sans cache", text_to_understanding_many, variants, variant_results)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "resultats.sqlite")
+        try:
+            enable_persistent_cache(path)
+            measure("Premier passage (cache vide)", text_to_understanding_many, corpus, reference_results)
+            # Nouvelle connexion : rien en mémoire, tout se lit sur disque
+            enable_persistent_cache(path)
+            measure("Même corpus (cache chaud)", text_to_understanding_many, corpus, reference_results)
+            measure("Variantes (clé normalisée)", text_to_understanding_many, variants, variant_results)
+            cache = enable_persistent_cache(path)
+            measure("Boucle text_to_understanding", lambda texts: [text_to_understanding(text) for text in texts],
+                    corpus, reference_results)
+            print(f"Entrées sur disque : {len(cache)}, "
+                  f"fichier {os.path.getsize(path) / 1e6:.1f} Mo")
+        finally:
+            disable_persistent_cache()
+
+
+def run_batch_benchmark(corpus_size=100000):
+    corpus = build_survey_corpus(corpus_size)
+
+    start_time = time.perf_counter()
+    loop_results = [text_to_understanding(answer) for answer in corpus]
+    loop_seconds = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    batch_results = text_to_understanding_many(corpus)
+    batch_seconds = time.perf_counter() - start_time
+
+    assert batch_results == loop_results
+    print("--- Lot vs boucle ---")
+    print(f"Boucle text_to_understanding      : {corpus_size / loop_seconds:10.0f} textes/s")
+    print(f"text_to_understanding_many        : {corpus_size / batch_seconds:10.0f} textes/s")
+    print(f"Accélération : x{loop_seconds / batch_seconds:.1f}")
+
+
+def run_parallel_benchmark(corpus_size=100000, chunk_size=2000):
+    corpus = build_varied_corpus(corpus_size)
+    reference_results = text_to_understanding_many(corpus)
+
+    print("--- Passage à l'échelle multi-processus ---")
+    worker_counts = sorted({1, 2, 4, 8, 16, 32, os.cpu_count() or 1})
+    single_worker_rate = None
+    for worker_count in worker_counts:
+        if worker_count > 2 * (os.cpu_count() or 1):
+            continue
+        start_time = time.perf_counter()
+        parallel_results = text_to_understanding_parallel(corpus, max_workers=worker_count, chunk_size=chunk_size)
+        rate = corpus_size / (time.perf_counter() - start_time)
+        assert parallel_results == reference_results
+        single_worker_rate = single_worker_rate or rate
+        print(f"{worker_count:3d} processus : {rate:10.0f} textes/s (x{rate / single_worker_rate:.2f})")
+
+
+def _interpreter_description():
+    # Build free-threaded (Py_GIL_DISABLED) et état effectif du GIL (réactivable par PYTHON_GIL=1)
+    free_threaded = bool(sysconfig.get_config_var("Py_GIL_DISABLED"))
+    gil_enabled = sys._is_gil_enabled() if hasattr(sys, "_is_gil_enabled") else True
+    build = "free-threaded" if free_threaded else "standard"
+    return f"{platform.python_implementation()} {platform.python_version()} ({build}, GIL {'actif' if gil_enabled else 'désactivé'})"
+
+
+def run_thread_benchmark(corpus_size=50000, max_threads=None, chunk_size=500):
+    corpus = build_varied_corpus(corpus_size)
+    reference_results = text_to_understanding_many(corpus)
+    max_threads = max_threads or os.cpu_count() or 1
+
+    print(f"--- Passage à l'échelle multi-fils : {_interpreter_description()} ---")
+    thread_counts = sorted({1, max_threads} | {count for count in (2, 4, 8, 16, 32, 64) if count < max_threads})
+    single_thread_rate = None
+    for thread_count in thread_counts:
+        start_time = time.perf_counter()
+        threaded_results = text_to_understanding_threaded(corpus, max_workers=thread_count, chunk_size=chunk_size)
+        rate = corpus_size / (time.perf_counter() - start_time)
+        assert threaded_results == reference_results
+        single_thread_rate = single_thread_rate or rate
+        speedup = rate / single_thread_rate
+        print(f"{thread_count:3d} fils : {rate:10.0f} textes/s (x{speedup:.2f}, efficacité {speedup / thread_count:.0%})")
+
+
+async def _post_extract(reader, writer, payload):
+    body = json.dumps(payload).encode("utf-8")
+    writer.write(
+        b"POST /extract HTTP/1.1\r\nHost: localhost\r\nContent-Type: application/json\r\n"
+        + f"Content-Length: {len(body)}\r\n\r\n".encode("latin-1") + body
+    )
+    await writer.drain()
+    await reader.readline()
+    content_length = 0
+    while True:
+        header_line = await reader.readline()
+        if header_line in (b"\r\n", b""):
+            break
+        name, _, value = header_line.decode("latin-1").partition(":")
+        if name.strip().lower() == "content-length":
+            content_length = int(value)
+    return json.loads(await reader.readexactly(content_length))
+
+
+async def _run_http_clients(port, phrases, concurrency):
+    latencies = []
+    phrase_iterator = iter(phrases)
+
+    async def client():
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        for phrase in phrase_iterator:
+            start_time = time.perf_counter()
+            response = await _post_extract(reader, writer, {"text": phrase})
+            latencies.append(time.perf_counter() - start_time)
+            assert "result" in response
+        writer.close()
+
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    return latencies
+
+
+def run_server_benchmark(request_count=5000, concurrency=64, workers=None, batch_window_ms=2.0):
+    server = ExtractionServer(port=0, batch_window=batch_window_ms / 1000, workers=workers)
+    server_loop = asyncio.new_event_loop()
+    server_loop.run_until_complete(server.start())
+    server_thread = threading.Thread(target=server_loop.run_forever, daemon=True)
+    server_thread.start()
+
+    phrases = build_varied_corpus(request_count)
+    start_time = time.perf_counter()
+    latencies = asyncio.run(_run_http_clients(server.port, phrases, concurrency))
+    elapsed = time.perf_counter() - start_time
+
+    asyncio.run_coroutine_threadsafe(server.close(), server_loop).result()
+    server_loop.call_soon_threadsafe(server_loop.stop)
+    server_thread.join()
+
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(f"--- Service HTTP ({concurrency} clients, fenêtre {batch_window_ms} ms) ---")
+    print(f"Débit : {request_count / elapsed:10.0f} requêtes/s")
+    print(f"Latence p50 {quantiles[49] * 1000:.2f} ms, p95 {quantiles[94] * 1000:.2f} ms, "
+          f"p99 {quantiles[98] * 1000:.2f} ms")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks de number_extract.")
+    parser.add_argument("--suite", action="store_true",
+                        help="benchmark par étape (sinon : lot, multi-processus, service HTTP)")
+    parser.add_argument("--prefilter", action="store_true", help="benchmark du préfiltre sur des corpus sans nombre")
+    parser.add_argument("-o", "--output", help="fichier JSON où enregistrer les mesures de --suite")
+    parser.add_argument("--compare", metavar="REFERENCE",
+                        help="mesures JSON de référence : échec si une fonction régresse (implique --suite)")
+    parser.add_argument("--current", metavar="MESURES",
+                        help="avec --compare : mesures JSON à vérifier au lieu d'un nouveau benchmark")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="ralentissement toléré par --compare (défaut : 0.2, soit 20 %%)")
+    parser.add_argument("--rounds", type=int, default=5, help="passages sur chaque corpus")
+    parser.add_argument("--cold-start", action="store_true",
+                        help="coût de l'import et du premier appel, sans et avec instantané du moteur")
+    parser.add_argument("--threads", type=int, nargs="?", const=0, metavar="N",
+                        help="débit multi-fils de 1 à N fils (défaut : nombre de cœurs), "
+                             "à lancer sur un interpréteur standard puis free-threaded")
+    parser.add_argument("--locales", action="store_true",
+                        help="compilation et débit de chaque profil régional, comparés au profil mixed")
+    parser.add_argument("--incremental", action="store_true",
+                        help="transcription en direct : relecture complète contre lecture incrémentale")
+    parser.add_argument("--persistent-cache", action="store_true",
+                        help="retraitement d'un corpus déjà vu : sans cache, cache persistant vide puis chaud")
+    args = parser.parse_args(argv)
+
+    if args.cold_start:
+        run_cold_start_benchmark()
+        return 0
+
+    if args.prefilter:
+        run_prefilter_benchmark(args.rounds)
+        return 0
+
+    if args.locales:
+        run_locale_benchmark(args.rounds)
+        return 0
+
+    if args.incremental:
+        run_incremental_benchmark(rounds=args.rounds)
+        return 0
+
+    if args.persistent_cache:
+        run_persistent_cache_benchmark()
+        return 0
+
+    if args.threads is not None:
+        run_thread_benchmark(max_threads=args.threads or None)
+        return 0
+
+    if not (args.suite or args.compare):
+        run_batch_benchmark()
+        run_parallel_benchmark()
+        run_thread_benchmark()
+        run_server_benchmark()
+        return 0
+
+    if args.current:
+        current = _load_results(args.current)
+    else:
+        current = run_stage_benchmark(args.rounds, args.output)
+    if args.compare:
+        regressions = compare_stage_benchmarks(_load_results(args.compare), current, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} régression(s) au-delà de {args.threshold:.0%} ou mesure(s) absente(s)")
+            return 1
+    return 0
+
+
+# Lancer les benchmarks
+if __name__ == "__main__":
+    sys.exit(main())
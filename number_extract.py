@@ -1,5 +1,22 @@
+import csv
+import importlib
+import io
+import json
+import marshal
+import mmap
+import os
 import re
-from typing import Optional, List, Dict, Tuple
+import struct
+import sys
+import threading
+import time
+import warnings
+import zlib
+from collections import OrderedDict, deque
+from itertools import islice
+from types import MappingProxyType
+from typing import (Optional, List, Dict, Tuple, Union, Iterator, Iterable, Callable, Hashable, NamedTuple, Any,
+                    TextIO, Mapping, FrozenSet, Set)
 
 import re
 
@@ -23,652 +40,2720 @@ def text_to_understanding(input_text: str) -> str:
         - "moins quatre" -> "-4"
         - " -5" -> "-5"
         - "-400%" -> "-400%"
+
+    Mise en forme de text_to_result (voir format_understanding).
     """
+    return format_understanding(text_to_result(input_text))
 
-    # Détection du signe négatif dans le texte original (avant normalisation)
-    input_text_lower = input_text.lower()
-    is_negative = False
 
-    # Cas 1 : "moins" sans "de"
-    if re.search(r'\bmoins\b(?!\s+de)', input_text_lower):
-        is_negative = True
-        
-    #Mais si il y a moins "moins deu" alors on remet en positif
-    if "moins deu" in input_text.lower() :
-        is_negative = True
+def text_to_result(input_text: str) -> 'UnderstandingResult':
+    """
+    Analyse un texte français et renvoie un résultat structuré (sans chaîne à re-parser).
 
-    # Cas 2 : "-" ou "_" suivi d’un chiffre
-    if re.search(r'(?<!\w)[-_]\s*\d+', input_text):
-        is_negative = True
+    Args:
+        input_text (str): Le texte d'entrée à analyser
 
-    # Texte normalisé pour traitement
-    normalized_text = normalize_text(input_text)
+    Returns:
+        UnderstandingResult: Valeur signée, pourcentage ou non, signe, étape de détection
 
-    # Liste des indicateurs de pourcentage
-    percentage_indicators = [
-        "pourcent", "%", "prcent", "prcnt", "pour cent", "pour cents",
-        "demi", "moitie", "tiers", "tier", "quart", "quarts",
-        "totalite", "quasi", "tout", "tous", "aucun", "rien", "presque",
-        "sur", " / "
-    ]
+    Exemples:
+        - "trois sur quatre" -> UnderstandingResult(value=75, is_percent=True, sign=1,
+          stage='word_fraction', fraction=Fraction(3, 4), no_number=False)
+        - "moins quatre" -> value=-4, is_percent=False, sign=-1, stage='written_numbers'
 
-    # Détection des fractions numériques (ex: 3/4)
-    fraction_numeric_match = re.search(r'(\d+)\s*/\s*(\d+)', normalized_text)
-    if fraction_numeric_match:
-        numerator = int(fraction_numeric_match.group(1))
-        denominator = int(fraction_numeric_match.group(2))
-        if denominator != 0:
-            percentage_value = (numerator / denominator) * 100
-            if is_negative:
-                percentage_value *= -1
-            return f"{round(percentage_value)}%"
-
-    # Détection des fractions textuelles (ex: trois sur quatre)
-    fraction_sur_match = re.search(r'(\S+)\s+sur\s+(\S+)', normalized_text)
-    if fraction_sur_match:
-        numerator_text = fraction_sur_match.group(1)
-        denominator_text = fraction_sur_match.group(2)
-
-        numerator_value = text_to_number(numerator_text)
-        denominator_value = text_to_number(denominator_text)
+    Si le cache de résultats est activé (enable_result_cache), les textes déjà vus
+    ne sont pas ré-analysés ; derrière lui, le cache persistant (enable_persistent_cache)
+    sert les textes déjà analysés par d'autres processus ou exécutions.
+    """
+    persistent_cache = _persistent_cache
+    compute = _compute_understanding if persistent_cache is None else persistent_cache.result
+    understanding_cache = _understanding_cache
+    if understanding_cache is not None:
+        return understanding_cache.get_or_compute(input_text, compute)
+    return compute(input_text)
 
-        if numerator_value is not None and denominator_value not in (None, 0):
-            percentage_value = (numerator_value / denominator_value) * 100
-            if is_negative:
-                percentage_value *= -1
-            return f"{round(percentage_value)}%"
-
-    # Détection des ordinaux (ex: cinquième -> 5%)
-    if re.search(r'(?:ieme|iemes|ième|ièmes)', normalized_text):
-        ordinal_number = text_to_number(normalized_text)
-        if ordinal_number is not None:
-            if is_negative:
-                ordinal_number *= -1
-            return f"{ordinal_number}%"
 
-    # Extraction du nombre principal
-    extracted_number = text_to_number(normalized_text)
-
-    # Vérification des indicateurs de pourcentage
-    for indicator in percentage_indicators:
-        if indicator == "%" and "%" in normalized_text:
-            if extracted_number is not None:
-                if is_negative:
-                    extracted_number *= -1
-                return f"{extracted_number}%"
-        elif indicator != "%" and re.search(r'\b' + re.escape(indicator) + r'\b', normalized_text):
-            if extracted_number is not None:
-                if is_negative:
-                    extracted_number *= -1
-                return f"{extracted_number}%"
-            # Cas spéciaux pour les expressions absolues
-            if indicator in ["totalite", "tout", "tous"]:
-                return "100%"
-            elif indicator in ["aucun", "rien"]:
-                return "0%"
-
-    # Retour du nombre s'il est trouvé
-    if extracted_number is not None:
-        if is_negative:
-            extracted_number *= -1
-        return str(extracted_number)
+def _compute_understanding(input_text: str) -> 'UnderstandingResult':
+    """
+    Analyse complète d'un texte brut, sans cache.
 
-    # Aucun chiffre détecté
-    return "AUCUN CHIFFRE"
+    Args:
+        input_text (str): Le texte d'entrée à analyser
 
+    Returns:
+        UnderstandingResult: Le résultat de text_to_result
+    """
+    # Texte en minuscules sans accents, partagé par le préfiltre et l'analyse lexicale
+    folded_text = input_text.lower().translate(_ACCENT_TABLE)
+    if not _may_contain_number_folded(folded_text):
+        return _NO_NUMBER_RESULT
 
+    # Un seul parcours du texte : le signe (texte original) et le texte normalisé se lisent sur les mêmes tokens
+    tokens = list(_iter_tokens(input_text, folded_text))
+    normalized = NormalizedText.from_tokens(input_text, tokens)
+    return _understand_normalized(normalized, _negative_sign(input_text, tokens))
 
 
-def normalize_text(input_text: str) -> str:
+def text_to_understanding_many(input_texts: Iterable[str]) -> List[str]:
     """
-    Normalise le texte pour faciliter l'analyse numérique.
-
-    Opérations effectuées :
-    - Conversion en minuscules
-    - Suppression des accents
-    - Remplacement des tirets et underscores par des espaces et . a la fin annuler
-    - Suppression du mot 'et'
-    - Conversion des nombres français complexes en formes belges/suisses simplifiées
-    - Correction des fautes d'orthographe courantes
-    - Nettoyage des espaces multiples
-    - Si on voit le mot virgule(s) ou point(s) on enlève la suite de la chaîne (ex: "quatre virgule cinq" devient "quatre")
+    Version par lot de text_to_understanding (mise en forme de text_to_result_many).
 
     Args:
-        input_text (str): Le texte à normaliser
+        input_texts (Iterable[str]): Les textes à analyser
 
     Returns:
-        str: Le texte normalisé
+        List[str]: Les résultats de text_to_understanding, dans l'ordre des entrées
     """
-    # 1. Conversion en minuscules et remplacement des séparateurs
-    normalized = input_text.lower()
-    normalized = normalized.replace('-', ' ').replace('_', ' ')
-    
+    return [format_understanding(result) for result in text_to_result_many(input_texts)]
 
-    if normalized[-1] == '.':
-        normalized = normalized[:-1]
 
-    # 2. Suppression du mot "et"
-    normalized = re.sub(r'\bet\b', '', normalized)
-
-    # 3. Suppression des accents français
-    accent_mapping = str.maketrans({
-        'à': 'a', 'â': 'a', 'ä': 'a', 'á': 'a',
-        'é': 'e', 'è': 'e', 'ê': 'e', 'ë': 'e',
-        'î': 'i', 'ï': 'i', 'í': 'i',
-        'ô': 'o', 'ö': 'o', 'ó': 'o',
-        'ù': 'u', 'û': 'u', 'ü': 'u', 'ú': 'u',
-        'ÿ': 'y', 'ý': 'y',
-        'ç': 'c'
-    })
-    normalized = normalized.translate(accent_mapping)
-
-    # 4. Conversion des nombres français complexes en formes simplifiées
-    french_to_simple_patterns = [
-        # soixante-dix → septante
-        (r'\bsoixante\s*dix\s*neuf\b', 'septante neuf'),
-        (r'\bsoixante\s*dix\s*huit\b', 'septante huit'),
-        (r'\bsoixante\s*dix\s*sept\b', 'septante sept'),
-        (r'\bsoixante\s*dix\s*six\b', 'septante six'),
-        (r'\bsoixante\s*dix\s*cinq\b', 'septante cinq'),
-        (r'\bsoixante\s*dix\s*quatre\b', 'septante quatre'),
-        (r'\bsoixante\s*dix\s*trois\b', 'septante trois'),
-        (r'\bsoixante\s*dix\s*deux\b', 'septante deux'),
-        (r'\bsoixante\s*dix\s*un\b', 'septante un'),
-        (r'\bsoixante\s*dix\b', 'septante'),
-
-        # quatre-vingt-dix → nonante
-        (r'\bquatre\s*vingt[s]?\s*dix\s*neuf\b', 'nonante neuf'),
-        (r'\bquatre\s*vingt[s]?\s*dix\s*huit\b', 'nonante huit'),
-        (r'\bquatre\s*vingt[s]?\s*dix\s*sept\b', 'nonante sept'),
-        (r'\bquatre\s*vingt[s]?\s*dix\s*six\b', 'nonante six'),
-        (r'\bquatre\s*vingt[s]?\s*dix\s*cinq\b', 'nonante cinq'),
-        (r'\bquatre\s*vingt[s]?\s*dix\s*quatre\b', 'nonante quatre'),
-        (r'\bquatre\s*vingt[s]?\s*dix\s*trois\b', 'nonante trois'),
-        (r'\bquatre\s*vingt[s]?\s*dix\s*deux\b', 'nonante deux'),
-        (r'\bquatre\s*vingt[s]?\s*dix\s*un\b', 'nonante un'),
-        (r'\bquatre\s*vingt[s]?\s*dix\b', 'nonante'),
-
-        # quatre-vingt → octante
-        (r'\bquatre\s*vingt[s]?\s*neuf\b', 'octante neuf'),
-        (r'\bquatre\s*vingt[s]?\s*huit\b', 'octante huit'),
-        (r'\bquatre\s*vingt[s]?\s*sept\b', 'octante sept'),
-        (r'\bquatre\s*vingt[s]?\s*six\b', 'octante six'),
-        (r'\bquatre\s*vingt[s]?\s*cinq\b', 'octante cinq'),
-        (r'\bquatre\s*vingt[s]?\s*quatre\b', 'octante quatre'),
-        (r'\bquatre\s*vingt[s]?\s*trois\b', 'octante trois'),
-        (r'\bquatre\s*vingt[s]?\s*deux\b', 'octante deux'),
-        (r'\bquatre\s*vingt[s]?\s*un\b', 'octante un'),
-        (r'\bquatre\s*vingt[s]?\b', 'octante'),
-    ]
-    for pattern, replacement in french_to_simple_patterns:
-        normalized = re.sub(pattern, replacement, normalized)
-
-    # 5. Suppression de la suite après "virgule" ou "point"
-    normalized = re.split(r'\b(virgule|virgules|point|points)\b', normalized)[0]
-
-    # 6. Nettoyage final : suppression des espaces multiples
-    normalized = re.sub(r'\s+', ' ', normalized).strip()
-
-    return normalized
-
-
-
-def text_to_number(input_text: str) -> Optional[int]:
+def text_to_result_many(input_texts: Iterable[str]) -> List['UnderstandingResult']:
     """
-    Extrait et convertit un nombre à partir d'un texte français.
-    
-    Stratégie d'extraction par ordre de priorité :
-    1. Pourcentages explicites (50%, cinquante pourcent)
-    2. Fractions génériques (3/4, trois sur quatre)
-    3. Nombres en chiffres (123, 45.67)
-    4. Expressions spéciales (tout, rien, presque)
-    5. Nombres écrits en lettres (vingt-trois, quatre-vingts)
-    
+    Version par lot de text_to_result, avec déduplication dans le lot.
+
+    Chaque texte n'est analysé qu'une fois par forme normalisée (et par signe) :
+    les doublons exacts ou quasi-doublons ("La moitié." / "la moitie") réutilisent
+    le résultat déjà calculé. Les résultats sont rendus dans l'ordre des entrées.
+    Avec un cache persistant (enable_persistent_cache), le lot y est recherché et
+    complété d'un bloc (PersistentResultCache.results_many).
+
     Args:
-        input_text (str): Le texte à analyser
-        
+        input_texts (Iterable[str]): Les textes à analyser
+
     Returns:
-        Optional[int]: Le nombre extrait ou None si aucun nombre trouvé
+        List[UnderstandingResult]: Les résultats de text_to_result, dans l'ordre des entrées
     """
-    normalized_input = normalize_text(input_text)
-    if not normalized_input:
-        return None  # Changé de 0 à None
-    
-    # 1. Recherche de pourcentages
-    percentage_value = find_percentages(normalized_input)
-    if percentage_value is not None:
-        return percentage_value
-    
-    # 2. Recherche de fractions génériques
-    fraction_value = find_fractions_generic(normalized_input)
-    if fraction_value is not None:
-        return fraction_value
-    
-    # 3. Recherche de nombres explicites en chiffres
-    explicit_number = find_explicit_numbers(normalized_input)
-    if explicit_number is not None:
-        return explicit_number
-    
-    # 4. Recherche d'expressions spéciales
-    special_expression = find_special_expressions(normalized_input)
-    if special_expression is not None:
-        return special_expression
-    
-    # 5. Parsing des nombres écrits en lettres
-    written_number = parse_french_numbers(normalized_input)
-    if written_number is not None:
-        return written_number
-    
-    return None  # Changé de 0 à None
+    persistent_cache = _persistent_cache
+    if persistent_cache is not None:
+        return persistent_cache.results_many(input_texts)
+
+    results: List[UnderstandingResult] = []
+    result_by_input: Dict[str, UnderstandingResult] = {}
+    result_by_normalized: Dict[Tuple[str, bool], UnderstandingResult] = {}
+
+    for input_text in input_texts:
+        result = result_by_input.get(input_text)
+        if result is None:
+            folded_text = input_text.lower().translate(_ACCENT_TABLE)
+            if not _may_contain_number_folded(folded_text):
+                result = _NO_NUMBER_RESULT
+        if result is None:
+            tokens = list(_iter_tokens(input_text, folded_text))
+            normalized = NormalizedText.from_tokens(input_text, tokens)
+            normalized_key = (normalized.text, _negative_sign(input_text, tokens))
+            result = result_by_normalized.get(normalized_key)
+            if result is None:
+                result = _understand_normalized(normalized, normalized_key[1])
+                result_by_normalized[normalized_key] = result
+            result_by_input[input_text] = result
+        results.append(result)
 
+    return results
 
-def find_explicit_numbers(text: str) -> Optional[int]:
+
+def text_to_understanding_parallel(input_texts: Iterable[str], max_workers: Optional[int] = None,
+                                   chunk_size: int = 1000) -> List[str]:
     """
-    Trouve les nombres écrits en chiffres dans le texte.
-    Exclut les fractions pour éviter les faux positifs.
-    
+    Version multi-processus de text_to_understanding_many.
+
+    Les textes sont découpés en paquets de chunk_size, répartis sur un
+    ProcessPoolExecutor ; chaque processus initialise une seule fois l'état compilé
+    (expressions, tables) puis traite ses paquets avec déduplication. Le profil régional
+    et le cache persistant du processus appelant sont repris par chaque processus.
+
     Args:
-        text (str): Le texte à analyser
-        
+        input_texts (Iterable[str]): Les textes à analyser
+        max_workers (Optional[int]): Nombre de processus (par défaut : nombre de cœurs)
+        chunk_size (int): Nombre de textes par paquet envoyé à un processus
+
     Returns:
-        Optional[int]: Le plus grand nombre trouvé ou None
+        List[str]: Les résultats de text_to_understanding, dans l'ordre des entrées
+
+    Raises:
+        ValueError: Si chunk_size n'est pas strictement positif
     """
-    # Suppression des fractions pour éviter de prendre juste le dénominateur
-    text_without_fractions = re.sub(r'\d+\s*/\s*\d+', '', text)
-    
-    # Recherche de tous les nombres (entiers ou décimaux)
-    number_matches = re.findall(r'\b(\d+(?:[.,]\d+)?)\b', text_without_fractions)
-    if number_matches:
-        numeric_values = []
-        for number_string in number_matches:
-            try:
-                # Conversion en entier (gestion des décimales avec virgule)
-                numeric_values.append(int(float(number_string.replace(',', '.'))))
-            except ValueError:
-                continue
-        
-        if numeric_values:
-            return max(numeric_values)  # Retour du plus grand nombre trouvé
-    
-    return None
+    if chunk_size <= 0:
+        raise ValueError("chunk_size doit être strictement positif")
+
+    # Import différé : concurrent.futures.process (et multiprocessing) pèse sur le démarrage à froid
+    from concurrent.futures import ProcessPoolExecutor
+
+    results: List[str] = []
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_initialize_worker,
+                             initargs=_worker_initargs()) as executor:
+        for chunk_results in executor.map(text_to_understanding_many, _chunked(input_texts, chunk_size)):
+            results.extend(chunk_results)
+    return results
 
 
-def find_percentages(text: str) -> Optional[int]:
+def text_to_understanding_threaded(input_texts: Iterable[str], max_workers: Optional[int] = None,
+                                   chunk_size: int = 1000) -> List[str]:
     """
-    Trouve les pourcentages dans le texte avec gestion des erreurs courantes.
-    
-    Formats supportés :
-    - Avec symbole % : "50%", "75 %"
-    - Avec mot : "cinquante pourcent", "vingt pour cent"
-    
+    Version multi-fils de text_to_understanding_many, dans le processus courant.
+
+    Les textes sont découpés en paquets de chunk_size, répartis sur un
+    ThreadPoolExecutor. Le module n'a pas d'état mutable partagé hors des caches
+    synchronisés (cache de résultats, instrumentation, mémoire du correcteur) : les
+    résultats sont identiques à ceux d'un seul fil. Le gain de débit suppose un
+    interpréteur sans GIL (CPython free-threaded) ; avec le GIL, préférer
+    text_to_understanding_parallel.
+
     Args:
-        text (str): Le texte à analyser
-        
+        input_texts (Iterable[str]): Les textes à analyser
+        max_workers (Optional[int]): Nombre de fils (par défaut : nombre de cœurs)
+        chunk_size (int): Nombre de textes par paquet confié à un fil
+
     Returns:
-        Optional[int]: La valeur du pourcentage ou None
+        List[str]: Les résultats de text_to_understanding, dans l'ordre des entrées
+
+    Raises:
+        ValueError: Si chunk_size n'est pas strictement positif
     """
-    # Recherche avec symbole %
-    percent_symbol_match = re.search(r'(\d+(?:[.,]\d+)?)\s*%', text)
-    if percent_symbol_match:
-        return int(float(percent_symbol_match.group(1).replace(',', '.')))
-    
-    # Recherche avec le mot "pourcent" ou "pour cent"
-    if re.search(r'\b(?:pour\s*cent|pourcent)\b', text):
-        # Capture du nombre qui précède le mot "pourcent"
-        percent_word_match = re.search(r'([\w\s]+?)\s+(?:pour\s*cent|pourcent)', text)
-        if percent_word_match:
-            number_text = percent_word_match.group(1).strip()
-            # Nettoyage des articles en fin de chaîne
-            number_text = re.sub(r'\b(?:est|de|le|la|les|du|des)\s*$', '', number_text).strip()
-            parsed_number = parse_french_numbers(number_text)
-            if parsed_number is not None:
-                return parsed_number
-    
-    return None
+    if chunk_size <= 0:
+        raise ValueError("chunk_size doit être strictement positif")
 
+    from concurrent.futures import ThreadPoolExecutor
 
-def find_fractions_generic(text: str) -> Optional[int]:
+    results: List[str] = []
+    with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        for chunk_results in executor.map(text_to_understanding_many, _chunked(input_texts, chunk_size)):
+            results.extend(chunk_results)
+    return results
+
+
+def _worker_initargs() -> Tuple[str, Optional[Tuple[str, Optional[int]]]]:
     """
-    Trouve les fractions dans le texte et les convertit en pourcentages.
-    
-    Formats supportés :
-    - Fractions numériques : "3/4", "1 / 2"
-    - Fractions avec "sur" : "3 sur 4", "trois sur quatre"
-    - Fractions ordinales : "trois quarts", "un demi", "deux tiers"
-    - Groupes : "une douzaine", "trois vingtaines"
-    
-    Args:
-        text (str): Le texte à analyser
-        
-    Returns:
-        Optional[int]: Le pourcentage équivalent de la fraction ou None
+    Arguments de _initialize_worker : profil régional et cache persistant du processus courant.
     """
-    
-    # 1. Fractions numériques X/Y (priorité élevée)
-    numeric_fraction_match = re.search(r'(\d+)\s*/\s*(\d+)', text)
-    if numeric_fraction_match:
-        numerator, denominator = int(numeric_fraction_match.group(1)), int(numeric_fraction_match.group(2))
-        if denominator != 0:
-            result = (numerator / denominator) * 100
-            return int(round(result))
-    
-    # 2. Fractions "X sur Y" avec nombres
-    numeric_sur_match = re.search(r'(\d+)\s+sur\s+(\d+)', text)
-    if numeric_sur_match:
-        numerator, denominator = int(numeric_sur_match.group(1)), int(numeric_sur_match.group(2))
-        if denominator != 0:
-            result = (numerator / denominator) * 100
-            return int(round(result))
-    
-    # 3. Fractions "X sur Y" avec mots
-    word_sur_match = re.search(r'(\w+(?:\s+\w+)*?)\s+sur\s+(\w+(?:\s+\w+)*)', text)
-    if word_sur_match:
-        numerator_text = word_sur_match.group(1).strip()
-        denominator_text = word_sur_match.group(2).strip()
-        numerator_value = parse_french_numbers(numerator_text)
-        denominator_value = parse_french_numbers(denominator_text)
-        if numerator_value is not None and denominator_value is not None and denominator_value > 0:
-            result = (numerator_value / denominator_value) * 100
-            return int(round(result))
-    
-    # 4. Dénominateurs ordinaux français (quarts, tiers, etc.)
-    ordinal_fraction_patterns = {
-        r'\b(?:demie?s?|moitie|moytie|moytee|demiess?|moitye)\b': 2,
-        r'\bquarts?|quardts?|quartes?\b': 4,
-        r'\btiers|tierss|tierrs\b': 3,
-        r'\bquatriemes?|quatriemes|quatriemess?|quatrimes\b': 4,
-        r'\bcinquiemes?|cinqiemes?|cinqièmes?|cinquiemess?\b': 5,
-        r'\bsixiemes?|sixièmes?|sixiemess?|siximes\b': 6,
-        r'\bseptiemes?|septièmes?|septiemess?|septimes\b': 7,
-        r'\bhuitiemes?|huitemes?|huitiemess?|huitimes\b': 8,
-        r'\bneuviemes?|neuviemes?|neuviémes?|neuviemess?|nevimes\b': 9,
-        r'\bdixiemes?|dixièmes?|dixiemess?|diximes\b': 10,
-        r'\bonziemes?|onzièmes?|onziemess?|onzimes\b': 11,
-        r'\bdouziemes?|douzièmes?|douziemess?|douzimes\b': 12,
-        r'\btreiziemes?|treiziémes?|treziemess?|trezimes\b': 13,
-        r'\bquatorziemes?|quatorziémes?|quatorziemess?|quatorzimes\b': 14,
-        r'\bquinziemes?|quinziémes?|quinziemess?|quinzimes\b': 15,
-        r'\bseiziemes?|seiziémes?|seiziemess?|seizimes\b': 16,
-        r'\bdixseptiemes?|dix-septiemes?|dixseptiemess?|dixseptimes\b': 17,
-        r'\bdixhuitiemes?|dix-huitiemes?|dixhuitiemess?|dixhuitimes\b': 18,
-        r'\bdixneuviemes?|dix-neuviemes?|dixneuviemess?|dixnevimes\b': 19,
-        r'\bvingtiemes?|vingtiémes?|vingtiemess?|vingtimes?|vingt(i|y)emes?\b': 20,
-        r'\btrentiemes?|trentiémes?|trentiemess?|trentimes\b': 30,
-        r'\bquarantiemes?|quarantiémes?|quarantiemess?|quarantimes\b': 40,
-        r'\bcinquantiemes?|cinquantiémes?|cinquantiemess?|cinquantimes\b': 50,
-        r'\bsoixantiemes?|soixantiémes?|soixantiemess?|soixantimes?\b': 60,
-        r'\bsoixante[-\s]?dixiemes?|soixante[-\s]?dixiémes?|soixante[-\s]?dixiemess?|soixante[-\s]?diximes?\b': 70,
-        r'\bquatre[-\s]?vingtiemes?|quatre[-\s]?vingtiémes?|quatre[-\s]?vingtiemess?|quatre[-\s]?vingtimes?\b': 80,
-        r'\bquatre[-\s]?vingt[-\s]?dixiemes?|quatre[-\s]?vingt[-\s]?dixiémes?|quatre[-\s]?vingt[-\s]?dixiemess?|quatre[-\s]?vingt[-\s]?diximes?\b': 90,
-        r'\bcente?siemes?|centiemes?|centiemess?|centimes\b': 100,
-        r'\bmilliemes?|milliémes?|milliemess?|millimes\b': 1000,
-    }
-    
-    # Recherche des fractions ordinales
-    for ordinal_pattern, denominator_value in ordinal_fraction_patterns.items():
-        # Construction du pattern pour capturer le numérateur
-        numerator_pattern = rf'(\w+(?:\s+\w+)*?)\s+{ordinal_pattern[2:-2]}'
-        ordinal_match = re.search(numerator_pattern, text)
-        if ordinal_match:
-            numerator_text = ordinal_match.group(1).strip()
-            
-            # Filtrage des articles et mots non numériques
-            numerator_text = re.sub(r'\b(?:le|la|les|des?|du)\b', '', numerator_text).strip()
-            
-            numerator_value = parse_french_numbers(numerator_text)
-            if numerator_value is not None and denominator_value > 0:
-                result = (numerator_value / denominator_value) * 100
-                return int(round(result))
-    
-    # 5. Cas spéciaux et groupes
-    special_fraction_patterns = [
-        (r'\b(?:un\s+)?(?:demi|moitie)\b', 50),
-        (r'\b(?:la\s+)?moitie\b', 50),
-        (r'\b(?:dizaine|douzaine|vingtaine|trentaine|quarantaine|cinquantaine|soixantaine|septantaine|quatre-vingtaine|octantaine|nonantaine|centaine)s?\b', lambda: handle_grouped_numbers(text)),
-    ]
-    
-    for pattern, value_or_function in special_fraction_patterns:
-        if re.search(pattern, text):
-            if callable(value_or_function):
-                result = value_or_function()
-                if result is not None:
-                    return result
-            else:
-                return value_or_function
-    
-    return None
+    persistent_cache = _persistent_cache
+    if persistent_cache is None:
+        return _ENGINE.locale, None
+    # Les processus relisent la base : les entrées en attente doivent y être
+    persistent_cache.flush()
+    return _ENGINE.locale, (persistent_cache.path, persistent_cache.max_entries)
 
 
-def handle_grouped_numbers(text: str) -> Optional[int]:
+def _initialize_worker(locale: str, persistent_settings: Optional[Tuple[str, Optional[int]]] = None) -> None:
     """
-    Gère les expressions avec des groupes numériques.
-    
-    Exemples :
-    - "3 douzaines" -> 36
-    - "une vingtaine" -> 20
-    - "dizaine" -> 10
-    
+    Initialiseur des processus de calcul (text_to_understanding_parallel, serveur HTTP) :
+    profil régional et cache persistant (fichier, max_entries) du parent (voir
+    _worker_initargs), puis warm_up.
+    """
+    set_locale_profile(locale)
+    if persistent_settings is None:
+        disable_persistent_cache()
+    elif _persistent_cache is None or _persistent_cache.path != persistent_settings[0]:
+        # Démarrage par spawn : le cache du parent n'a pas été hérité
+        enable_persistent_cache(*persistent_settings)
+    warm_up()
+
+
+def _chunked(input_texts: Iterable[str], chunk_size: int) -> Iterator[List[str]]:
+    """
+    Découpe un itérable de textes en listes de chunk_size éléments.
+
     Args:
-        text (str): Le texte contenant l'expression de groupe
-        
+        input_texts (Iterable[str]): Les textes
+        chunk_size (int): Taille des paquets
+
     Returns:
-        Optional[int]: La valeur numérique du groupe ou None
+        Iterator[List[str]]: Les paquets, dans l'ordre
     """
-    # Dictionnaire des multiplicateurs de groupe
-    group_multipliers = {
-        'dizaine': 10,
-        'douzaine': 12,
-        'vingtaine': 20,
-        'trentaine': 30,
-        'quarantaine': 40,
-        'cinquantaine': 50,
-        'soixantaine': 60,
-        'septantaine': 70,
-        'quatre-vingtaine': 80,
-        'octantaine': 80,
-        'nonantaine': 90,
-        'centaine': 100,
-    }
+    text_iterator = iter(input_texts)
+    chunk = list(islice(text_iterator, chunk_size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(text_iterator, chunk_size))
 
-    # Pattern pour capturer multiplicateur + groupe
-    group_pattern = r'(\w+(?:\s+\w+)*?)?\s*(%s)s?' % '|'.join(group_multipliers.keys())
-    group_match = re.search(group_pattern, text)
-    
-    if group_match:
-        multiplier_text = group_match.group(1)
-        group_word = group_match.group(2)
-        
-        # Nettoyage du multiplicateur (suppression des articles)
-        if multiplier_text:
-            multiplier_text = multiplier_text.strip()
-            multiplier_text = re.sub(r'\b(?:une?|des?|du|les?|la|le)\b', '', multiplier_text).strip()
-        
-        # Valeur par défaut du multiplicateur
-        multiplier_value = 1
-        if multiplier_text:
-            parsed_multiplier = parse_french_numbers(multiplier_text)
-            if parsed_multiplier is not None:
-                multiplier_value = parsed_multiplier
-        
-        # Calcul de la valeur finale
-        base_value = group_multipliers.get(group_word)
-        if base_value:
-            return multiplier_value * base_value
 
-    return None
+# Phrases couvrant chaque étape, pour initialiser un processus avant le premier paquet
+_WARM_UP_PHRASES = (
+    "trois quarts", "50%", "3/4", "deux sur trois", "moins vingt-deux", "une douzaine",
+    "cinquante pour cent", "presque tout", "aucun", "quatre-vingt-dix-neuf", "nous sommes mardi",
+)
 
 
-def find_special_expressions(text: str) -> Optional[int]:
+def warm_up() -> None:
     """
-    Trouve les expressions spéciales et les convertit en valeurs numériques.
-    
-    Expressions supportées :
-    - Expressions de zéro : "aucun", "rien", "personne", "nul", "nulle", "zero"
-    - Expressions de totalité : "tout", "tous", "totalité"
-    - Expressions approximatives : "presque tout", "quasi rien"
-    
+    Initialise l'état compilé du processus (expressions, tables) avant le premier appel.
+
+    Utilisé comme initialiseur des processus de text_to_understanding_parallel et
+    du service HTTP. Les phrases sont analysées sans passer par les caches de
+    résultats (un résultat déjà en cache n'initialiserait rien, et les phrases
+    d'exemple n'ont pas leur place dans le cache persistant).
+    """
+    for phrase in _WARM_UP_PHRASES:
+        _compute_understanding(phrase)
+
+
+# Bornes des valeurs représentables dans les tableaux int64 de text_to_result_array
+_INT64_MIN, _INT64_MAX = -2 ** 63, 2 ** 63 - 1
+
+
+class ResultArrays(NamedTuple):
+    """
+    Résultats de text_to_result_array, un élément par texte d'entrée.
+
+    Attributes:
+        values (numpy.ma.MaskedArray): Valeurs int64, masquées sans nombre (ou hors de l'intervalle int64)
+        is_percent (numpy.ndarray): Booléens : la valeur est un pourcentage
+        found (numpy.ndarray): Booléens : un nombre ou une expression absolue a été trouvé
+    """
+    values: Any
+    is_percent: Any
+    found: Any
+
+
+def _import_optional(module_name: str, feature: str) -> Any:
+    """
+    Importe une dépendance optionnelle au premier usage (NumPy, pandas).
+
+    Raises:
+        ImportError: Si le module n'est pas installé, avec le nom de la fonctionnalité concernée
+    """
+    try:
+        return importlib.import_module(module_name)
+    except ImportError as error:
+        raise ImportError(f"{feature} nécessite le paquet optionnel {module_name!r}") from error
+
+
+def _unique_result_arrays(numpy: Any, unique_texts: List[Any]) -> Tuple[Any, Any, Any, Any]:
+    """
+    Analyse une seule fois chaque valeur distincte d'une colonne.
+
+    Les valeurs qui ne sont pas des chaînes (None, NaN...) ne contiennent aucun nombre.
+    Une case supplémentaire "aucun nombre" termine chaque tableau : l'indice -1 (valeur
+    manquante de pandas.factorize) y renvoie.
+
     Args:
-        text (str): Le texte à analyser
-        
+        numpy (Any): Le module NumPy
+        unique_texts (List[Any]): Les valeurs distinctes
+
     Returns:
-        Optional[int]: La valeur numérique de l'expression ou None
+        Tuple[Any, Any, Any, Any]: (valeurs int64, masque, pourcentages, trouvés), de longueur
+            len(unique_texts) + 1
     """
-    
-    # Expressions approximatives spéciales
-    if re.search(r'\bpresque\s+(?:rien|aucun)\b', text):
-        return 5  # "presque rien" = petite quantité
-    
-    # Expressions de zéro absolu
-    # "zero" est traité séparément sans restriction sur "de", "du", "des"
-    if re.search(r'\bzero\b', text):
-        return 0
-    
-    # Autres expressions de zéro avec restriction sur "de", "du", "des"
-    zero_expression_patterns = [
-        r'\b(?:aucun|rien|personne|nul|nulle)\b(?!\s+(?:de|du|des))',
-        r'\bpas\s+(?:un|une|de)\b'
-    ]
-    
-    for zero_pattern in zero_expression_patterns:
-        if re.search(zero_pattern, text):
-            return 0
-    
-    # Expressions de totalité approximative
-    if re.search(r'\b(?:presque|quasi|quasiment)\s+(?:tout|tous|toutes|totalite)\b', text):
-        return 95  # "presque tout" = 95% (pas 100%)
-    
-    # Expressions de totalité absolue
-    total_expression_patterns = [
-        r'\b(?:tout|tous|toutes|totalite|entierement|completement|integralement)\b',
-        r'\b(?:cent\s+pour\s+cent|100\s*%)\b'
-    ]
-    
-    for total_pattern in total_expression_patterns:
-        if re.search(total_pattern, text) and not re.search(r'\b(?:presque|quasi|quasiment)\b', text):
-            return 100
-    
-    return None
+    text_positions = [position for position, text in enumerate(unique_texts) if isinstance(text, str)]
+    results = text_to_result_many(unique_texts[position] for position in text_positions)
 
+    size = len(unique_texts) + 1
+    values = numpy.zeros(size, dtype=numpy.int64)
+    mask = numpy.ones(size, dtype=bool)
+    is_percent = numpy.zeros(size, dtype=bool)
+    found = numpy.zeros(size, dtype=bool)
+    for position, result in zip(text_positions, results):
+        if result.no_number:
+            continue
+        found[position] = True
+        is_percent[position] = result.is_percent
+        if _INT64_MIN <= result.value <= _INT64_MAX:
+            values[position] = result.value
+            mask[position] = False
+    return values, mask, is_percent, found
 
-def parse_french_numbers(text: str) -> Optional[int]:
+
+def text_to_result_array(input_texts: Iterable[Any]) -> ResultArrays:
     """
-    Parse généraliste des nombres français écrits en lettres.
-    
-    Supporte :
-    - Nombres simples : "vingt-trois", "quarante-cinq"
-    - Nombres complexes : "deux cent trente-quatre"
-    - Variantes belges/suisses : "septante", "nonante"
-    - Fautes d'orthographe courantes
-    - Approximations : "environ cinquante", "plus de cent"
-    
+    Version vectorisée de text_to_result pour une colonne de textes (nécessite NumPy).
+
+    La colonne est factorisée : chaque valeur distincte est analysée une seule fois
+    (avec la déduplication de text_to_result_many), puis les résultats sont diffusés
+    sur toutes les lignes par indexation des tableaux.
+
     Args:
-        text (str): Le texte contenant le nombre en lettres
-        
+        input_texts (Iterable[Any]): Les textes (liste, tableau NumPy...) ; les valeurs
+            qui ne sont pas des chaînes sont traitées comme sans nombre
+
     Returns:
-        Optional[int]: Le nombre parsé ou None si non trouvé
+        ResultArrays: Valeurs (int64 masqué), pourcentages et nombres trouvés, dans l'ordre des entrées
+
+    Raises:
+        ImportError: Si NumPy n'est pas installé
     """
-    
-    if not text:
-        return None
-    
-    # Dictionnaire des mots numériques de base
-    number_word_dictionary = get_french_number_words()
-    
-    # Extraction des tokens potentiellement numériques
-    numeric_tokens = extract_numeric_tokens(text)
-    
-    if not numeric_tokens:
-        return None
-    
-    # Parsing de la séquence de tokens numériques
-    return parse_numeric_sequence(numeric_tokens, number_word_dictionary)
+    numpy = _import_optional('numpy', 'text_to_result_array')
+    positions: Dict[Any, int] = {}
+    codes = numpy.fromiter((positions.setdefault(text, len(positions)) for text in input_texts),
+                           dtype=numpy.intp)
+    values, mask, is_percent, found = _unique_result_arrays(numpy, list(positions))
+    return ResultArrays(numpy.ma.MaskedArray(values[codes], mask=mask[codes]), is_percent[codes], found[codes])
 
 
-def get_french_number_words() -> Dict[str, int]:
+def text_to_result_frame(input_texts: Any) -> Any:
     """
-    Dictionnaire complet des mots numériques français avec variantes et fautes courantes.
-    
-    Inclut :
-    - Formes standard françaises
-    - Variantes belges/suisses (septante, octante, nonante)
-    - Fautes d'orthographe fréquentes
-    - Formes plurielles
-    
+    Version vectorisée de text_to_result pour une colonne pandas (nécessite pandas).
+
+    La colonne est factorisée avec pandas.factorize : chaque valeur distincte n'est
+    analysée qu'une fois, les valeurs manquantes ne le sont pas du tout.
+
+    Args:
+        input_texts (Any): Une pandas.Series de textes (ou un itérable, converti en Series)
+
     Returns:
-        Dict[str, int]: Dictionnaire mot -> valeur numérique
+        pandas.DataFrame: Colonnes value (Int64, <NA> sans nombre), is_percent (bool) et
+            found (bool), avec l'index de la série
+
+    Raises:
+        ImportError: Si pandas n'est pas installé
     """
-    return {
-        # Unités de base (0-9)
-        'zero': 0, 'zéro': 0, 'zeero': 0,
-        'un': 1, 'une': 1, 'uhn': 1,
-        'deux': 2, 'deu': 2,
-        'trois': 3, 'troi': 3, 'trois': 3, "troua": 3,
-        'quatre': 4, 'quatr': 4, 'catre': 4, "quatres": 4,
-        'cinq': 5, 'sinq': 5, 'cing': 5, "cinqs": 5,
-        'six': 6, 'sis': 6,
-        'sept': 7, 'set': 7, "septs": 7,
-        'huit': 8, 'uit': 8, "huits": 8,
-        'neuf': 9, 'noeuf': 9, "neufs": 9,
-
-        # Nombres 10-19
-        'dix': 10, 'dis': 10,
-        'onze': 11, 'onzes': 11, "onz": 11,
-        'douze': 12, 'douzes': 12, "douz": 12,
-        'treize': 13, 'treizes': 13, "treiz": 13,
-        'quatorze': 14, 'quatorz': 14, "quatorzes": 14,
-        'quinze': 15, 'quinz': 15, "quinzes": 15,
-        'seize': 16, 'seiz': 16, "seizes": 16,
-
-        # Dizaines (20, 30, 40, 50, 60)
-        'vingt': 20, 'vint': 20, "vingts": 20,
-        'trente': 30, 'trent': 30, "trentes": 30,
-        'quarante': 40, 'quarente': 40, "quarantes": 40,
-        'cinquante': 50, 'cinqante': 50, 'sinquante': 50, "cinquantes": 50, "cinquente": 50,
-        'soixante': 60, 'soissante': 60, "soixantes": 60,
-
-        # Variantes belges/suisses simplifiées (70, 80, 90)
-        'septante': 70, 'septente': 70, "septantes": 70, "septentes": 70,
-        'huitante': 80, 'uitante': 80, "huitantes": 80,
-        'octante': 80, "octantes": 80,
-        'nonante': 90, 'nonente': 90, "nonantes": 90,
-
-        # Centaines et milliers
-        'cent': 100, 'cents': 100, 'centaine': 100, 'centaines': 100,
-        'sant': 100,  # Faute courante
-        'mille': 1000, 'milles': 1000, 'millier': 1000, 'milliers': 1000,
-
-        # Millions et plus
-        'million': 1000000, 'millions': 1000000,
-        'milliard': 1000000000, 'milliards': 1000000000,
-        'billion': 1000000000000, 'billions': 1000000000000
-    }
+    pandas = _import_optional('pandas', 'text_to_result_frame')
+    numpy = _import_optional('numpy', 'text_to_result_frame')
+    series = input_texts if isinstance(input_texts, pandas.Series) else pandas.Series(list(input_texts),
+                                                                                       dtype=object)
+    codes, unique_texts = pandas.factorize(series)
+    values, mask, is_percent, found = _unique_result_arrays(numpy, list(unique_texts))
+    return pandas.DataFrame({
+        'value': pandas.arrays.IntegerArray(values[codes], mask[codes]),
+        'is_percent': is_percent[codes],
+        'found': found[codes],
+    }, index=series.index)
+
+
+# Indicateurs de pourcentage de text_to_understanding (mots du texte normalisé) ;
+# "%", "pour cent" et " / " sont reconnus sur les tokens
+_PERCENTAGE_INDICATOR_WORDS = frozenset({
+    "pourcent", "prcent", "prcnt", "demi", "moitie", "tiers", "tier", "quart", "quarts",
+    "totalite", "quasi", "tout", "tous", "aucun", "rien", "presque", "sur",
+})
 
+# Indicateurs absolus, sans nombre : "tout" -> 100%, "aucun" -> 0%
+_TOTALITY_INDICATOR_WORDS = frozenset({"totalite", "tout", "tous"})
+_NOTHING_INDICATOR_WORDS = frozenset({"aucun", "rien"})
 
-def extract_numeric_tokens(text: str) -> List[str]:
+
+def _detect_negative(input_text: str) -> bool:
     """
-    Extrait les tokens (mots) potentiellement numériques d'un texte.
-    
-    Inclut :
-    - Mots numériques directs (un, deux, trois...)
-    - Connecteurs numériques (et, de, des, du)
-    - Mots approximatifs (environ, plus, moins, presque)
-    - Nombres avec tirets
-    
+    Détecte le signe négatif dans le texte original (avant normalisation).
+
     Args:
-        text (str): Le texte à analyser
-        
+        input_text (str): Le texte d'entrée brut
+
     Returns:
-        List[str]: Liste des tokens numériques extraits
+        bool: True si le nombre exprimé est négatif ("moins quatre", "-5")
     """
-    
-    number_word_dictionary = get_french_number_words()
-    text_tokens = text.split()
-    extracted_tokens = []
-    
-    # Mots de liaison numériques
-    numeric_connectors = {'et', 'de', 'des', 'du'}
-    # Mots d'approximation
-    approximation_words = {'environ', 'autour', 'plus', 'moins de', 'presque'}
+    return _negative_sign(input_text, list(_iter_tokens(input_text)))
+
+
+def _negative_sign(input_text: str, tokens: List['Token']) -> bool:
+    """
+    Détecte le signe négatif sur les tokens du texte original (voir _detect_negative).
+
+    Args:
+        input_text (str): Le texte d'entrée brut
+        tokens (List[Token]): Ses tokens (tokenize)
+
+    Returns:
+        bool: True si le nombre exprimé est négatif
+    """
+    token_count = len(tokens)
+    for position, token in enumerate(tokens):
+        following = tokens[position + 1] if position + 1 < token_count else None
+
+        # Cas 2 : "-" ou "_" non collé à un mot, suivi (espaces permis) d'un chiffre
+        if token.kind == TOKEN_SIGN and token.text == '-':
+            if following is not None and following.text[0].isdecimal():
+                return True
+
+        elif token.text.endswith('moins'):
+            original_word = input_text[token.start:token.end].lower()
+            # Cas 1 : "moins" sans "de"
+            if (original_word == 'moins' and (token.start == 0 or not _is_word_character(input_text[token.start - 1]))
+                    and not (token.end < len(input_text) and _is_word_character(input_text[token.end]))
+                    and not (following is not None and following.spaced
+                             and input_text[following.start:following.start + 2].lower() == 'de')):
+                return True
+            #Mais si il y a moins "moins deu" alors on remet en positif
+            if (original_word.endswith('moins') and input_text.startswith(' ', token.end)
+                    and input_text[token.end + 1:token.end + 4].lower() == 'deu'):
+                return True
+
+    return False
+
+
+# Étapes de détection rapportées par UnderstandingResult.stage
+DETECTION_STAGES = (
+    'numeric_fraction',     # "3/4" dans le texte
+    'word_fraction',        # mots voisins du premier "sur" ("trois sur quatre")
+    'percentages',          # cascade de text_to_number : find_percentages
+    'fractions',            # find_fractions_generic
+    'explicit_numbers',     # find_explicit_numbers
+    'special_expressions',  # find_special_expressions
+    'written_numbers',      # parse_french_numbers
+    'absolute',             # "tout", "aucun" sans nombre -> 100% / 0%
+)
+
+
+class UnderstandingResult(NamedTuple):
+    """
+    Résultat structuré de text_to_result.
+
+    Attributes:
+        value (Optional[int]): La valeur signée (pourcentage arrondi pour une fraction), None sans nombre
+        is_percent (bool): La valeur est un pourcentage ("75%")
+        sign (int): -1 si un signe négatif a été appliqué à la valeur, sinon 1
+        stage (Optional[str]): L'étape qui a produit la valeur (voir DETECTION_STAGES)
+        fraction (Optional[Fraction]): La fraction exacte signée pour les étapes
+            'numeric_fraction' et 'word_fraction', sinon None
+        no_number (bool): Aucun nombre détecté ("AUCUN CHIFFRE")
+    """
+    value: Optional[int]
+    is_percent: bool
+    sign: int
+    stage: Optional[str]
+    fraction: Optional['Fraction']
+    no_number: bool
+
+
+_NO_NUMBER_RESULT = UnderstandingResult(None, False, 1, None, None, True)
+
+
+def format_understanding(result: UnderstandingResult) -> str:
+    """
+    Met en forme un résultat comme text_to_understanding.
+
+    Args:
+        result (UnderstandingResult): Le résultat structuré
+
+    Returns:
+        str: "75%", "-4" ou "AUCUN CHIFFRE"
+    """
+    if result.no_number:
+        return "AUCUN CHIFFRE"
+    return f"{result.value}%" if result.is_percent else str(result.value)
+
+
+def _fraction_result(numerator: int, denominator: int, sign: int, stage: str) -> UnderstandingResult:
+    """
+    Résultat en pourcentage d'une fraction (arrondi comme round(), symétrique en signe).
+    """
+    # Import différé : fractions charge decimal, coûteux au démarrage à froid
+    from fractions import Fraction
+
+    return UnderstandingResult(sign * round(numerator / denominator * 100), True, sign, stage,
+                               sign * Fraction(numerator, denominator), False)
+
+
+def _understand_normalized(normalized: 'NormalizedText', is_negative: bool) -> UnderstandingResult:
+    """
+    Cœur de text_to_result, à partir d'un texte déjà normalisé.
+
+    Args:
+        normalized (NormalizedText): Le texte normalisé
+        is_negative (bool): Signe détecté sur le texte original
+
+    Returns:
+        UnderstandingResult: Le résultat structuré
+    """
+    stream = normalized.token_stream
+    sign = -1 if is_negative else 1
+
+    # Détection des fractions numériques (ex: 3/4)
+    fraction_position = next(_numeric_fractions(stream), None)
+    if fraction_position is not None:
+        numerator, denominator = _numeric_fraction_terms(stream, fraction_position)
+        if numerator is not None and denominator:
+            return _fraction_result(numerator, denominator, sign, 'numeric_fraction')
+
+    # Détection des fractions textuelles (ex: trois sur quatre) : mots voisins du premier "sur"
+    sur_index = _find_token(normalized.tokens, 'sur', 1, len(normalized.tokens) - 1)
+    if sur_index is not None:
+        numerator_text, denominator_text = _word_fraction_terms(normalized.tokens, sur_index)
+
+        numerator_value = text_to_number(NormalizedText(numerator_text))
+        denominator_value = text_to_number(NormalizedText(denominator_text))
+
+        if numerator_value is not None and denominator_value not in (None, 0):
+            return _fraction_result(numerator_value, denominator_value, sign, 'word_fraction')
+
+    # Extraction du nombre principal
+    extracted_number, stage = _staged_number(normalized)
+
+    # Retour du nombre s'il est trouvé : pourcentage pour un ordinal (ex: cinquième -> 5%) ou un indicateur
+    if extracted_number is not None:
+        is_percent = any('ieme' in token.text for token in stream) or _has_percentage_indicator(normalized)
+        return UnderstandingResult(sign * extracted_number, is_percent, sign, stage, None, False)
+
+    # Cas spéciaux pour les expressions absolues
+    if not _TOTALITY_INDICATOR_WORDS.isdisjoint(normalized.isolated_words):
+        return UnderstandingResult(100, True, 1, 'absolute', None, False)
+    if not _NOTHING_INDICATOR_WORDS.isdisjoint(normalized.isolated_words):
+        return UnderstandingResult(0, True, 1, 'absolute', None, False)
+
+    # Aucun chiffre détecté
+    return _NO_NUMBER_RESULT
+
+
+def _word_fraction_terms(tokens: List[str], sur_index: int) -> Tuple[str, str]:
+    """
+    Mots voisins d'un "sur" (numérateur, dénominateur) pour une fraction textuelle.
+
+    Un seul mot de chaque côté ; sans réécriture des dizaines françaises (profils autres
+    que "mixed"), une dizaine de plusieurs mots ("quatre vingt dix") compte pour un mot,
+    comme sa forme réécrite ("nonante").
+
+    Args:
+        tokens (List[str]): Les tokens du texte normalisé
+        sur_index (int): Index du "sur" (ni le premier ni le dernier token)
+
+    Returns:
+        Tuple[str, str]: Le texte du numérateur et celui du dénominateur
+    """
+    numerator_start, denominator_end = sur_index - 1, sur_index + 2
+    if not _ENGINE.simplify_french_tens:
+        for words in _FRENCH_TENS_WORDS:
+            if tuple(tokens[max(sur_index - len(words), 0):sur_index]) == words:
+                numerator_start = sur_index - len(words)
+                break
+        for words in _FRENCH_TENS_WORDS:
+            if tuple(tokens[sur_index + 1:sur_index + 1 + len(words)]) == words:
+                denominator_end = sur_index + 1 + len(words)
+                break
+    return ' '.join(tokens[numerator_start:sur_index]), ' '.join(tokens[sur_index + 1:denominator_end])
+
+
+def _has_percentage_indicator(normalized: 'NormalizedText') -> bool:
+    """
+    Indique si le texte normalisé contient un indicateur de pourcentage ("%", "pour cent", "quart", " / "...).
+
+    Args:
+        normalized (NormalizedText): Le texte normalisé
+
+    Returns:
+        bool: True si un indicateur est présent
+    """
+    isolated_words = normalized.isolated_words
+    if (not _PERCENTAGE_INDICATOR_WORDS.isdisjoint(isolated_words)
+            or not _ORDINAL_VARIANT_INDICATOR_WORDS.isdisjoint(isolated_words)):
+        return True
+    stream = normalized.token_stream
+    for position, token in enumerate(stream):
+        if token.text == '%':
+            return True
+        following = stream[position + 1] if position + 1 < len(stream) else None
+        if following is None or not following.spaced:
+            continue
+        # "pour cent", "pour cents"
+        if token.text == 'pour' and following.text in ('cent', 'cents') and _starts_word(stream, position):
+            return True
+        # " / " entre deux mots
+        if (token.text == '/' and token.spaced and position and _is_word_character(stream[position - 1].text[-1])
+                and _is_word_character(following.text[0])):
+            return True
+    return False
+
+
+
+
+class ResultCacheInfo(NamedTuple):
+    """
+    Statistiques d'un cache de résultats.
+
+    Attributes:
+        hits (int): Nombre de résultats servis depuis le cache
+        misses (int): Nombre de résultats calculés
+        evictions (int): Nombre d'entrées évincées (LRU)
+        maxsize (int): Taille maximale du cache
+        currsize (int): Nombre d'entrées actuellement en cache
+    """
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class _LRUResultCache:
+    """
+    Cache LRU borné avec compteurs de hits, misses et évictions.
+    """
+
+    __slots__ = ('maxsize', 'hits', 'misses', 'evictions', '_entries', '_lock')
+
+    def __init__(self, maxsize: int):
+        """
+        Args:
+            maxsize (int): Nombre maximal d'entrées
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: 'OrderedDict[Hashable, Any]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[Hashable], Any]) -> Any:
+        """
+        Renvoie le résultat en cache pour la clé, ou le calcule et le met en cache.
+
+        Args:
+            key (Hashable): La clé (le texte d'entrée)
+            compute (Callable[[Hashable], Any]): Fonction de calcul appelée en cas d'absence
+
+        Returns:
+            Any: Le résultat, identique à celui de compute(key)
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+
+        # Calcul hors verrou : deux appels concurrents peuvent calculer la même clé
+        result = compute(key)
+
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            self._evict()
+        return result
+
+    def resize(self, maxsize: int) -> None:
+        """
+        Change la taille maximale (les entrées les plus anciennes sont évincées).
+
+        Args:
+            maxsize (int): Nouvelle taille maximale
+        """
+        with self._lock:
+            self.maxsize = maxsize
+            self._evict()
+
+    def clear(self) -> None:
+        """
+        Vide le cache et remet les compteurs à zéro.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def info(self) -> ResultCacheInfo:
+        """
+        Returns:
+            ResultCacheInfo: Les statistiques courantes du cache
+        """
+        with self._lock:
+            return ResultCacheInfo(self.hits, self.misses, self.evictions, self.maxsize, len(self._entries))
+
+    def _evict(self) -> None:
+        # Appelée avec le verrou tenu
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+
+# Caches de résultats (désactivés par défaut, voir enable_result_cache)
+_understanding_cache: Optional[_LRUResultCache] = None
+_number_cache: Optional[_LRUResultCache] = None
+
+
+def enable_result_cache(maxsize: int = 10000) -> None:
+    """
+    Active (ou redimensionne) le cache LRU de text_to_understanding et text_to_number.
+
+    text_to_understanding et text_to_result partagent le même cache (résultats structurés).
+
+    Les résultats en cache sont identiques aux résultats calculés ; chaque fonction
+    a son propre cache de maxsize entrées, indexé par le texte d'entrée brut.
+
+    Args:
+        maxsize (int): Nombre maximal d'entrées par cache
+
+    Raises:
+        ValueError: Si maxsize n'est pas strictement positif
+    """
+    global _understanding_cache, _number_cache
+    if maxsize <= 0:
+        raise ValueError("maxsize doit être strictement positif")
+    if _understanding_cache is None or _number_cache is None:
+        _understanding_cache = _LRUResultCache(maxsize)
+        _number_cache = _LRUResultCache(maxsize)
+    else:
+        resize_result_cache(maxsize)
+
+
+def disable_result_cache() -> None:
+    """
+    Désactive le cache de résultats et libère son contenu.
+    """
+    global _understanding_cache, _number_cache
+    _understanding_cache = None
+    _number_cache = None
+
+
+def clear_result_cache() -> None:
+    """
+    Vide le cache de résultats et remet ses compteurs à zéro (sans le désactiver).
+    """
+    for cache in (_understanding_cache, _number_cache):
+        if cache is not None:
+            cache.clear()
+
+
+def resize_result_cache(maxsize: int) -> None:
+    """
+    Change la taille maximale du cache de résultats (évince les entrées les plus anciennes).
+
+    Args:
+        maxsize (int): Nouvelle taille maximale par cache
+
+    Raises:
+        ValueError: Si maxsize n'est pas strictement positif
+    """
+    if maxsize <= 0:
+        raise ValueError("maxsize doit être strictement positif")
+    for cache in (_understanding_cache, _number_cache):
+        if cache is not None:
+            cache.resize(maxsize)
+
+
+def result_cache_info() -> Dict[str, Optional[ResultCacheInfo]]:
+    """
+    Statistiques du cache de résultats, par fonction.
+
+    Returns:
+        Dict[str, Optional[ResultCacheInfo]]: Statistiques pour "text_to_understanding"
+            (text_to_result compris), "text_to_number" et "persistent" (cache persistant,
+            voir PersistentResultCache.info) ; None si le cache est désactivé
+    """
+    return {
+        'text_to_understanding': _understanding_cache.info() if _understanding_cache is not None else None,
+        'text_to_number': _number_cache.info() if _number_cache is not None else None,
+        'persistent': _persistent_cache.info() if _persistent_cache is not None else None,
+    }
+
+
+# Cache persistant sur disque (désactivé par défaut, voir enable_persistent_cache)
+_persistent_cache: Optional['PersistentResultCache'] = None
+
+# Nombre d'entrées en attente au-delà duquel le cache persistant les écrit sur disque
+_PERSISTENT_FLUSH_SIZE = 1000
+
+# Nombre maximal de clés par requête SELECT ... IN (sous la limite de variables de SQLite)
+_PERSISTENT_LOOKUP_CHUNK = 500
+
+# Préfixes des deux familles de clés : texte brut exact, forme normalisée et signe
+_RAW_KEY_KIND = b'r'
+_NORMALIZED_KEY_KIND = b'n'
+
+
+def _encode_result(result: UnderstandingResult) -> bytes:
+    """
+    Sérialise un résultat pour le cache persistant (marshal : types de base seulement).
+    """
+    fraction = result.fraction
+    return marshal.dumps((result.value, result.is_percent, result.sign, result.stage,
+                          None if fraction is None else (fraction.numerator, fraction.denominator),
+                          result.no_number))
+
+
+def _decode_result(data: bytes) -> UnderstandingResult:
+    """
+    Reconstruit un résultat sérialisé par _encode_result.
+    """
+    value, is_percent, sign, stage, fraction, no_number = marshal.loads(data)
+    if fraction is not None:
+        # Import différé, comme dans _fraction_result
+        from fractions import Fraction
+        fraction = Fraction(*fraction)
+    return UnderstandingResult(value, is_percent, sign, stage, fraction, no_number)
+
+
+class PersistentResultCache:
+    """
+    Cache de résultats sur disque (SQLite), partagé entre processus et conservé d'une exécution à l'autre.
+
+    Chaque résultat est rangé sous deux clés hachées avec la version du moteur
+    (empreinte du module et de Python, profil régional) : le texte brut exact, lu
+    sans aucune analyse, et la forme normalisée avec le signe (la déduplication de
+    text_to_result_many), qui sert aussi les quasi-doublons ("La moitié." / "la moitie").
+    Après une mise à jour du moteur, les anciennes entrées ne sont plus lues ; les
+    plus anciennes entrées sont élaguées en premier (prune, max_entries).
+
+    La base est en mode WAL : plusieurs processus lisent en même temps, SQLite
+    sérialise les écritures (attente jusqu'à timeout secondes). Les nouvelles entrées
+    sont écrites par paquets (flush, close, et à la fin de chaque appel de
+    results_many) ; un processus issu d'un fork ouvre sa propre connexion. Les textes
+    écartés par le préfiltre (aucun nombre possible) ne sont pas stockés, et
+    l'instrumentation des étapes n'est pas appelée pour un résultat lu sur disque.
+
+    Exemple :
+        with PersistentResultCache("resultats.sqlite", max_entries=1_000_000) as cache:
+            resultats = cache.results_many(reponses)
+    """
+
+    __slots__ = ('path', 'max_entries', 'timeout', 'hits', 'misses', 'pruned', '_connection', '_pid',
+                 '_forked_connection', '_pending', '_lock', '_hash', '_fingerprint', '_key_prefix')
+
+    def __init__(self, path: str, max_entries: Optional[int] = None, timeout: float = 30.0):
+        """
+        Args:
+            path (str): Le fichier SQLite (créé s'il n'existe pas)
+            max_entries (Optional[int]): Nombre maximal d'entrées conservées, élaguées à
+                l'ouverture puis après chaque écriture (par défaut : sans limite)
+            timeout (float): Attente maximale (en secondes) d'un verrou tenu par un autre processus
+
+        Raises:
+            ValueError: Si max_entries n'est pas strictement positif
+            sqlite3.Error: Si le fichier n'est pas une base SQLite utilisable
+        """
+        if max_entries is not None and max_entries <= 0:
+            raise ValueError("max_entries doit être strictement positif")
+        # Import différé : hashlib n'est utile qu'avec le cache persistant
+        import hashlib
+
+        self.path = path
+        self.max_entries = max_entries
+        self.timeout = timeout
+        self.hits = 0
+        self.misses = 0
+        self.pruned = 0
+        self._hash = hashlib.blake2b
+        self._fingerprint = _engine_fingerprint()
+        self._key_prefix: Tuple[str, bytes] = ('', b'')
+        self._pending: Dict[bytes, bytes] = {}
+        self._lock = threading.Lock()
+        self._connection: Any = None
+        self._forked_connection: Any = None
+        self._pid = 0
+        self._connect()
+        if max_entries is not None:
+            with self._lock:
+                self._prune(max_entries)
+
+    def _connect(self) -> None:
+        # Import différé : sqlite3 pèse sur le démarrage à froid
+        import sqlite3
+
+        connection = sqlite3.connect(self.path, timeout=self.timeout, check_same_thread=False)
+        try:
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            connection.execute('CREATE TABLE IF NOT EXISTS results '
+                               '(id INTEGER PRIMARY KEY, key BLOB NOT NULL UNIQUE, result BLOB NOT NULL)')
+            connection.commit()
+        except BaseException:
+            connection.close()
+            raise
+        self._connection = connection
+        self._pid = os.getpid()
+
+    def _database(self) -> Any:
+        # Appelée avec le verrou tenu
+        if self._connection is None:
+            raise ValueError("cache persistant fermé")
+        if self._pid != os.getpid():
+            # Processus issu d'un fork : la connexion du parent n'est jamais refermée ici (cela
+            # toucherait à ses verrous) et ses entrées en attente restent à sa charge
+            self._forked_connection = self._connection
+            self._pending = {}
+            self._connect()
+        return self._connection
+
+    def _key(self, kind: bytes, text: str) -> bytes:
+        locale, prefix = self._key_prefix
+        if locale != _ENGINE.locale:
+            # Version du moteur : empreinte du module et profil régional actif
+            locale = _ENGINE.locale
+            prefix = f"{self._fingerprint}:{locale}\0".encode()
+            self._key_prefix = (locale, prefix)
+        return self._hash(kind + prefix + text.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+
+    def _lookup(self, keys: List[bytes]) -> Dict[bytes, bytes]:
+        # Recherche groupée : entrées en attente d'abord, puis la base par paquets de clés
+        found: Dict[bytes, bytes] = {}
+        with self._lock:
+            database = self._database()
+            pending = self._pending
+            missing = []
+            for key in keys:
+                data = pending.get(key)
+                if data is None:
+                    missing.append(key)
+                else:
+                    found[key] = data
+            for start in range(0, len(missing), _PERSISTENT_LOOKUP_CHUNK):
+                chunk = missing[start:start + _PERSISTENT_LOOKUP_CHUNK]
+                found.update(database.execute(
+                    f"SELECT key, result FROM results WHERE key IN ({','.join('?' * len(chunk))})", chunk))
+        return found
+
+    def _count(self, hits: int, misses: int) -> None:
+        with self._lock:
+            self.hits += hits
+            self.misses += misses
+
+    def _store(self, entries: Dict[bytes, bytes], flush: bool) -> None:
+        with self._lock:
+            self._database()
+            self._pending.update(entries)
+            if flush or len(self._pending) >= _PERSISTENT_FLUSH_SIZE:
+                self._flush()
+
+    def _flush(self) -> None:
+        # Appelée avec le verrou tenu
+        if not self._pending:
+            return
+        database = self._database()
+        with database:
+            database.executemany('INSERT OR IGNORE INTO results (key, result) VALUES (?, ?)',
+                                 self._pending.items())
+        self._pending = {}
+        if self.max_entries is not None:
+            self._prune(self.max_entries)
+
+    def _prune(self, max_entries: int) -> int:
+        # Appelée avec le verrou tenu ; les identifiants croissent avec l'ordre d'insertion
+        database = self._database()
+        with database:
+            low, high = database.execute('SELECT min(id), max(id) FROM results').fetchone()
+            if high is None or high - low < max_entries:
+                return 0
+            deleted = database.execute('DELETE FROM results WHERE id <= ?', (high - max_entries,)).rowcount
+        self.pruned += deleted
+        return deleted
+
+    def result(self, input_text: str) -> UnderstandingResult:
+        """
+        Résultat de text_to_result pour un texte, lu sur disque si déjà connu.
+
+        Args:
+            input_text (str): Le texte d'entrée à analyser
+
+        Returns:
+            UnderstandingResult: Le résultat, identique à celui de text_to_result
+        """
+        folded_text = input_text.lower().translate(_ACCENT_TABLE)
+        if not _may_contain_number_folded(folded_text):
+            return _NO_NUMBER_RESULT
+
+        raw_key = self._key(_RAW_KEY_KIND, input_text)
+        data = self._lookup([raw_key]).get(raw_key)
+        if data is not None:
+            self._count(1, 0)
+            return _decode_result(data)
+
+        tokens = list(_iter_tokens(input_text, folded_text))
+        normalized = NormalizedText.from_tokens(input_text, tokens)
+        is_negative = _negative_sign(input_text, tokens)
+        normalized_key = self._key(_NORMALIZED_KEY_KIND, f"{normalized.text}\0{int(is_negative)}")
+        data = self._lookup([normalized_key]).get(normalized_key)
+        if data is not None:
+            self._count(1, 0)
+            self._store({raw_key: data}, flush=False)
+            return _decode_result(data)
+
+        self._count(0, 1)
+        result = _understand_normalized(normalized, is_negative)
+        data = _encode_result(result)
+        self._store({raw_key: data, normalized_key: data}, flush=False)
+        return result
+
+    def results_many(self, input_texts: Iterable[str]) -> List[UnderstandingResult]:
+        """
+        Version par lot de result : recherches et insertions groupées, déduplication dans le lot.
+
+        Args:
+            input_texts (Iterable[str]): Les textes à analyser
+
+        Returns:
+            List[UnderstandingResult]: Les résultats de text_to_result, dans l'ordre des entrées
+        """
+        input_texts = list(input_texts)
+        result_by_input: Dict[str, UnderstandingResult] = {}
+        raw_keys: Dict[str, bytes] = {}
+        folded_by_input: Dict[str, str] = {}
+
+        for input_text in input_texts:
+            if input_text in result_by_input or input_text in raw_keys:
+                continue
+            folded_text = input_text.lower().translate(_ACCENT_TABLE)
+            if not _may_contain_number_folded(folded_text):
+                result_by_input[input_text] = _NO_NUMBER_RESULT
+            else:
+                raw_keys[input_text] = self._key(_RAW_KEY_KIND, input_text)
+                folded_by_input[input_text] = folded_text
+
+        # Première passe : textes bruts déjà connus
+        found = self._lookup(list(raw_keys.values()))
+        decoded: Dict[bytes, UnderstandingResult] = {}
+        hits = misses = 0
+        unknown: List[Tuple[str, 'NormalizedText', bool, bytes]] = []
+        for input_text, raw_key in raw_keys.items():
+            data = found.get(raw_key)
+            if data is not None:
+                hits += 1
+                result = decoded.get(data)
+                if result is None:
+                    result = decoded[data] = _decode_result(data)
+                result_by_input[input_text] = result
+                continue
+            tokens = list(_iter_tokens(input_text, folded_by_input[input_text]))
+            normalized = NormalizedText.from_tokens(input_text, tokens)
+            is_negative = _negative_sign(input_text, tokens)
+            unknown.append((input_text, normalized, is_negative,
+                            self._key(_NORMALIZED_KEY_KIND, f"{normalized.text}\0{int(is_negative)}")))
+
+        # Seconde passe : formes normalisées, puis calcul des absents (une fois par forme)
+        found = self._lookup([entry[3] for entry in unknown])
+        new_entries: Dict[bytes, bytes] = {}
+        for input_text, normalized, is_negative, normalized_key in unknown:
+            data = found.get(normalized_key)
+            if data is not None:
+                hits += 1
+                result = decoded.get(data)
+                if result is None:
+                    result = decoded[data] = _decode_result(data)
+            else:
+                misses += 1
+                result = _understand_normalized(normalized, is_negative)
+                data = found[normalized_key] = new_entries[normalized_key] = _encode_result(result)
+                decoded[data] = result
+            new_entries[raw_keys[input_text]] = data
+            result_by_input[input_text] = result
+
+        self._count(hits, misses)
+        if new_entries:
+            self._store(new_entries, flush=True)
+        return [result_by_input[input_text] for input_text in input_texts]
+
+    def prune(self, max_entries: Optional[int] = None) -> int:
+        """
+        Élague le cache en supprimant les entrées les plus anciennes.
+
+        Args:
+            max_entries (Optional[int]): Nombre d'entrées à conserver (par défaut : celui du cache)
+
+        Returns:
+            int: Le nombre d'entrées supprimées
+
+        Raises:
+            ValueError: Si max_entries n'est pas strictement positif ou n'est pas défini
+        """
+        if max_entries is None:
+            max_entries = self.max_entries
+        if max_entries is None or max_entries <= 0:
+            raise ValueError("max_entries doit être strictement positif")
+        with self._lock:
+            self._flush()
+            return self._prune(max_entries)
+
+    def flush(self) -> None:
+        """
+        Écrit sur disque les entrées en attente.
+        """
+        with self._lock:
+            self._flush()
+
+    def clear(self) -> None:
+        """
+        Vide le cache (pour tous les processus) et remet les compteurs à zéro.
+        """
+        with self._lock:
+            database = self._database()
+            self._pending = {}
+            with database:
+                database.execute('DELETE FROM results')
+            self.hits = self.misses = self.pruned = 0
+
+    def info(self) -> ResultCacheInfo:
+        """
+        Returns:
+            ResultCacheInfo: Les statistiques de ce processus (evictions : entrées élaguées ;
+                maxsize : max_entries, 0 sans limite ; currsize : entrées sur disque)
+        """
+        return ResultCacheInfo(self.hits, self.misses, self.pruned, self.max_entries or 0, len(self))
+
+    def close(self) -> None:
+        """
+        Écrit les entrées en attente et ferme la base (sans effet si déjà fermée).
+        """
+        with self._lock:
+            if self._connection is None:
+                return
+            if self._pid == os.getpid():
+                self._flush()
+                self._connection.close()
+            self._connection = None
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._flush()
+            return self._database().execute('SELECT count(*) FROM results').fetchone()[0]
+
+    def __enter__(self) -> 'PersistentResultCache':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def enable_persistent_cache(path: str, max_entries: Optional[int] = None) -> PersistentResultCache:
+    """
+    Place un cache persistant (PersistentResultCache) devant text_to_understanding.
+
+    text_to_result, text_to_result_many et leurs variantes (y compris les processus de
+    text_to_understanding_parallel) lisent puis complètent le cache ; le cache LRU en
+    mémoire (enable_result_cache), s'il est actif, reste consulté en premier. Les
+    entrées en attente sont écrites à la fin du processus.
+
+    Args:
+        path (str): Le fichier SQLite (créé s'il n'existe pas)
+        max_entries (Optional[int]): Nombre maximal d'entrées conservées (par défaut : sans limite)
+
+    Returns:
+        PersistentResultCache: Le cache activé (statistiques, prune)
+
+    Raises:
+        ValueError: Si max_entries n'est pas strictement positif
+    """
+    global _persistent_cache
+    cache = PersistentResultCache(path, max_entries)
+    disable_persistent_cache()
+    _persistent_cache = cache
+    # Import différé ; unregister évite d'enregistrer plusieurs fois la fermeture
+    import atexit
+    atexit.unregister(disable_persistent_cache)
+    atexit.register(disable_persistent_cache)
+    return cache
+
+
+def disable_persistent_cache() -> None:
+    """
+    Écrit les entrées en attente et retire le cache persistant (sans effet s'il est inactif).
+    """
+    global _persistent_cache
+    cache = _persistent_cache
+    _persistent_cache = None
+    if cache is not None:
+        cache.close()
+
+
+class StageStats(NamedTuple):
+    """
+    Statistiques d'une étape de text_to_number (voir stage_statistics).
+
+    Attributes:
+        calls (int): Nombre d'appels de l'étape
+        hits (int): Nombre de résultats produits par l'étape
+        total_seconds (float): Temps cumulé passé dans l'étape
+    """
+    calls: int
+    hits: int
+    total_seconds: float
+
+
+# Rappel d'instrumentation : (texte normalisé, étape gagnante ou None, valeur, durée de la cascade en secondes)
+StageCallback = Callable[[str, Optional[str], Optional[int], float], None]
+
+
+class _StageInstrumentation:
+    """
+    Compteurs par étape de la cascade de text_to_number, et rappel optionnel.
+    """
+
+    __slots__ = ('callback', '_calls', '_hits', '_seconds', '_lock')
+
+    def __init__(self, callback: Optional[StageCallback] = None):
+        """
+        Args:
+            callback (Optional[StageCallback]): Appelé après chaque cascade
+        """
+        self.callback = callback
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Remet les compteurs à zéro.
+        """
+        with self._lock:
+            self._calls = {stage_name: 0 for stage_name, _ in _NUMBER_STAGES}
+            self._hits = dict(self._calls)
+            self._seconds = {stage_name: 0.0 for stage_name in self._calls}
+
+    def run(self, normalized_input: 'NormalizedText') -> Tuple[Optional[int], Optional[str]]:
+        """
+        Cascade de _staged_number, chronométrée étape par étape.
+
+        Args:
+            normalized_input (NormalizedText): Le texte normalisé (non vide)
+
+        Returns:
+            Tuple[Optional[int], Optional[str]]: Le nombre extrait et le nom de l'étape, ou (None, None)
+        """
+        found_value, found_stage = None, None
+        stage_timings = []
+        for stage_name, stage_function in _NUMBER_STAGES:
+            start_time = time.perf_counter()
+            stage_value = stage_function(normalized_input)
+            stage_timings.append((stage_name, time.perf_counter() - start_time))
+            if stage_value is not None:
+                found_value, found_stage = stage_value, stage_name
+                break
+
+        with self._lock:
+            for stage_name, elapsed in stage_timings:
+                self._calls[stage_name] += 1
+                self._seconds[stage_name] += elapsed
+            if found_stage is not None:
+                self._hits[found_stage] += 1
+
+        if self.callback is not None:
+            self.callback(normalized_input.text, found_stage, found_value,
+                          sum(elapsed for _, elapsed in stage_timings))
+        return found_value, found_stage
+
+    def snapshot(self) -> Dict[str, StageStats]:
+        """
+        Returns:
+            Dict[str, StageStats]: Statistiques par étape, dans l'ordre de la cascade
+        """
+        with self._lock:
+            return {
+                stage_name: StageStats(self._calls[stage_name], self._hits[stage_name], self._seconds[stage_name])
+                for stage_name in self._calls
+            }
+
+
+# Instrumentation des étapes (None : désactivée, aucun coût dans la cascade)
+_stage_instrumentation: Optional[_StageInstrumentation] = None
+
+
+def enable_stage_instrumentation(callback: Optional[StageCallback] = None) -> None:
+    """
+    Active l'instrumentation des étapes de text_to_number (compteurs remis à zéro).
+
+    Pour chaque étape (find_percentages, find_fractions_generic...), sont comptés les
+    appels, les résultats produits et le temps cumulé. Les résultats servis par le
+    cache de résultats, et les textes écartés par le préfiltre (may_contain_number),
+    ne passent pas par les étapes et ne sont pas comptés.
+
+    Args:
+        callback (Optional[StageCallback]): Appelé après chaque cascade avec le texte
+            normalisé, l'étape qui a produit le résultat (None si aucune), la valeur
+            et la durée de la cascade en secondes
+    """
+    global _stage_instrumentation
+    _stage_instrumentation = _StageInstrumentation(callback)
+
+
+def disable_stage_instrumentation() -> None:
+    """
+    Désactive l'instrumentation des étapes (et oublie ses compteurs).
+    """
+    global _stage_instrumentation
+    _stage_instrumentation = None
+
+
+def reset_stage_statistics() -> None:
+    """
+    Remet les compteurs d'instrumentation à zéro (sans la désactiver).
+    """
+    if _stage_instrumentation is not None:
+        _stage_instrumentation.reset()
+
+
+def stage_statistics() -> Optional[Dict[str, StageStats]]:
+    """
+    Statistiques d'instrumentation des étapes de text_to_number.
+
+    Returns:
+        Optional[Dict[str, StageStats]]: Étape -> statistiques, dans l'ordre de la cascade
+            (None si l'instrumentation est désactivée)
+    """
+    instrumentation = _stage_instrumentation
+    return instrumentation.snapshot() if instrumentation is not None else None
+
+
+# Tables de normalisation compilées une seule fois au chargement du module (en lecture seule)
+_SEPARATOR_TABLE = MappingProxyType(str.maketrans({'-': ' ', '_': ' '}))
+
+_ACCENT_TABLE = MappingProxyType(str.maketrans({
+    'à': 'a', 'â': 'a', 'ä': 'a', 'á': 'a',
+    'é': 'e', 'è': 'e', 'ê': 'e', 'ë': 'e',
+    'î': 'i', 'ï': 'i', 'í': 'i',
+    'ô': 'o', 'ö': 'o', 'ó': 'o',
+    'ù': 'u', 'û': 'u', 'ü': 'u', 'ú': 'u',
+    'ÿ': 'y', 'ý': 'y',
+    'ç': 'c'
+}))
+
+# soixante-dix / quatre-vingt-dix / quatre-vingt (+ unité éventuelle) en une seule alternance.
+# "quatre" n'est pas pris comme unité s'il commence lui-même un "quatre vingt".
+_FRENCH_TENS_PATTERN = re.compile(
+    r'\b(?:(?P<soixante_dix>soixante\s*dix)'
+    r'|(?P<quatre_vingt_dix>quatre\s*vingts?\s*dix)'
+    r'|(?P<quatre_vingt>quatre\s*vingts?))'
+    r'(?:\s*(?P<unit>un|deux|trois|quatre(?!\s*vingts?\b)|cinq|six|sept|huit|neuf)\b)?\b'
+)
+
+# Table de dispatch : groupe reconnu -> forme belge/suisse simplifiée
+_FRENCH_TENS_REPLACEMENTS = MappingProxyType({
+    'soixante_dix': 'septante',
+    'quatre_vingt_dix': 'nonante',
+    'quatre_vingt': 'octante',
+})
+
+# Débuts de token qui peuvent ouvrir une forme de _FRENCH_TENS_PATTERN ("quatrevingt" compris)
+_FRENCH_TENS_PREFIXES = ('soixante', 'quatre')
+
+# Tokens lus au plus par _FRENCH_TENS_PATTERN : "quatre vingt dix quatre" et l'anticipation "vingt"
+_MAX_FRENCH_TENS_TOKENS = 5
+
+# Dizaines françaises en plusieurs mots, les plus longues d'abord (profils sans réécriture)
+_FRENCH_TENS_WORDS = (
+    ('quatre', 'vingt', 'dix'), ('quatre', 'vingts', 'dix'),
+    ('soixante', 'dix'), ('quatre', 'vingt'), ('quatre', 'vingts'),
+)
+
+# Dizaines françaises collées ("quatrevingt") : mots du lexique des profils sans réécriture
+_GLUED_FRENCH_TENS: Mapping[str, int] = MappingProxyType({
+    'soixantedix': 70, 'quatrevingt': 80, 'quatrevingts': 80, 'quatrevingtdix': 90,
+})
+
+# Mots après lesquels la suite du texte (partie décimale) est ignorée
+_DECIMAL_SEPARATOR_WORDS = frozenset({'virgule', 'virgules', 'point', 'points'})
+
+
+# Natures des tokens produits par tokenize
+TOKEN_NUMBER_WORD = 'number_word'               # mot numérique du lexique ("vingt", "millions")
+TOKEN_DIGITS = 'digits'                         # suite de chiffres, décimales comprises ("12,5")
+TOKEN_PERCENT = 'percent'                       # "%", "pourcent"
+TOKEN_FRACTION_OPERATOR = 'fraction_operator'   # "/", "sur"
+TOKEN_SIGN = 'sign'                             # "moins", tiret non collé à un mot ("-5")
+TOKEN_CONNECTOR = 'connector'                   # "et", "de", tiret entre deux mots ("vingt-deux")
+TOKEN_OTHER = 'other'                           # autres mots et ponctuation
+
+TOKEN_KINDS = (TOKEN_NUMBER_WORD, TOKEN_DIGITS, TOKEN_PERCENT, TOKEN_FRACTION_OPERATOR, TOKEN_SIGN,
+               TOKEN_CONNECTOR, TOKEN_OTHER)
+
+
+class Token(NamedTuple):
+    """
+    Token typé produit par tokenize.
+
+    Attributes:
+        kind (str): Nature du token (voir TOKEN_KINDS)
+        text (str): Forme normalisée : minuscules, sans accents, faute de frappe corrigée
+            ("Quatorse" -> "quatorze") ; "_" devient "-"
+        start (int): Position du premier caractère dans le texte d'origine
+        end (int): Position qui suit le dernier caractère (texte[start:end])
+        spaced (bool): Séparé du token précédent par un espace (ou un tiret retiré à la normalisation)
+    """
+    kind: str
+    text: str
+    start: int
+    end: int
+    spaced: bool
+
+
+# Un seul parcours du texte : chiffres (décimales comprises), mots (lettres et chiffres), symboles
+_LEXER_PATTERN = re.compile(r'(\d+(?:[.,]\d+)?)|([^\W_]+)|([^\w\s]|_)')
+
+# Contextes laissés par un token au mot suivant, pour la correction des fautes (voir _left_correction_context)
+_NO_CONTEXT, _ARTICLE_CONTEXT, _NUMERIC_CONTEXT = 0, 1, 2
+
+
+def tokenize(input_text: str) -> List[Token]:
+    """
+    Découpe un texte brut en tokens typés, en un seul parcours.
+
+    Chaque token garde sa position dans le texte d'origine. Les étapes d'extraction
+    lisent ces tokens (NormalizedText.token_stream) au lieu de ré-analyser le texte.
+
+    Exemples :
+    - "Moins 3/4" -> sign "moins", digits "3", fraction_operator "/", digits "4"
+    - "vingt-deux %" -> number_word "vingt", connector "-", number_word "deux", percent "%"
+
+    Args:
+        input_text (str): Le texte brut
+
+    Returns:
+        List[Token]: Les tokens, dans l'ordre du texte
+    """
+    return list(_iter_tokens(input_text, input_text.lower().translate(_ACCENT_TABLE)))
+
+
+def _iter_tokens(input_text: str, folded_text: Optional[str] = None, correct_after_digits: bool = False,
+                 left_context: int = _NO_CONTEXT, held_tail: Optional[List[Token]] = None) -> Iterator[Token]:
+    """
+    Tokens d'un texte, produits à la demande (voir tokenize).
+
+    Args:
+        input_text (str): Le texte d'origine
+        folded_text (Optional[str]): Le texte déjà en minuscules sans accents (partagé avec
+            le préfiltre) ; sans lui, chaque token est converti séparément et la mémoire
+            ne dépend pas de la taille du texte
+        correct_after_digits (bool): Corrige aussi les mots collés après des chiffres ("3quatorse")
+        left_context (int): Contexte laissé par le texte précédent (lecture par morceaux,
+            voir _left_correction_context)
+        held_tail (Optional[List[Token]]): Reçoit le dernier mot, non corrigé, s'il attend encore
+            son voisin de droite (suivi de ses tirets) ; sans elle, ce mot est produit tel quel
+
+    Returns:
+        Iterator[Token]: Les tokens, dans l'ordre du texte
+    """
+    # Quelques rares majuscules ("İ") changent de longueur en minuscules : positions conservées token par token
+    fold_each_token = folded_text is None or len(folded_text) != len(input_text)
+    source_text = input_text if fold_each_token else folded_text
+    engine = _ENGINE
+    speller = engine.lexicon.speller
+    token_kinds = engine.token_kinds
+    known_words = speller.known_words
+    number_values = engine.lexicon.values
+    # Construction directe du tuple : évite le __new__ Python de NamedTuple (chemin chaud)
+    new_token = tuple.__new__
+    previous_end = 0
+    digits_end = -1
+    # Une faute n'est corrigée qu'à côté d'un nombre (ou, sans contexte, si elle est longue et
+    # à une lettre près) : le mot sans contexte à gauche attend le token suivant (held : le mot,
+    # puis les tirets qui le suivent ; held_correction : sa forme corrigée)
+    held: List[Token] = []
+    held_correction = ''
+
+    for token_match in _LEXER_PATTERN.finditer(source_text):
+        start, end = token_match.span()
+        text = token_match.group()
+        if fold_each_token:
+            text = text.lower().translate(_ACCENT_TABLE)
+        group = token_match.lastindex
+        correction = None
+
+        if group == 1:
+            kind = TOKEN_DIGITS
+            digits_end = end
+        elif group == 2:
+            # Correction des fautes de frappe (mot entier en lettres, non collé à des chiffres)
+            if (len(text) >= _FUZZY_MIN_LENGTH and text not in known_words
+                    and (start != digits_end or correct_after_digits) and text.isalpha()):
+                correction = speller.correct(text)
+                if correction is not None and (
+                        left_context == _NUMERIC_CONTEXT
+                        or (left_context == _ARTICLE_CONTEXT and correction not in number_values)
+                        or (len(text) >= _FUZZY_CONTEXT_FREE_LENGTH and _edit_distance(text, correction, 1) == 1)):
+                    text, correction = correction, None
+            kind = token_kinds.get(text, TOKEN_OTHER)
+        elif text == '-' or text == '_':
+            text = '-'
+            kind = TOKEN_SIGN if start == 0 or not _is_word_character(input_text[start - 1]) else TOKEN_CONNECTOR
+        else:
+            kind = token_kinds.get(text, TOKEN_OTHER)
+
+        token = new_token(Token, (kind, text, start, end, start != previous_end))
+        previous_end = end
+        if held:
+            if kind == TOKEN_CONNECTOR:
+                held.append(token)
+                continue
+            if _is_right_correction_context(token, known_words):
+                word = held[0]
+                held[0] = new_token(Token, (token_kinds.get(held_correction, TOKEN_OTHER), held_correction,
+                                            word.start, word.end, word.spaced))
+                left_context = _NUMERIC_CONTEXT
+            yield from held
+            held.clear()
+        if correction is not None:
+            held.append(token)
+            held_correction = correction
+            left_context = _NO_CONTEXT
+            continue
+        yield token
+        if kind != TOKEN_CONNECTOR:
+            left_context = _left_correction_context(token, known_words)
+    if held_tail is not None:
+        held_tail.extend(held)
+    else:
+        yield from held
+
+
+def _left_correction_context(token: Token, known_words: FrozenSet[str]) -> int:
+    """
+    Contexte qu'un token donne au mot qui le suit : numérique ("deux milions" : toute
+    correction), article ("la moitiee" : fraction ou groupe seulement, pas "le billon") ou aucun.
+    """
+    if token.kind in _LEFT_CORRECTION_CONTEXT_KINDS or token.text in known_words:
+        return _NUMERIC_CONTEXT
+    return _ARTICLE_CONTEXT if token.text in _LEFT_CORRECTION_CONTEXT_WORDS else _NO_CONTEXT
+
+
+def _is_right_correction_context(token: Token, known_words: FrozenSet[str]) -> bool:
+    """
+    Indique si un token (non corrigé) justifie la correction du mot qui le précède ("cinquente pour cent").
+    """
+    return token.kind in _RIGHT_CORRECTION_CONTEXT_KINDS or token.text in known_words or token.text == 'pour'
+
+
+def _is_word_character(character: str) -> bool:
+    """
+    Caractère de mot au sens de \\w des expressions régulières (lettre, chiffre ou "_").
+    """
+    return character.isalnum() or character == '_'
+
+
+def _starts_word(stream: List[Token], position: int) -> bool:
+    """
+    Indique si un token commence un mot : il n'est pas collé à un token de lettres ou de chiffres ("5tout").
+    """
+    return position == 0 or stream[position].spaced or not _is_word_character(stream[position - 1].text[-1])
+
+
+def _ends_word(stream: List[Token], position: int) -> bool:
+    """
+    Indique si un token termine un mot : le token suivant n'y est pas collé ("5kg").
+    """
+    return (position + 1 == len(stream) or stream[position + 1].spaced
+            or not _is_word_character(stream[position + 1].text[0]))
+
+
+def _simplify_french_tens(match: re.Match) -> str:
+    """
+    Remplace une forme française (soixante-dix, quatre-vingt...) par sa forme simplifiée.
+
+    Args:
+        match (re.Match): Correspondance de _FRENCH_TENS_PATTERN
+
+    Returns:
+        str: La forme simplifiée, suivie de l'unité éventuelle (ex: "septante sept")
+    """
+    for group_name, replacement in _FRENCH_TENS_REPLACEMENTS.items():
+        if match.group(group_name) is not None:
+            break
+    unit = match.group('unit')
+    return f"{replacement} {unit}" if unit else replacement
+
+
+def _simplify_french_tens_tokens(stream: List[Token]) -> List[Token]:
+    """
+    Remplace les formes françaises (soixante-dix, quatre-vingt...) d'une suite de tokens.
+
+    Les mots consécutifs d'une forme ("quatre vingt dix", ou collés : "quatrevingt") sont
+    lus ensemble par _FRENCH_TENS_PATTERN ; les tokens produits couvrent les mêmes
+    positions d'origine ("quatre-vingt-deux" -> "octante" puis "deux").
+
+    Args:
+        stream (List[Token]): Les tokens normalisés
+
+    Returns:
+        List[Token]: Les tokens, formes françaises simplifiées
+    """
+    simplified: List[Token] = []
+    position = 0
+    while position < len(stream):
+        token = stream[position]
+        if token.text.startswith(_FRENCH_TENS_PREFIXES) and _starts_word(stream, position):
+            run_end = position + 1
+            while (run_end < len(stream) and run_end - position < _MAX_FRENCH_TENS_TOKENS
+                   and stream[run_end].kind != TOKEN_DIGITS and stream[run_end].text[0].isalnum()):
+                run_end += 1
+            run = stream[position:run_end]
+            run_text = ' '.join(run_token.text for run_token in run)
+            tens_match = _FRENCH_TENS_PATTERN.match(run_text)
+            if tens_match is not None:
+                matched_count = run_text.count(' ', 0, tens_match.end()) + 1
+                simplified.extend(_french_tens_tokens(tens_match, run[:matched_count]))
+                position += matched_count
+                continue
+        simplified.append(token)
+        position += 1
+    return simplified
+
+
+def _french_tens_tokens(tens_match: re.Match, run: List[Token]) -> List[Token]:
+    """
+    Tokens simplifiés d'une forme française ("octante", puis l'unité éventuelle).
+
+    Args:
+        tens_match (re.Match): Correspondance de _FRENCH_TENS_PATTERN sur les mots de run joints par des espaces
+        run (List[Token]): Les tokens couverts par la correspondance
+
+    Returns:
+        List[Token]: Un ou deux tokens, aux positions d'origine des mots remplacés
+    """
+    words = _simplify_french_tens(tens_match).split()
+    first, last = run[0], run[-1]
+    if len(words) == 1:
+        return [Token(TOKEN_NUMBER_WORD, words[0], first.start, last.end, first.spaced)]
+
+    # Position d'origine du début de l'unité : début d'un token, ou milieu d'un token collé ("quatrevingtdeux")
+    unit_position = tens_match.start('unit')
+    run_position = 0
+    for index, run_token in enumerate(run):
+        if unit_position < run_position + len(run_token.text):
+            offset = unit_position - run_position
+            if offset == 0:
+                tens_end, unit_start = run[index - 1].end, run_token.start
+            else:
+                tens_end = unit_start = min(run_token.start + offset, run_token.end)
+            break
+        run_position += len(run_token.text) + 1
+    return [Token(TOKEN_NUMBER_WORD, words[0], first.start, tens_end, first.spaced),
+            Token(TOKEN_NUMBER_WORD, words[1], unit_start, last.end, True)]
+
+
+def normalize_text(input_text: str) -> str:
+    """
+    Normalise le texte pour faciliter l'analyse numérique.
+
+    Opérations effectuées :
+    - Conversion en minuscules
+    - Suppression des accents
+    - Remplacement des tirets et underscores par des espaces et . a la fin annuler
+    - Suppression du mot 'et'
+    - Conversion des nombres français complexes en formes belges/suisses simplifiées
+      (profil "mixed" seulement, voir set_locale_profile)
+    - Correction des fautes de frappe sur les mots numériques (une faute dès 5 lettres, deux dès 9),
+      seulement à côté d'un contexte numérique ("deux milions", mais pas "elle est douée")
+    - Nettoyage des espaces multiples
+    - Si on voit le mot virgule(s) ou point(s) on enlève la suite de la chaîne (ex: "quatre virgule cinq" devient "quatre")
+
+    Le texte n'est parcouru qu'une fois (tokenize) : les opérations portent ensuite sur
+    les tokens (voir NormalizedText.from_tokens).
+
+    Args:
+        input_text (str): Le texte à normaliser
+
+    Returns:
+        str: Le texte normalisé
+    """
+    return NormalizedText.from_input(input_text).text
+
+
+
+class NormalizedText:
+    """
+    Texte normalisé une seule fois puis partagé par toutes les étapes d'extraction.
+
+    Attributes:
+        text (str): La chaîne canonique (sortie de normalize_text)
+        tokens (List[str]): Les mots de la chaîne canonique
+        token_stream (List[Token]): Ses tokens typés ; les positions se rapportent au texte
+            d'origine (from_input, from_tokens), ou à text pour un texte déjà normalisé
+        isolated_words (FrozenSet[str]): Les mots qui ne sont pas collés à des chiffres ("5tout")
+    """
+
+    __slots__ = ('text', 'tokens', '_token_stream', '_isolated_words')
+
+    def __init__(self, text: str, token_stream: Optional[List[Token]] = None):
+        """
+        Args:
+            text (str): Un texte déjà normalisé (il n'est pas re-normalisé)
+            token_stream (Optional[List[Token]]): Ses tokens, s'ils sont déjà connus
+        """
+        self.text = text
+        self.tokens = text.split()
+        self._token_stream = token_stream
+        self._isolated_words: Optional[FrozenSet[str]] = None
+
+    @classmethod
+    def from_input(cls, input_text: str, folded_text: Optional[str] = None) -> 'NormalizedText':
+        """
+        Normalise un texte brut et construit sa représentation.
+
+        Args:
+            input_text (str): Le texte brut
+            folded_text (Optional[str]): Le texte en minuscules sans accents, s'il est déjà calculé
+
+        Returns:
+            NormalizedText: Le texte normalisé et ses tokens
+        """
+        if folded_text is None:
+            folded_text = input_text.lower().translate(_ACCENT_TABLE)
+        return cls.from_tokens(input_text, list(_iter_tokens(input_text, folded_text)))
+
+    @classmethod
+    def from_tokens(cls, input_text: str, tokens: List[Token]) -> 'NormalizedText':
+        """
+        Normalise les tokens d'un texte brut (voir normalize_text), sans relire le texte.
+
+        Args:
+            input_text (str): Le texte brut
+            tokens (List[Token]): Ses tokens (tokenize)
+
+        Returns:
+            NormalizedText: Le texte normalisé et ses tokens
+        """
+        stream: List[Token] = []
+        pending_space = False
+        # Profils sans réécriture : l'automate lit directement "soixante dix", "quatre vingt"
+        check_french_tens = _ENGINE.simplify_french_tens
+        has_french_tens = False
+        last_position = len(tokens) - 1
+
+        for position, token in enumerate(tokens):
+            text = token.text
+            # Tirets et underscores : séparateurs
+            if text == '-':
+                pending_space = True
+                continue
+            word_start = (token.spaced or pending_space or not stream
+                          or not _is_word_character(stream[-1].text[-1]))
+            # Mot "et" retiré (les espaces qui l'entourent restent)
+            if text == 'et' and word_start and input_text[token.start:token.end].lower() == 'et':
+                pending_space = pending_space or token.spaced
+                continue
+            # Partie décimale ("quatre virgule cinq") et point final ignorés
+            if (text in _DECIMAL_SEPARATOR_WORDS and word_start) or (
+                    position == last_position and text == '.' and token.end == len(input_text)):
+                break
+            if pending_space and not token.spaced:
+                token = token._replace(spaced=True)
+            pending_space = False
+            if check_french_tens and not has_french_tens:
+                has_french_tens = text.startswith(_FRENCH_TENS_PREFIXES)
+            stream.append(token)
+
+        if has_french_tens:
+            stream = _simplify_french_tens_tokens(stream)
+
+        pieces = []
+        for token in stream:
+            if token.spaced and pieces:
+                pieces.append(' ')
+            pieces.append(token.text)
+        return cls(''.join(pieces), stream)
+
+    @property
+    def token_stream(self) -> List[Token]:
+        """
+        Les tokens typés du texte normalisé (calculés à la première demande).
+        """
+        if self._token_stream is None:
+            self._token_stream = list(_iter_tokens(self.text, self.text))
+        return self._token_stream
+
+    @property
+    def isolated_words(self) -> FrozenSet[str]:
+        """
+        Les mots qui commencent un mot du texte : recherche d'un mot-clé en O(1).
+        """
+        if self._isolated_words is None:
+            stream = self.token_stream
+            self._isolated_words = frozenset(
+                token.text for position, token in enumerate(stream)
+                if token.kind != TOKEN_DIGITS and token.text[0].isalnum() and _starts_word(stream, position)
+            )
+        return self._isolated_words
+
+    def __repr__(self) -> str:
+        return f"NormalizedText({self.text!r})"
+
+
+def _as_normalized(text: Union[str, NormalizedText]) -> NormalizedText:
+    """
+    Accepte une chaîne déjà normalisée ou un NormalizedText (sans re-normaliser).
+
+    Args:
+        text (Union[str, NormalizedText]): Le texte normalisé
+
+    Returns:
+        NormalizedText: Le texte sous forme de NormalizedText
+    """
+    return text if isinstance(text, NormalizedText) else NormalizedText(text)
+
+
+def _words_before(stream: List[Token], position: int) -> List[str]:
+    """
+    Mots du texte normalisé qui précèdent un token (début collé du mot courant compris : "cinquante,").
+
+    Args:
+        stream (List[Token]): Les tokens du texte normalisé
+        position (int): Index du token
+
+    Returns:
+        List[str]: Les mots, dans l'ordre du texte
+    """
+    words: List[str] = []
+    for token in stream[:position]:
+        if token.spaced or not words:
+            words.append(token.text)
+        else:
+            words[-1] += token.text
+    return words
+
+
+def _trailing_digits(text: str) -> str:
+    """
+    Suite de chiffres qui termine un token ("12,5" -> "5", "kg5" -> "5"), ou chaîne vide.
+    """
+    start = len(text)
+    while start and text[start - 1].isdecimal():
+        start -= 1
+    return text[start:]
+
+
+def _leading_digits(text: str) -> str:
+    """
+    Suite de chiffres qui commence un token ("4,5" -> "4"), ou chaîne vide.
+    """
+    end = 0
+    while end < len(text) and text[end].isdecimal():
+        end += 1
+    return text[:end]
+
+
+def _numeric_fractions(stream: List[Token], operator: str = '/') -> Iterator[int]:
+    """
+    Positions des opérateurs des fractions en chiffres ("3/4", "3 sur 4"), dans l'ordre du texte.
+
+    Le numérateur est la suite de chiffres qui termine le token précédent, le dénominateur
+    celle qui commence le token suivant ; "sur" doit être entouré d'espaces. Les fractions
+    ne se chevauchent pas : dans "1/2/3", seule "1/2" en est une.
+
+    Args:
+        stream (List[Token]): Les tokens du texte normalisé
+        operator (str): "/" ou "sur"
+
+    Returns:
+        Iterator[int]: Les index des opérateurs
+    """
+    next_free = 0
+    for position in range(1, len(stream) - 1):
+        operator_token = stream[position]
+        if operator_token.text != operator or position - 1 < next_free:
+            continue
+        following = stream[position + 1]
+        if operator != '/' and not (operator_token.spaced and following.spaced):
+            continue
+        if _trailing_digits(stream[position - 1].text) and _leading_digits(following.text):
+            yield position
+            next_free = position + 2
+
+
+def _numeric_fraction_terms(stream: List[Token], position: int) -> Tuple[Optional[int], Optional[int]]:
+    """
+    Numérateur et dénominateur de la fraction en chiffres dont l'opérateur est à position.
+
+    Returns:
+        Tuple[Optional[int], Optional[int]]: Les deux termes (None s'ils sont trop longs pour être convertis)
+    """
+    return (_decimal_to_int(_trailing_digits(stream[position - 1].text)),
+            _decimal_to_int(_leading_digits(stream[position + 1].text)))
+
+
+def text_to_number(input_text: Union[str, NormalizedText]) -> Optional[int]:
+    """
+    Extrait et convertit un nombre à partir d'un texte français.
+    
+    Stratégie d'extraction par ordre de priorité :
+    1. Pourcentages explicites (50%, cinquante pourcent)
+    2. Fractions génériques (3/4, trois sur quatre)
+    3. Nombres en chiffres (123, 45.67)
+    4. Expressions spéciales (tout, rien, presque)
+    5. Nombres écrits en lettres (vingt-trois, quatre-vingts)
+    
+    Args:
+        input_text (Union[str, NormalizedText]): Le texte brut à analyser, ou un
+            NormalizedText déjà construit (pas de nouvelle normalisation)
+        
+    Returns:
+        Optional[int]: Le nombre extrait ou None si aucun nombre trouvé
+    """
+    if isinstance(input_text, NormalizedText):
+        return _number_from_normalized(input_text)
+    number_cache = _number_cache
+    if number_cache is not None:
+        return number_cache.get_or_compute(input_text, _compute_number)
+    return _compute_number(input_text)
+
+
+def _compute_number(input_text: str) -> Optional[int]:
+    """
+    Normalise puis extrait le nombre d'un texte brut, sans cache.
+
+    Args:
+        input_text (str): Le texte brut à analyser
+
+    Returns:
+        Optional[int]: Le nombre extrait ou None
+    """
+    if not may_contain_number(input_text):
+        return None
+    return _number_from_normalized(NormalizedText.from_input(input_text))
+
+
+def _number_from_normalized(normalized_input: NormalizedText) -> Optional[int]:
+    """
+    Cascade d'extraction de text_to_number sur un texte déjà normalisé.
+
+    Args:
+        normalized_input (NormalizedText): Le texte normalisé
+
+    Returns:
+        Optional[int]: Le nombre extrait ou None
+    """
+    return _staged_number(normalized_input)[0]
+
+
+def _staged_number(normalized_input: NormalizedText) -> Tuple[Optional[int], Optional[str]]:
+    """
+    Cascade d'extraction (_NUMBER_STAGES, dans l'ordre) : la première étape qui trouve un nombre l'emporte.
+
+    Args:
+        normalized_input (NormalizedText): Le texte normalisé
+
+    Returns:
+        Tuple[Optional[int], Optional[str]]: Le nombre extrait et le nom de l'étape, ou (None, None)
+    """
+    if not normalized_input.text:
+        return None, None  # Changé de 0 à None
+
+    instrumentation = _stage_instrumentation
+    if instrumentation is not None:
+        return instrumentation.run(normalized_input)
+
+    for stage_name, stage_function in _NUMBER_STAGES:
+        stage_value = stage_function(normalized_input)
+        if stage_value is not None:
+            return stage_value, stage_name
+
+    return None, None  # Changé de 0 à None
+
+
+def _decimal_to_int(number_string: str) -> Optional[int]:
+    """
+    Partie entière d'un nombre écrit en chiffres ("12,34" -> 12).
+
+    Args:
+        number_string (str): Le nombre, avec éventuellement une partie décimale
+
+    Returns:
+        Optional[int]: La partie entière, ou None si le nombre est trop long pour être converti
+    """
+    try:
+        return int(number_string.replace(',', '.').split('.')[0])
+    except ValueError:
+        return None
+
+
+def find_explicit_numbers(normalized: NormalizedText) -> Optional[int]:
+    """
+    Trouve les nombres écrits en chiffres dans le texte.
+    Exclut les fractions pour éviter les faux positifs.
+    
+    Args:
+        normalized (NormalizedText): Le texte normalisé à analyser
+        
+    Returns:
+        Optional[int]: Le plus grand nombre trouvé ou None
+    """
+    stream = _as_normalized(normalized).token_stream
+
+    # Fractions ignorées pour éviter de prendre juste le dénominateur
+    fraction_positions = set()
+    for operator_position in _numeric_fractions(stream):
+        fraction_positions.update((operator_position - 1, operator_position + 1))
+
+    # Tous les nombres (entiers ou décimaux) qui forment un mot à eux seuls ("5kg" n'en est pas un)
+    numeric_values = []
+    for position, token in enumerate(stream):
+        if token.kind != TOKEN_DIGITS or position in fraction_positions:
+            continue
+        # "1.5kg" : la partie entière reste isolée
+        if token.text.isdecimal() and not _ends_word(stream, position):
+            continue
+        # Conversion en entier (gestion des décimales avec virgule)
+        numeric_value = _decimal_to_int(token.text)
+        if numeric_value is not None:
+            numeric_values.append(numeric_value)
+
+    if numeric_values:
+        return max(numeric_values)  # Retour du plus grand nombre trouvé
+    
+    return None
+
+
+# Nombre en chiffres qui termine les tokens collés devant un "%"
+_PERCENT_NUMBER_PATTERN = re.compile(r'(?<!\d)\d+(?:[.,]\d+)?$')
+
+
+def find_percentages(normalized: NormalizedText) -> Optional[int]:
+    """
+    Trouve les pourcentages dans le texte avec gestion des erreurs courantes.
+    
+    Formats supportés :
+    - Avec symbole % : "50%", "75 %"
+    - Avec mot : "cinquante pourcent", "vingt pour cent"
+    
+    Args:
+        normalized (NormalizedText): Le texte normalisé à analyser
+        
+    Returns:
+        Optional[int]: La valeur du pourcentage ou None
+    """
+    stream = _as_normalized(normalized).token_stream
+
+    # Recherche avec symbole % : premier "%" qui suit un nombre en chiffres
+    previous_percent = 0
+    for position in range(1, len(stream)):
+        if stream[position].text != '%':
+            continue
+        # Tokens collés qui précèdent le "%" ("zero7.8" -> "7.8", "2.750.5" -> "750.5") ; le
+        # retour arrière s'arrête au "%" précédent (qui ne peut faire partie d'un nombre) :
+        # chaque token n'est relu qu'une fois, le parcours reste linéaire ("a%a%a%...")
+        run_start = position - 1
+        while run_start > previous_percent and not stream[run_start].spaced:
+            run_start -= 1
+        previous_percent = position
+        number_match = _PERCENT_NUMBER_PATTERN.search(''.join(token.text for token in stream[run_start:position]))
+        if number_match:
+            percent_value = _decimal_to_int(number_match.group())
+            if percent_value is not None:
+                return percent_value
+            break
+    
+    # Recherche avec le mot "pourcent" ou "pour cent"
+    for position, token in enumerate(stream):
+        is_percent_word = token.text == 'pourcent' or (
+            token.text == 'pour' and position + 1 < len(stream) and stream[position + 1].text == 'cent')
+        if not is_percent_word or not _starts_word(stream, position):
+            continue
+        # Capture du nombre qui précède le mot "pourcent" (fenêtre de tokens bornée)
+        preceding_tokens = _words_before(stream, position)
+        number_tokens = _number_window(preceding_tokens, len(preceding_tokens), _ENGINE.lexicon.values)
+        return parse_french_numbers(NormalizedText(' '.join(number_tokens)))
+    
+    return None
+
+
+# Orthographes des dénominateurs ordinaux (texte normalisé : minuscules, sans accents ni tirets).
+# Seules les formes correctes sont listées : les fautes sont corrigées par _ENGINE.lexicon.speller.
+_ORDINAL_DENOMINATOR_SPELLINGS: Mapping[int, Tuple[str, ...]] = MappingProxyType({
+    2: ('demi', 'demie', 'demis', 'demies', 'moitie', 'moities'),
+    3: ('tiers',),
+    4: ('quart', 'quarts', 'quatrieme', 'quatriemes'),
+    5: ('cinquieme', 'cinquiemes'),
+    6: ('sixieme', 'sixiemes'),
+    7: ('septieme', 'septiemes'),
+    8: ('huitieme', 'huitiemes'),
+    9: ('neuvieme', 'neuviemes'),
+    10: ('dixieme', 'dixiemes'),
+    11: ('onzieme', 'onziemes'),
+    12: ('douzieme', 'douziemes'),
+    13: ('treizieme', 'treiziemes'),
+    14: ('quatorzieme', 'quatorziemes'),
+    15: ('quinzieme', 'quinziemes'),
+    16: ('seizieme', 'seiziemes'),
+    17: ('dixseptieme', 'dixseptiemes', 'dix septieme', 'dix septiemes'),
+    18: ('dixhuitieme', 'dixhuitiemes', 'dix huitieme', 'dix huitiemes'),
+    19: ('dixneuvieme', 'dixneuviemes', 'dix neuvieme', 'dix neuviemes'),
+    20: ('vingtieme', 'vingtiemes'),
+    30: ('trentieme', 'trentiemes'),
+    40: ('quarantieme', 'quarantiemes'),
+    50: ('cinquantieme', 'cinquantiemes'),
+    60: ('soixantieme', 'soixantiemes'),
+    70: ('soixante dixieme', 'soixante dixiemes', 'soixantedixieme', 'soixantedixiemes',
+         'septantieme', 'septantiemes'),
+    80: ('quatre vingtieme', 'quatre vingtiemes', 'quatrevingtieme', 'quatrevingtiemes',
+         'octantieme', 'octantiemes', 'huitantieme', 'huitantiemes'),
+    # "quatre vingt dixieme" est normalisé en "octante dixieme"
+    90: ('octante dixieme', 'octante dixiemes', 'nonantieme', 'nonantiemes'),
+    100: ('centieme', 'centiemes'),
+    1000: ('millieme', 'milliemes'),
+})
+
+# Fautes courantes reconnues telles quelles, sans contexte numérique ni correcteur
+# ("centimes" n'en fait pas partie : c'est une unité, "cinquante centimes")
+_ORDINAL_DENOMINATOR_VARIANTS: Mapping[int, Tuple[str, ...]] = MappingProxyType({
+    2: ('demiess', 'moytie', 'moytee', 'moitye'),
+    3: ('tierss', 'tierrs'),
+    4: ('quarte', 'quartes',  # à égale distance de "quart" et de "quatre"
+        'quardt', 'quardts', 'quatriemess', 'quatrimes'),
+    5: ('cinqieme', 'cinqiemes', 'cinquiemess'),
+    6: ('sixiemess', 'siximes'),
+    7: ('septiemess', 'septimes'),
+    8: ('huiteme', 'huitemes', 'huitiemess', 'huitimes'),
+    9: ('neuviemess', 'nevimes'),
+    10: ('dixiemess', 'diximes'),
+    11: ('onziemess', 'onzimes'),
+    12: ('douziemess', 'douzimes'),
+    13: ('treziemess', 'trezimes'),
+    14: ('quatorziemess', 'quatorzimes'),
+    15: ('quinziemess', 'quinzimes'),
+    16: ('seiziemess', 'seizimes'),
+    17: ('dixseptiemess', 'dixseptimes'),
+    18: ('dixhuitiemess', 'dixhuitimes'),
+    19: ('dixneuviemess', 'dixnevimes'),
+    20: ('vingtiemess', 'vingtime', 'vingtimes', 'vingtyeme', 'vingtyemes'),
+    30: ('trentiemess', 'trentimes'),
+    40: ('quarantiemess', 'quarantimes'),
+    50: ('cinquantiemess', 'cinquantimes'),
+    60: ('soixantiemess', 'soixantime', 'soixantimes'),
+    70: ('soixante dixiemess', 'soixante dixime', 'soixante diximes'),
+    80: ('quatre vingtiemess', 'quatre vingtime', 'quatre vingtimes'),
+    90: ('octante dixiemess', 'octante dixime', 'octante diximes'),
+    100: ('centiemess', 'centsieme', 'centsiemes', 'centesieme', 'centesiemes'),
+    1000: ('milliemess', 'millimes'),
+})
+
+# Fautes d'ordinaux sans "ieme" ("huiteme", "quardts") : indicateurs de pourcentage comme les formes en "ieme"
+_ORDINAL_VARIANT_INDICATOR_WORDS = frozenset(
+    spelling.split()[-1] for spellings in _ORDINAL_DENOMINATOR_VARIANTS.values() for spelling in spellings
+    if 'ieme' not in spelling
+)
+
+# Clé terminale du trie : porte la valeur du dénominateur
+_TRIE_VALUE = ''
+
+# Ponctuation ignorée autour d'un token lors des recherches de mots-clés ("quarts,")
+_TOKEN_PUNCTUATION = '.,;:!?()[]"\'«»'
+
+
+def _build_token_trie(spellings: Mapping[int, Tuple[str, ...]]) -> Mapping[str, Any]:
+    """
+    Construit un trie de mots (une arête par token) à partir d'orthographes éventuellement multi-mots.
+
+    Args:
+        spellings (Mapping[int, Tuple[str, ...]]): Valeur -> orthographes acceptées
+
+    Returns:
+        Mapping[str, Any]: Le trie figé (nœuds en lecture seule), dont les nœuds terminaux
+            portent la valeur sous _TRIE_VALUE
+    """
+    trie: Dict[str, Any] = {}
+    for value, words in spellings.items():
+        for spelling in words:
+            node = trie
+            for token in spelling.split():
+                node = node.setdefault(token, {})
+            node[_TRIE_VALUE] = value
+    return _freeze_trie(trie)
+
+
+def _freeze_trie(node: Dict[str, Any]) -> Mapping[str, Any]:
+    """
+    Copie en lecture seule d'un nœud de trie et de ses descendants.
+    """
+    return MappingProxyType({
+        key: child if key == _TRIE_VALUE else _freeze_trie(child) for key, child in node.items()
+    })
+
+
+# Mots admis dans une fenêtre de nombre écrit (numérateur, multiplicateur, pourcentage)
+_NUMBER_WINDOW_ARTICLES = frozenset({'le', 'la', 'les', 'de', 'des', 'du'})
+_NUMBER_WINDOW_APPROXIMATIONS = frozenset({'environ', 'autour', 'plus', 'presque'})
+
+# Nombre maximal de tokens examinés autour d'un "sur", d'un dénominateur ou d'un groupe
+_MAX_NUMBER_WINDOW = 16
+
+# Mots ordinaires sautés au plus entre un nombre et ce qu'il quantifie ("huit personnes sur dix") ;
+# au-delà, un nombre éloigné n'est plus lu comme numérateur ("cent des gens la moitie")
+_MAX_SKIPPED_WINDOW_WORDS = 2
+
+# Ponctuation de phrase qui termine une fenêtre de nombre écrit (l'apostrophe n'en fait pas partie)
+_NUMBER_WINDOW_BREAKS = '.,;:!?()[]"«»'
+
+
+def _find_ordinal_denominators(tokens: List[str]) -> Iterator[Tuple[int, int]]:
+    """
+    Trouve tous les dénominateurs ordinaux (quart, tiers, cinquieme...) en un seul parcours.
+
+    Les correspondances sont produites dans l'ordre du texte ; pour une même position,
+    la plus longue d'abord ("quatre vingtiemes" -> 80, puis "vingtiemes" -> 20).
+
+    Args:
+        tokens (List[str]): Les tokens du texte normalisé
+
+    Returns:
+        Iterator[Tuple[int, int]]: Couples (index du premier token, dénominateur)
+    """
+    ordinal_trie = _ENGINE.ordinal_trie
+    for token_index in range(len(tokens)):
+        node = ordinal_trie
+        position_hits = []
+        for next_index in range(token_index, len(tokens)):
+            # Un token de ponctuation seule (";") termine la recherche (la clé vide porte la valeur)
+            word = tokens[next_index].strip(_TOKEN_PUNCTUATION)
+            node = node.get(word) if word else None
+            if node is None:
+                break
+            if _TRIE_VALUE in node:
+                position_hits.append(node[_TRIE_VALUE])
+        for denominator_value in reversed(position_hits):
+            yield token_index, denominator_value
+
+
+def _number_window(tokens: List[str], boundary: int, number_words: Dict[str, int],
+                   forward: bool = False) -> List[str]:
+    """
+    Tokens du nombre écrit le plus proche d'une position (numérateur, multiplicateur...).
+
+    Parcourt au plus _MAX_NUMBER_WINDOW tokens : le coût reste borné quelle que soit la
+    longueur du texte. Avant la position, jusqu'à _MAX_SKIPPED_WINDOW_WORDS mots
+    ordinaires qui la séparent du nombre sont sautés ("huit personnes sur dix", "trois
+    belles douzaines"), puis la suite de mots numériques, d'articles et de mots
+    d'approximation la plus proche est retenue.
+    Après la position (dénominateur d'un "sur"), le nombre doit suivre directement.
+    Une ponctuation de phrase ("ans, trois sur quatre") termine la fenêtre.
+
+    Args:
+        tokens (List[str]): Les tokens du texte normalisé
+        boundary (int): Index du premier token après la fenêtre (ou du premier token
+            de la fenêtre si forward est vrai)
+        number_words (Dict[str, int]): Dictionnaire des mots numériques
+        forward (bool): Recherche après la position plutôt qu'avant
+
+    Returns:
+        List[str]: Les tokens de la fenêtre (sans ponctuation), dans l'ordre du texte
+    """
+    window: List[str] = []
+    if forward:
+        for token in islice(tokens, boundary, boundary + _MAX_NUMBER_WINDOW):
+            word = token.strip(_TOKEN_PUNCTUATION)
+            if token[0] in _NUMBER_WINDOW_BREAKS or not _is_number_window_token(word, number_words):
+                break
+            window.append(word)
+            if token[-1] in _NUMBER_WINDOW_BREAKS:
+                break
+        return window
+
+    skipped = 0
+    for index in range(boundary - 1, max(0, boundary - _MAX_NUMBER_WINDOW) - 1, -1):
+        token = tokens[index]
+        if token[-1] in _NUMBER_WINDOW_BREAKS:
+            break
+        word = token.strip(_TOKEN_PUNCTUATION)
+        if word in number_words or (window and _is_number_window_token(word, number_words)):
+            window.append(word)
+        elif window or skipped == _MAX_SKIPPED_WINDOW_WORDS:
+            break
+        else:
+            skipped += 1
+        if token[0] in _NUMBER_WINDOW_BREAKS:
+            break
+    window.reverse()
+    return window
+
+
+def _is_number_window_token(token: str, number_words: Dict[str, int]) -> bool:
+    """
+    Indique si un token peut faire partie de l'écriture d'un nombre.
+
+    Args:
+        token (str): Le token à tester
+        number_words (Dict[str, int]): Dictionnaire des mots numériques
+
+    Returns:
+        bool: True pour un mot numérique, un article ou un mot d'approximation
+    """
+    return token in number_words or token in _NUMBER_WINDOW_ARTICLES or token in _NUMBER_WINDOW_APPROXIMATIONS
+
+
+def _find_token(tokens: List[str], token: str, start: int, end: int) -> Optional[int]:
+    """
+    Index de la première occurrence d'un token entre start (inclus) et end (exclu).
+
+    Args:
+        tokens (List[str]): Les tokens du texte normalisé
+        token (str): Le token recherché
+        start (int): Premier index examiné
+        end (int): Index de fin (exclu)
+
+    Returns:
+        Optional[int]: L'index trouvé ou None
+    """
+    if start >= end:
+        return None
+    try:
+        return tokens.index(token, start, end)
+    except ValueError:
+        return None
+
+
+# Moitié sans numérateur ("la moitié") : cas spécial de find_fractions_generic
+_HALF_EXPRESSION_WORDS = frozenset({'demi', 'moitie'})
+
+
+def find_fractions_generic(normalized: NormalizedText) -> Optional[int]:
+    """
+    Trouve les fractions dans le texte et les convertit en pourcentages.
+    
+    Formats supportés :
+    - Fractions numériques : "3/4", "1 / 2"
+    - Fractions avec "sur" : "3 sur 4", "trois sur quatre"
+    - Fractions ordinales : "trois quarts", "un demi", "deux tiers"
+    - Groupes : "une douzaine", "trois vingtaines"
+    
+    Args:
+        normalized (NormalizedText): Le texte normalisé à analyser
+        
+    Returns:
+        Optional[int]: Le pourcentage équivalent de la fraction ou None
+    """
+    normalized = _as_normalized(normalized)
+    stream = normalized.token_stream
+    
+    # 1. Fractions numériques X/Y (priorité élevée)
+    for operator in ('/', 'sur'):
+        # 2. Fractions "X sur Y" avec nombres
+        operator_position = next(_numeric_fractions(stream, operator), None)
+        if operator_position is not None:
+            numerator, denominator = _numeric_fraction_terms(stream, operator_position)
+            if numerator is not None and denominator:
+                result = (numerator / denominator) * 100
+                return int(round(result))
+    
+    # 3. Fractions "X sur Y" avec mots : fenêtres de tokens bornées autour de chaque "sur"
+    tokens = normalized.tokens
+    number_words = _ENGINE.lexicon.values
+    sur_index = _find_token(tokens, 'sur', 1, len(tokens) - 1)
+    while sur_index is not None:
+        numerator_tokens = _number_window(tokens, sur_index, number_words)
+        denominator_tokens = _number_window(tokens, sur_index + 1, number_words, forward=True)
+        numerator_value = parse_french_numbers(NormalizedText(' '.join(numerator_tokens)))
+        denominator_value = parse_french_numbers(NormalizedText(' '.join(denominator_tokens)))
+        if numerator_value is not None and denominator_value is not None and denominator_value > 0:
+            result = (numerator_value / denominator_value) * 100
+            return int(round(result))
+        sur_index = _find_token(tokens, 'sur', sur_index + 1, len(tokens) - 1)
+    
+    # 4. Dénominateurs ordinaux français (quarts, tiers, etc.) : un seul parcours des tokens ;
+    #    le numérateur peut précéder un adjectif ("un bon tiers", "trois gros quarts")
+    for hit_start, denominator_value in _find_ordinal_denominators(tokens):
+        numerator_tokens = _number_window(tokens, hit_start, number_words)
+        numerator_value = parse_french_numbers(NormalizedText(' '.join(numerator_tokens)))
+        if numerator_value is not None:
+            result = (numerator_value / denominator_value) * 100
+            return int(round(result))
+    
+    # 5. Cas spéciaux et groupes
+    isolated_words = normalized.isolated_words
+    if not _HALF_EXPRESSION_WORDS.isdisjoint(isolated_words):
+        return 50
+    if any(_group_base(word) is not None for word in isolated_words):
+        return handle_grouped_numbers(normalized)
+    
+    return None
+
+
+# Dictionnaire des multiplicateurs de groupe ("quatre vingtaine" se lit quatre x vingtaine)
+_GROUP_MULTIPLIERS = MappingProxyType({
+    'dizaine': 10,
+    'douzaine': 12,
+    'vingtaine': 20,
+    'trentaine': 30,
+    'quarantaine': 40,
+    'cinquantaine': 50,
+    'soixantaine': 60,
+    'septantaine': 70,
+    'octantaine': 80,
+    'nonantaine': 90,
+    'centaine': 100,
+})
+
+# Articles retirés du multiplicateur d'un groupe ("une douzaine")
+_GROUP_MULTIPLIER_ARTICLES = frozenset({'un', 'une', 'de', 'des', 'du', 'le', 'les', 'la'})
+
+
+def _group_base(word: str) -> Optional[int]:
+    """
+    Valeur d'un mot de groupe ("douzaine", "centaines"), ou None.
+    """
+    base_value = _GROUP_MULTIPLIERS.get(word)
+    if base_value is None and word.endswith('s'):
+        base_value = _GROUP_MULTIPLIERS.get(word[:-1])
+    return base_value
+
+
+def handle_grouped_numbers(normalized: NormalizedText) -> Optional[int]:
+    """
+    Gère les expressions avec des groupes numériques.
+    
+    Exemples :
+    - "3 douzaines" -> 36
+    - "une vingtaine" -> 20
+    - "dizaine" -> 10
+    
+    Args:
+        normalized (NormalizedText): Le texte normalisé contenant l'expression de groupe
+        
+    Returns:
+        Optional[int]: La valeur numérique du groupe ou None
+    """
+    # Premier mot de groupe du texte, puis multiplicateur dans une fenêtre de tokens bornée
+    tokens = _as_normalized(normalized).tokens
+    for token_index, token in enumerate(tokens):
+        base_value = _group_base(token.strip(_TOKEN_PUNCTUATION))
+        if base_value is None:
+            continue
+        
+        # Nettoyage du multiplicateur (suppression des articles)
+        multiplier_tokens = [
+            window_token
+            for window_token in _number_window(tokens, token_index, _ENGINE.lexicon.values)
+            if window_token not in _GROUP_MULTIPLIER_ARTICLES
+        ]
+        
+        # Valeur par défaut du multiplicateur
+        multiplier_value = 1
+        if multiplier_tokens:
+            parsed_multiplier = parse_french_numbers(NormalizedText(' '.join(multiplier_tokens)))
+            if parsed_multiplier is not None:
+                multiplier_value = parsed_multiplier
+        
+        # Calcul de la valeur finale
+        return multiplier_value * base_value
+
+    return None
+
+
+# Mots de find_special_expressions (mots du texte normalisé)
+_ZERO_WORDS = frozenset({'aucun', 'rien', 'personne', 'nul', 'nulle'})
+_NOTHING_WORDS = frozenset({'rien', 'aucun'})
+_NONE_FOLLOWERS = frozenset({'un', 'une', 'de'})  # "pas un", "pas de"
+_APPROXIMATION_WORDS = frozenset({'presque', 'quasi', 'quasiment'})
+_ALL_WORDS = frozenset({'tout', 'tous', 'toutes', 'totalite'})
+_TOTAL_WORDS = _ALL_WORDS | {'entierement', 'completement', 'integralement'}
+
+# Débuts du mot qui suit un mot de zéro et l'annulent ("aucun de", "rien du tout")
+_ZERO_EXCLUDED_FOLLOWERS = ('de', 'du')
+
+
+def find_special_expressions(normalized: NormalizedText) -> Optional[int]:
+    """
+    Trouve les expressions spéciales et les convertit en valeurs numériques.
+    
+    Expressions supportées :
+    - Expressions de zéro : "aucun", "rien", "personne", "nul", "nulle", "zero"
+    - Expressions de totalité : "tout", "tous", "totalité"
+    - Expressions approximatives : "presque tout", "quasi rien"
+    
+    Args:
+        normalized (NormalizedText): Le texte normalisé à analyser
+        
+    Returns:
+        Optional[int]: La valeur numérique de l'expression ou None
+    """
+    normalized = _as_normalized(normalized)
+    isolated_words = normalized.isolated_words
+    stream = normalized.token_stream
+    
+    # Expressions approximatives spéciales
+    if 'presque' in isolated_words and _word_followed_by(stream, ('presque',), _NOTHING_WORDS):
+        return 5  # "presque rien" = petite quantité
+    
+    # Expressions de zéro absolu
+    # "zero" est traité séparément sans restriction sur "de", "du", "des"
+    if 'zero' in isolated_words:
+        return 0
+    
+    # Autres expressions de zéro avec restriction sur "de", "du", "des"
+    if not _ZERO_WORDS.isdisjoint(isolated_words):
+        for position, token in enumerate(stream):
+            if token.text not in _ZERO_WORDS or not _starts_word(stream, position):
+                continue
+            following = stream[position + 1] if position + 1 < len(stream) else None
+            if following is None or not following.spaced or not following.text.startswith(_ZERO_EXCLUDED_FOLLOWERS):
+                return 0
+    if 'pas' in isolated_words and _word_followed_by(stream, ('pas',), _NONE_FOLLOWERS):
+        return 0
+    
+    # Expressions de totalité approximative
+    if not _APPROXIMATION_WORDS.isdisjoint(isolated_words):
+        if _word_followed_by(stream, _APPROXIMATION_WORDS, _ALL_WORDS):
+            return 95  # "presque tout" = 95% (pas 100%)
+        return None
+    
+    # Expressions de totalité absolue : "tout", "cent pour cent", "100%" (collé au mot suivant)
+    if not _TOTAL_WORDS.isdisjoint(isolated_words):
+        return 100
+    for position in range(len(stream) - 2):
+        token, following, last = stream[position:position + 3]
+        if not _starts_word(stream, position):
+            continue
+        if (token.text == 'cent' and following.text == 'pour' and last.text == 'cent'
+                and following.spaced and last.spaced):
+            return 100
+        if token.text == '100' and following.text == '%' and not last.spaced and _is_word_character(last.text[0]):
+            return 100
+    
+    return None
+
+
+def _word_followed_by(stream: List[Token], words: Iterable[str], followers: Iterable[str]) -> bool:
+    """
+    Indique si l'un des mots est suivi, après un espace, de l'un des mots followers ("presque rien").
+
+    Args:
+        stream (List[Token]): Les tokens du texte normalisé
+        words (Iterable[str]): Les premiers mots acceptés
+        followers (Iterable[str]): Les mots suivants acceptés
+
+    Returns:
+        bool: True si une telle paire de mots est présente
+    """
+    for position in range(len(stream) - 1):
+        following = stream[position + 1]
+        if (stream[position].text in words and following.spaced and following.text in followers
+                and _starts_word(stream, position)):
+            return True
+    return False
+
+
+def parse_french_numbers(normalized: NormalizedText) -> Optional[int]:
+    """
+    Parse généraliste des nombres français écrits en lettres.
+    
+    Supporte :
+    - Nombres simples : "vingt-trois", "quarante-cinq"
+    - Nombres complexes : "deux cent trente-quatre"
+    - Variantes belges/suisses : "septante", "nonante"
+    - Fautes d'orthographe courantes
+    - Approximations : "environ cinquante", "plus de cent"
+    
+    Args:
+        normalized (NormalizedText): Le texte normalisé contenant le nombre en lettres
+        
+    Returns:
+        Optional[int]: Le nombre parsé ou None si non trouvé
+    """
+    
+    normalized = _as_normalized(normalized)
+    if not normalized.text:
+        return None
+    
+    # Lexique partagé des mots numériques
+    number_word_dictionary = _ENGINE.lexicon.values
+    
+    # Extraction des tokens potentiellement numériques
+    numeric_tokens = extract_numeric_tokens(normalized)
+    
+    if not numeric_tokens:
+        return None
+    
+    # Parsing de la séquence de tokens numériques
+    return parse_numeric_sequence(numeric_tokens, number_word_dictionary)
+
+
+# Étapes de text_to_number, par ordre de priorité (noms repris par UnderstandingResult.stage)
+_NUMBER_STAGES: Tuple[Tuple[str, Callable[[NormalizedText], Optional[int]]], ...] = (
+    ('percentages', find_percentages),                  # 50%, cinquante pourcent
+    ('fractions', find_fractions_generic),              # 3/4, trois sur quatre, trois quarts
+    ('explicit_numbers', find_explicit_numbers),        # 123, 45.67
+    ('special_expressions', find_special_expressions),  # tout, rien, presque
+    ('written_numbers', parse_french_numbers),          # vingt-trois, quatre-vingts
+)
+
+
+# Mots numériques français, formes correctes (table figée, construite une seule fois).
+# Les fautes d'orthographe sont corrigées par _ENGINE.lexicon.speller à partir de ces formes.
+_FRENCH_NUMBER_WORDS: Mapping[str, int] = MappingProxyType({
+    # Unités de base (0-9)
+    'zero': 0, 'zéro': 0,
+    'un': 1, 'une': 1,
+    'deux': 2,
+    'trois': 3,
+    'quatre': 4, 'quatres': 4,
+    'cinq': 5, 'cinqs': 5,
+    'six': 6,
+    'sept': 7, 'septs': 7,
+    'huit': 8, 'huits': 8,
+    'neuf': 9, 'neufs': 9,
+
+    # Nombres 10-19
+    'dix': 10,
+    'onze': 11, 'onzes': 11,
+    'douze': 12, 'douzes': 12,
+    'treize': 13, 'treizes': 13,
+    'quatorze': 14, 'quatorzes': 14,
+    'quinze': 15, 'quinzes': 15,
+    'seize': 16, 'seizes': 16,
+
+    # Dizaines (20, 30, 40, 50, 60)
+    'vingt': 20, 'vingts': 20,
+    'trente': 30, 'trentes': 30,
+    'quarante': 40, 'quarantes': 40,
+    'cinquante': 50, 'cinquantes': 50,
+    'soixante': 60, 'soixantes': 60,
+
+    # Variantes belges/suisses simplifiées (70, 80, 90)
+    'septante': 70, 'septantes': 70,
+    'huitante': 80, 'huitantes': 80,
+    'octante': 80, 'octantes': 80,
+    'nonante': 90, 'nonantes': 90,
+
+    # Centaines et milliers
+    'cent': 100, 'cents': 100, 'centaine': 100, 'centaines': 100,
+    'mille': 1000, 'milles': 1000, 'millier': 1000, 'milliers': 1000,
+
+    # Millions et plus
+    'million': 1000000, 'millions': 1000000,
+    'milliard': 1000000000, 'milliards': 1000000000,
+    'billion': 1000000000000, 'billions': 1000000000000
+})
+
+# Fautes courantes reconnues telles quelles, sans contexte numérique ni correcteur
+# ("j'ai quatorz ans", "il y a trent pommes")
+_NUMBER_WORD_VARIANTS: Mapping[str, int] = MappingProxyType({
+    'zeero': 0, 'uhn': 1, 'deu': 2, 'troi': 3, 'troua': 3, 'quatr': 4, 'catre': 4, 'sinq': 5, 'cing': 5,
+    'sis': 6, 'set': 7, 'uit': 8, 'noeuf': 9,
+    'dis': 10, 'onz': 11, 'douz': 12, 'treiz': 13, 'quatorz': 14, 'quinz': 15, 'seiz': 16,
+    'vint': 20, 'trent': 30, 'quarente': 40, 'cinqante': 50, 'sinquante': 50, 'cinquente': 50,
+    'soissante': 60, 'septente': 70, 'septentes': 70, 'uitante': 80, 'nonente': 90,
+    'sant': 100,
+})
+
+# Fautes des dizaines régionales -> radical de la dizaine : gardées par les seuls profils
+# qui lisent cette dizaine (voir _LOCALE_REGIONAL_TENS)
+_REGIONAL_TENS_VARIANTS: Mapping[str, str] = MappingProxyType({
+    'septente': 'septant', 'septentes': 'septant', 'uitante': 'huitant', 'nonente': 'nonant',
+})
+
+
+def get_french_number_words() -> Dict[str, int]:
+    """
+    Dictionnaire complet des mots numériques français avec variantes et fautes courantes.
+    
+    Inclut :
+    - Formes standard françaises
+    - Variantes belges/suisses (septante, octante, nonante)
+    - Fautes d'orthographe fréquentes
+    - Formes plurielles
+    
+    Les étapes d'extraction partagent les tables figées _FRENCH_NUMBER_WORDS et
+    _NUMBER_WORD_VARIANTS (et les index du moteur, _ENGINE) ; cette fonction en renvoie une copie
+    modifiable. Les autres fautes (à une ou deux lettres près) sont corrigées à la volée
+    par le correcteur du lexique et ne figurent pas dans le dictionnaire.
+
+    Returns:
+        Dict[str, int]: Dictionnaire mot -> valeur numérique
+    """
+    return {**_FRENCH_NUMBER_WORDS, **_NUMBER_WORD_VARIANTS}
+
+
+# Mots de liaison gardés dans un contexte numérique ("cent de", "vingt et un")
+_NUMERIC_CONNECTORS = frozenset({'et', 'de', 'des', 'du'})
+
+# Mots d'approximation et ajustement appliqué au nombre ("presque" est géré par find_special_expressions)
+_APPROXIMATION_MODIFIERS: Mapping[str, int] = MappingProxyType(
+    {'environ': 0, 'autour': 0, 'plus': 1, 'moins de': -1, 'presque': -4}
+)
+
+# Articles retirés avant le parsing du nombre principal
+_SEQUENCE_ARTICLES = frozenset({'des', 'du'})
+
+
+def extract_numeric_tokens(normalized: Union[str, NormalizedText]) -> List[str]:
+    """
+    Extrait les tokens (mots) potentiellement numériques d'un texte.
+    
+    Inclut :
+    - Mots numériques directs (un, deux, trois...)
+    - Connecteurs numériques (et, de, des, du)
+    - Mots approximatifs (environ, plus, moins, presque)
+    - Nombres avec tirets
+    
+    Args:
+        normalized (Union[str, NormalizedText]): Le texte normalisé à analyser
+        
+    Returns:
+        List[str]: Liste des tokens numériques extraits
+    """
+    
+    number_word_dictionary = _ENGINE.lexicon.values
+    text_tokens = _as_normalized(normalized).tokens
+    extracted_tokens = []
+    numeric_connectors = _NUMERIC_CONNECTORS
+    approximation_words = _APPROXIMATION_MODIFIERS
     
     for token_index, current_token in enumerate(text_tokens):
         # Mots numériques directs
@@ -717,7 +2802,7 @@ def parse_numeric_sequence(token_list: List[str], number_words: Dict[str, int])
         return None
     
     # Gestion des modificateurs d'approximation
-    approximation_modifiers = {'environ': 0, 'autour': 0, 'plus': 1, 'moins de': -1, 'presque': -4}
+    approximation_modifiers = _APPROXIMATION_MODIFIERS
     approximation_adjustment = 0
     
     # Filtrage des tokens : séparation approximations / nombres
@@ -725,7 +2810,7 @@ def parse_numeric_sequence(token_list: List[str], number_words: Dict[str, int])
     for token in token_list:
         if token in approximation_modifiers:
             approximation_adjustment = approximation_modifiers[token]
-        elif token not in {'des', 'du'}:  # Suppression des articles
+        elif token not in _SEQUENCE_ARTICLES:  # Suppression des articles
             filtered_number_tokens.append(token)
     
     if not filtered_number_tokens:
@@ -745,15 +2830,789 @@ def parse_numeric_sequence(token_list: List[str], number_words: Dict[str, int])
     return parsed_result
 
 
+# Classes de tokens pour l'automate de parse_compound_number
+_START = 'start'
+_UNIT = 'unit'          # 0-9 (sauf quatre)
+_QUATRE = 'quatre'      # 4, peut former "quatre vingt"
+_DIX = 'dix'            # 10, peut être suivi d'une unité (dix sept)
+_TEEN = 'teen'          # 11-16
+_VINGT = 'vingt'        # 20
+_TENS = 'tens'          # 30, 40, 50, 70, 90
+_TENS_VIG = 'tens_vig'  # 60, 80 : acceptent aussi 10-16 (soixante onze, quatre vingt douze)
+_HUNDRED = 'hundred'    # 100
+_SCALE = 'scale'        # mille, million, milliard, billion
+
+# Actions de l'automate
+_ADD = 'add'                    # ajoute la valeur au groupe courant (< 1000)
+_MULTIPLY_HUNDRED = 'hundred'   # multiplie le groupe courant par cent
+_APPLY_SCALE = 'scale'          # ferme le groupe courant avec un multiplicateur
+_QUATRE_VINGT = 'quatre_vingt'  # quatre + vingt -> 80
+_TENS_DIX = 'tens_dix'          # soixante + dix -> 70, dizaine complète comme "septante"
+_COORDINATE = 'coordinate'      # nouveau nombre additionné au précédent ("un et un")
+_REJECT = 'reject'              # séquence mal formée ("cent cent", "vingt cent")
+
+_TOKEN_CLASSES = (_UNIT, _QUATRE, _DIX, _TEEN, _VINGT, _TENS, _TENS_VIG, _HUNDRED, _SCALE)
+
+# Table de transitions : état courant -> action pour chaque classe de token (ordre de _TOKEN_CLASSES)
+_COMPOUND_TRANSITIONS: Mapping[Tuple[str, str], str] = MappingProxyType({
+    (state, token_class): action
+    for state, actions in {
+        #            unit         quatre       dix          teen         vingt          tens         tens_vig     hundred            scale
+        _START:    (_ADD,        _ADD,        _ADD,        _ADD,        _ADD,          _ADD,        _ADD,        _MULTIPLY_HUNDRED, _APPLY_SCALE),
+        _UNIT:     (_COORDINATE, _COORDINATE, _COORDINATE, _COORDINATE, _COORDINATE,   _COORDINATE, _COORDINATE, _MULTIPLY_HUNDRED, _APPLY_SCALE),
+        _QUATRE:   (_COORDINATE, _COORDINATE, _COORDINATE, _COORDINATE, _QUATRE_VINGT, _COORDINATE, _COORDINATE, _MULTIPLY_HUNDRED, _APPLY_SCALE),
+        _DIX:      (_ADD,        _ADD,        _COORDINATE, _COORDINATE, _COORDINATE,   _COORDINATE, _COORDINATE, _MULTIPLY_HUNDRED, _APPLY_SCALE),
+        _TEEN:     (_COORDINATE, _COORDINATE, _COORDINATE, _COORDINATE, _COORDINATE,   _COORDINATE, _COORDINATE, _MULTIPLY_HUNDRED, _APPLY_SCALE),
+        _VINGT:    (_ADD,        _ADD,        _COORDINATE, _COORDINATE, _COORDINATE,   _COORDINATE, _COORDINATE, _REJECT,           _APPLY_SCALE),
+        _TENS:     (_ADD,        _ADD,        _COORDINATE, _COORDINATE, _COORDINATE,   _COORDINATE, _COORDINATE, _REJECT,           _APPLY_SCALE),
+        _TENS_VIG: (_ADD,        _ADD,        _TENS_DIX,   _ADD,        _COORDINATE,   _COORDINATE, _COORDINATE, _REJECT,           _APPLY_SCALE),
+        _HUNDRED:  (_ADD,        _ADD,        _ADD,        _ADD,        _ADD,          _ADD,        _ADD,        _REJECT,           _APPLY_SCALE),
+        _SCALE:    (_ADD,        _ADD,        _ADD,        _ADD,        _ADD,          _ADD,        _ADD,        _MULTIPLY_HUNDRED, _APPLY_SCALE),
+    }.items()
+    for token_class, action in zip(_TOKEN_CLASSES, actions)
+})
+
+
+def _number_word_class(value: int) -> str:
+    """
+    Classe d'un mot numérique selon sa valeur, pour l'automate de parse_compound_number.
+
+    Args:
+        value (int): La valeur du mot numérique
+
+    Returns:
+        str: La classe du token (unit, dix, teen, tens, hundred, scale...)
+    """
+    if value >= 1000:
+        return _SCALE
+    if value == 100:
+        return _HUNDRED
+    if value in (60, 80):
+        return _TENS_VIG
+    if value == 20:
+        return _VINGT
+    if value > 20:
+        return _TENS
+    if value == 10:
+        return _DIX
+    if value > 10:
+        return _TEEN
+    if value == 4:
+        return _QUATRE
+    return _UNIT
+
+
+# Longueur minimale d'un token corrigé, et à partir de laquelle deux fautes sont tolérées :
+# les mots courts ont trop de voisins ("sis", "set", "dis") pour être corrigés sans risque
+_FUZZY_MIN_LENGTH = 5
+_FUZZY_TWO_EDITS_LENGTH = 9
+
+# Mots soumis au correcteur : mots entiers, purement alphabétiques, d'au moins _FUZZY_MIN_LENGTH lettres
+_CORRECTABLE_WORD_PATTERN = re.compile(r'\b[^\W\d_]{%d,}\b' % _FUZZY_MIN_LENGTH)
+
+# Contexte numérique exigé pour corriger une faute : un token voisin (les tirets sont transparents)
+# est un mot reconnu, des chiffres, un marqueur de pourcentage ou de fraction, un signe, ou un
+# article devant une fraction ou un groupe ("la moitiee"). Sans lui, les mots courants proches
+# d'un mot numérique ("douée", "ceints", "billon") restent tels quels.
+_LEFT_CORRECTION_CONTEXT_KINDS = frozenset({TOKEN_NUMBER_WORD, TOKEN_DIGITS, TOKEN_FRACTION_OPERATOR, TOKEN_SIGN})
+_RIGHT_CORRECTION_CONTEXT_KINDS = frozenset({TOKEN_NUMBER_WORD, TOKEN_DIGITS, TOKEN_PERCENT, TOKEN_FRACTION_OPERATOR})
+_LEFT_CORRECTION_CONTEXT_WORDS = frozenset({'le', 'la', 'les', 'des', 'du'})
+
+# Longueur à partir de laquelle une faute d'une seule lettre est corrigée sans contexte
+# ("il y a quatorse pommes") ; plus court ("billon", "ceints", "douée") ou à deux lettres
+# près ("manquante"), le mot doit toucher un nombre
+_FUZZY_CONTEXT_FREE_LENGTH = 7
+
+# Mots courants à une ou deux fautes d'un mot numérique : jamais corrigés. Le contexte
+# numérique écarte la plupart des mots courants ; restent ceux qui côtoient les nombres
+# (unités : "cinquante centimes" n'est pas "cinquante centièmes")
+_FUZZY_PROTECTED_WORDS = frozenset({
+    'bille', 'billes', 'fille', 'filles', 'ville', 'villes', 'maille', 'mailles', 'malle', 'malles',
+    'molle', 'molles', 'millet', 'pille', 'miles',
+    'bonze', 'bonzes', 'ondes', 'ceint', 'dents', 'gents', 'lents', 'rents', 'vents', 'dieux',
+    'douce', 'douces', 'doute', 'doutes', 'douve', 'douves', 'nerfs', 'veufs', 'oeufs', 'nuits',
+    'fiers', 'piers', 'tiens', 'tires', 'quant', 'quark', 'quarks', 'quartz', 'quinte', 'quintes',
+    'rente', 'rentes', 'tente', 'tentes', 'seine', 'seines', 'trios', 'trots', 'trous', 'troie',
+    'octane', 'moite', 'moites', 'remis', 'certaine', 'certaines', 'fontaines',
+    'troisieme', 'troisiemes',
+    'centime', 'centimes', 'once', 'onces', 'dizain', 'dizains', 'douzain', 'douzains', 'octant', 'octants',
+})
+
+# Valeur sentinelle du cache de corrections (None est une correction valide : "pas de correction")
+_NOT_CACHED = object()
+
+
+def _deletion_variants(word: str, max_distance: int) -> Set[str]:
+    """
+    Voisinage de suppressions d'un mot : le mot et ses variantes privées de 1 à max_distance lettres.
+    """
+    variants = {word}
+    frontier = {word}
+    for _ in range(max_distance):
+        frontier = {candidate[:index] + candidate[index + 1:]
+                    for candidate in frontier for index in range(len(candidate))}
+        variants |= frontier
+    return variants
+
+
+def _edit_distance(source: str, target: str, max_distance: int) -> int:
+    """
+    Distance de Damerau-Levenshtein restreinte (transposition de lettres voisines comprise).
+
+    Args:
+        source (str): Le token
+        target (str): Le mot candidat
+        max_distance (int): Distance au-delà de laquelle le calcul peut s'arrêter
+
+    Returns:
+        int: La distance, ou max_distance + 1 si elle dépasse max_distance
+    """
+    if abs(len(source) - len(target)) > max_distance:
+        return max_distance + 1
+    before_previous: List[int] = []
+    previous = list(range(len(target) + 1))
+    for source_index in range(1, len(source) + 1):
+        current = [source_index] + [0] * len(target)
+        for target_index in range(1, len(target) + 1):
+            cost = source[source_index - 1] != target[target_index - 1]
+            current[target_index] = min(previous[target_index] + 1, current[target_index - 1] + 1,
+                                        previous[target_index - 1] + cost)
+            if (source_index > 1 and target_index > 1
+                    and source[source_index - 1] == target[target_index - 2]
+                    and source[source_index - 2] == target[target_index - 1]):
+                current[target_index] = min(current[target_index], before_previous[target_index - 2] + 1)
+        if min(current) > max_distance:
+            return max_distance + 1
+        before_previous, previous = previous, current
+    return previous[-1]
+
+
+class _SpellingCorrector:
+    """
+    Correcteur des fautes de frappe sur les mots numériques (index SymSpell).
+
+    Chaque forme correcte est indexée sous toutes ses variantes privées d'une ou deux
+    lettres : un token est corrigé en cherchant ses propres variantes dans l'index, puis
+    en vérifiant la distance des candidats. Une faute est tolérée à partir de
+    _FUZZY_MIN_LENGTH lettres, deux à partir de _FUZZY_TWO_EDITS_LENGTH ; un token à égale
+    distance de deux mots de sens différents ("fixieme" : sixieme ou dixieme ?) n'est
+    pas corrigé. Le correcteur ne voit que le token : tokenize n'applique la correction
+    qu'à côté d'un contexte numérique (_left_correction_context).
+
+    Les corrections calculées sont mémorisées ; la mémoire est partagée par les fils
+    d'exécution, ses écritures sont donc protégées par un verrou (les lectures n'en ont
+    pas besoin : une correction ne dépend que du token).
+
+    Attributes:
+        known_words (FrozenSet[str]): Mots reconnus tels quels (formes correctes et variantes)
+        meanings (Mapping[str, Tuple]): Forme correcte -> sens (comparé en cas d'égalité)
+        deletions (Mapping[str, Tuple[str, ...]]): Variante par suppressions -> formes correctes
+        protected_words (FrozenSet[str]): Mots jamais corrigés
+    """
+
+    __slots__ = ('known_words', 'meanings', 'deletions', 'protected_words', '_corrections', '_lock')
+
+    # Nombre maximal de corrections gardées en mémoire (le cache est vidé au-delà)
+    MAX_CACHED_CORRECTIONS = 1 << 14
+
+    def __init__(self, meanings: Mapping[str, Tuple], known_words: Iterable[str],
+                 protected_words: FrozenSet[str] = _FUZZY_PROTECTED_WORDS):
+        """
+        Args:
+            meanings (Mapping[str, Tuple]): Forme correcte -> sens
+            known_words (Iterable[str]): Variantes reconnues telles quelles (jamais corrigées)
+            protected_words (FrozenSet[str]): Mots jamais corrigés
+        """
+        deletions: Dict[str, List[str]] = {}
+        for word in meanings:
+            if len(word) >= _FUZZY_MIN_LENGTH - 1:
+                for variant in _deletion_variants(word, 2):
+                    deletions.setdefault(variant, []).append(word)
+        self.known_words = frozenset(meanings) | frozenset(known_words)
+        self.meanings = MappingProxyType(dict(meanings))
+        self.deletions = MappingProxyType({variant: tuple(words) for variant, words in deletions.items()})
+        self.protected_words = protected_words
+        self._corrections: Dict[str, Optional[str]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_index(cls, known_words: FrozenSet[str], meanings: Mapping[str, Tuple],
+                   deletions: Mapping[str, Tuple[str, ...]], protected_words: FrozenSet[str]) -> '_SpellingCorrector':
+        """
+        Correcteur à partir d'un index déjà construit (instantané du moteur), sans recalcul.
+        """
+        corrector = cls.__new__(cls)
+        corrector.known_words = known_words
+        corrector.meanings = MappingProxyType(meanings)
+        corrector.deletions = MappingProxyType(deletions)
+        corrector.protected_words = protected_words
+        corrector._corrections = {}
+        corrector._lock = threading.Lock()
+        return corrector
+
+    def correct(self, token: str) -> Optional[str]:
+        """
+        Forme reconnue d'un token.
+
+        Args:
+            token (str): Le token (texte normalisé)
+
+        Returns:
+            Optional[str]: Le token s'il est reconnu tel quel, sa forme corrigée, ou None
+        """
+        if token in self.known_words:
+            return token
+        if len(token) < _FUZZY_MIN_LENGTH:
+            return None
+        corrected = self._corrections.get(token, _NOT_CACHED)
+        if corrected is _NOT_CACHED:
+            # Calcul hors verrou : deux fils peuvent calculer la même correction (même résultat)
+            corrected = self._closest_word(token)
+            with self._lock:
+                if len(self._corrections) >= self.MAX_CACHED_CORRECTIONS:
+                    self._corrections.clear()
+                self._corrections[token] = corrected
+        return corrected
+
+    def _closest_word(self, token: str) -> Optional[str]:
+        """
+        Forme correcte la plus proche d'un token inconnu, ou None (trop loin, protégé ou ambigu).
+        """
+        if token in self.protected_words or not token.isalpha():
+            return None
+        max_distance = 1 if len(token) < _FUZZY_TWO_EDITS_LENGTH else 2
+        candidates = set()
+        for variant in _deletion_variants(token, max_distance):
+            candidates.update(self.deletions.get(variant, ()))
+
+        closest_distance, closest_words = max_distance, []
+        for candidate in candidates:
+            distance = _edit_distance(token, candidate, max_distance)
+            if distance < closest_distance:
+                closest_distance, closest_words = distance, [candidate]
+            elif distance == closest_distance:
+                closest_words.append(candidate)
+        if not closest_words or len({self.meanings[word] for word in closest_words}) > 1:
+            return None
+        return min(closest_words)
+
+
+class _NumberLexicon(NamedTuple):
+    """
+    Lexique numérique figé et ses index, partagés par toutes les étapes.
+
+    Attributes:
+        values (Mapping[str, int]): Token -> valeur ("vingt" -> 20)
+        classes (Mapping[str, str]): Token -> classe de l'automate (unit, dix, tens, hundred, scale...)
+        stems (FrozenSet[str]): Radicaux (sans "s" final) de tous les mots à valeur numérique :
+            mots-nombres, dénominateurs ordinaux ("quart"), groupes ("douzaine") ; chaque mot
+            commence par l'un d'eux
+        speller (_SpellingCorrector): Correcteur des mots-nombres, ordinaux et groupes
+    """
+    values: Mapping[str, int]
+    classes: Mapping[str, str]
+    stems: FrozenSet[str]
+    speller: _SpellingCorrector
+
+
+def _build_lexicon(number_words: Mapping[str, int],
+                   variants: Mapping[str, int] = _NUMBER_WORD_VARIANTS,
+                   ordinal_spellings: Mapping[int, Tuple[str, ...]] = _ORDINAL_DENOMINATOR_SPELLINGS
+                   ) -> _NumberLexicon:
+    """
+    Construit les index d'un lexique numérique.
+
+    Args:
+        number_words (Mapping[str, int]): Mot -> valeur numérique (formes correctes, indexées
+            par le correcteur)
+        variants (Mapping[str, int]): Fautes reconnues telles quelles
+        ordinal_spellings (Mapping[int, Tuple[str, ...]]): Orthographes des dénominateurs ordinaux
+
+    Returns:
+        _NumberLexicon: Le lexique figé et ses index
+    """
+    all_number_words = {**number_words, **variants}
+    ordinal_words: Dict[str, int] = {}
+    for value, spellings in ordinal_spellings.items():
+        ordinal_words.update((spelling, value) for spelling in spellings if ' ' not in spelling)
+    group_words = {**_GROUP_MULTIPLIERS, **{word + 's': value for word, value in _GROUP_MULTIPLIERS.items()}}
+
+    # Sens d'une forme correcte : deux candidats de même sens ("cent", "cents") ne sont pas ambigus
+    meanings = {
+        word: (number_words.get(word), ordinal_words.get(word), group_words.get(word))
+        for word in {**number_words, **ordinal_words, **group_words}
+    }
+    known_words = set(variants)
+    for spellings in _ORDINAL_DENOMINATOR_VARIANTS.values():
+        known_words.update(spelling for spelling in spellings if ' ' not in spelling)
+    speller = _SpellingCorrector(meanings, known_words)
+
+    numeric_words = set(all_number_words) | set(_GROUP_MULTIPLIERS)
+    for spellings in (*ordinal_spellings.values(), *_ORDINAL_DENOMINATOR_VARIANTS.values()):
+        for spelling in spellings:
+            numeric_words.update(spelling.split())
+    return _NumberLexicon(
+        values=MappingProxyType(all_number_words),
+        classes=MappingProxyType({word: _number_word_class(value) for word, value in all_number_words.items()}),
+        stems=frozenset(_word_stem(word) for word in numeric_words),
+        speller=speller,
+    )
+
+
+def _word_stem(word: str) -> str:
+    """
+    Radical d'un mot : sans "s" final, sauf si le radical devient trop court ("dis", "tous").
+    """
+    stem = word.rstrip('s')
+    return stem if len(stem) >= 4 else word
+
+
+# Variable d'environnement désignant un instantané du moteur (save_engine_snapshot) à charger à l'import
+ENGINE_SNAPSHOT_ENV = 'NUMBER_EXTRACT_SNAPSHOT'
+
+# Version du format des instantanés (marshal : types de base seulement, aucun code exécuté au chargement)
+_SNAPSHOT_FORMAT = 2
+
+
+def _engine_fingerprint() -> str:
+    """
+    Empreinte du moteur : version de Python (format marshal), taille et CRC du code source du module.
+    """
+    with open(__file__, 'rb') as source_file:
+        source = source_file.read()
+    return f"{sys.version_info[0]}.{sys.version_info[1]}:{len(source)}:{zlib.crc32(source):08x}"
+
+
+def save_engine_snapshot(path: str) -> None:
+    """
+    Écrit un instantané du moteur compilé (profil régional actif) : lexique, index du
+    correcteur et préfiltre.
+
+    L'instantané se construit à l'avance (au déploiement, par exemple avec
+    `python -m number_extract --save-snapshot moteur.snapshot`) ; si la variable
+    d'environnement NUMBER_EXTRACT_SNAPSHOT le désigne, l'import le charge au lieu de
+    reconstruire les index. Un instantané écrit par une autre version du module ou de
+    Python, ou pour un autre profil que NUMBER_EXTRACT_LOCALE, est ignoré.
+
+    Args:
+        path (str): Le fichier à écrire (remplacé d'un bloc)
+    """
+    engine = _ENGINE
+    lexicon = engine.lexicon
+    speller = lexicon.speller
+    tables = {
+        'format': _SNAPSHOT_FORMAT,
+        'fingerprint': _engine_fingerprint(),
+        'locale': engine.locale,
+        'values': dict(lexicon.values),
+        'classes': dict(lexicon.classes),
+        'stems': lexicon.stems,
+        'known_words': speller.known_words,
+        'meanings': dict(speller.meanings),
+        'deletions': dict(speller.deletions),
+        'protected_words': speller.protected_words,
+        'candidate_pattern': engine.candidate_pattern.pattern,
+    }
+    temporary_path = f"{path}.{os.getpid()}.tmp"
+    with open(temporary_path, 'wb') as snapshot_file:
+        snapshot_file.write(marshal.dumps(tables))
+    os.replace(temporary_path, path)
+
+
+def _load_engine_snapshot() -> Optional[Dict[str, Any]]:
+    """
+    Tables de l'instantané désigné par NUMBER_EXTRACT_SNAPSHOT, ou None.
+
+    Un instantané absent, illisible ou d'une autre version est signalé par un
+    avertissement et ignoré : les index sont alors reconstruits.
+    """
+    path = os.environ.get(ENGINE_SNAPSHOT_ENV)
+    if not path:
+        return None
+    try:
+        with open(path, 'rb') as snapshot_file:
+            tables = marshal.loads(snapshot_file.read())
+        if (isinstance(tables, dict) and tables.get('format') == _SNAPSHOT_FORMAT
+                and tables.get('fingerprint') == _engine_fingerprint()):
+            return tables
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+    warnings.warn(f"instantané du moteur ignoré (absent, invalide ou d'une autre version) : {path}",
+                  RuntimeWarning)
+    return None
+
+
+def _lexicon_from_snapshot(tables: Dict[str, Any]) -> _NumberLexicon:
+    """
+    Lexique reconstitué à partir des tables d'un instantané.
+    """
+    return _NumberLexicon(
+        values=MappingProxyType(tables['values']),
+        classes=MappingProxyType(tables['classes']),
+        stems=tables['stems'],
+        speller=_SpellingCorrector.from_index(tables['known_words'], tables['meanings'],
+                                              tables['deletions'], tables['protected_words']),
+    )
+
+
+# Nature des tokens de tokenize, par forme normalisée, hors mots-nombres du lexique (TOKEN_NUMBER_WORD) ;
+# les autres mots et symboles sont TOKEN_OTHER
+_TOKEN_KEYWORD_KINDS: Mapping[str, str] = MappingProxyType({
+    **dict.fromkeys(('%', 'pourcent', 'pourcents', 'prcent', 'prcnt'), TOKEN_PERCENT),
+    **dict.fromkeys(('/', 'sur'), TOKEN_FRACTION_OPERATOR),
+    'moins': TOKEN_SIGN,
+    **dict.fromkeys(('et', 'de', 'des', 'du'), TOKEN_CONNECTOR),
+})
+
+# Mots qui donnent un résultat sans nombre : find_special_expressions ("pas de", "tous"...)
+# et indicateurs absolus de _understand_normalized ("totalite" -> 100%, "rien" -> 0%)
+_NUMBER_KEYWORD_STEMS = frozenset({
+    'zero', 'aucun', 'rien', 'personne', 'nul', 'pas',
+    'tout', 'tous', 'totalite', 'entierement', 'completement', 'integralement',
+})
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """
+    Expression régulière équivalente à une alternative de mots, factorisée en trie.
+
+    Chaque position du texte ne teste qu'une branche par caractère, au lieu d'essayer
+    chaque mot de l'alternative l'un après l'autre.
+
+    Args:
+        words (Iterable[str]): Les mots (non vides)
+
+    Returns:
+        str: L'expression régulière (sans groupe capturant)
+    """
+    trie: Dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for character in word:
+            node = node.setdefault(character, {})
+        node[_TRIE_VALUE] = True
+
+    def node_pattern(node: Dict[str, dict]) -> str:
+        if _TRIE_VALUE in node:
+            return ''  # un radical plus court suffit déjà : le reste du sous-arbre est inutile
+        branches = [re.escape(character) + node_pattern(child) for character, child in sorted(node.items())]
+        return branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+
+    return node_pattern(trie)
+
+
+def _candidate_pattern(lexicon: _NumberLexicon) -> str:
+    """
+    Préfiltre : chiffre, "%", "/", ou radical numérique en début de mot (texte en minuscules sans accents).
+    """
+    return r'[\d%/]|(?<![^\W_])' + _trie_pattern(
+        stem.translate(_ACCENT_TABLE) for stem in lexicon.stems | _NUMBER_KEYWORD_STEMS if stem
+    )
+
+
+# Profils régionaux (set_locale_profile) : "mixed" lit tous les systèmes de dizaines
+LOCALE_MIXED = 'mixed'
+LOCALE_FRANCE = 'france'
+LOCALE_BELGIUM = 'belgium'
+LOCALE_SWITZERLAND = 'switzerland'
+
+LOCALE_PROFILES = (LOCALE_MIXED, LOCALE_FRANCE, LOCALE_BELGIUM, LOCALE_SWITZERLAND)
+
+# Variable d'environnement désignant le profil régional chargé à l'import (défaut : "mixed")
+LOCALE_ENV = 'NUMBER_EXTRACT_LOCALE'
+
+# Radicaux des dizaines régionales (septante, septantieme...) admis par chaque profil ;
+# soixante-dix et quatre-vingt restent lus partout (quatre-vingts est aussi belge et genevois)
+_REGIONAL_TENS_STEMS = frozenset({'septant', 'huitant', 'octant', 'nonant'})
+_LOCALE_REGIONAL_TENS: Mapping[str, FrozenSet[str]] = MappingProxyType({
+    LOCALE_MIXED: _REGIONAL_TENS_STEMS,
+    LOCALE_FRANCE: frozenset(),
+    LOCALE_BELGIUM: frozenset({'septant', 'nonant'}),
+    LOCALE_SWITZERLAND: _REGIONAL_TENS_STEMS,
+})
+
+# Dénominateurs lus sur le texte non réécrit : profils sans réécriture des dizaines
+# françaises, et lecteurs de tokens bruts (extract_all, IncrementalExtractor)
+_UNSIMPLIFIED_ORDINAL_SPELLINGS: Mapping[int, Tuple[str, ...]] = MappingProxyType({
+    90: ('quatre vingt dixieme', 'quatre vingt dixiemes'),
+})
+
+# Longueur maximale (en mots) et derniers mots des dénominateurs ordinaux, tous profils confondus
+_ALL_ORDINAL_DENOMINATOR_WORDS = frozenset(
+    tuple(spelling.split())
+    for spellings_by_value in (_ORDINAL_DENOMINATOR_SPELLINGS, _UNSIMPLIFIED_ORDINAL_SPELLINGS,
+                               _ORDINAL_DENOMINATOR_VARIANTS)
+    for spellings in spellings_by_value.values()
+    for spelling in spellings
+)
+_MAX_ORDINAL_DENOMINATOR_WORDS = max(len(words) for words in _ALL_ORDINAL_DENOMINATOR_WORDS)
+_ORDINAL_DENOMINATOR_LAST_WORDS = frozenset(words[-1] for words in _ALL_ORDINAL_DENOMINATOR_WORDS)
+
+
+class _LocaleEngine(NamedTuple):
+    """
+    Moteur compilé pour un profil régional : lexique, règles de normalisation et index dérivés.
+
+    Attributes:
+        locale (str): Nom du profil (voir LOCALE_PROFILES)
+        lexicon (_NumberLexicon): Mots-nombres du profil et leurs index
+        token_kinds (Mapping[str, str]): Nature des tokens de tokenize, par forme normalisée
+        candidate_pattern (re.Pattern): Préfiltre de may_contain_number
+        ordinal_trie (Mapping[str, Any]): Trie des dénominateurs ordinaux (une arête par mot)
+        ordinal_words (Mapping[Tuple[str, ...], int]): Dénominateurs ordinaux par suite de mots
+            ("dix septieme" -> 17), pour la lecture mot à mot
+        simplify_french_tens (bool): Réécrit soixante-dix, quatre-vingt(-dix) en septante,
+            octante, nonante à la normalisation
+    """
+    locale: str
+    lexicon: _NumberLexicon
+    token_kinds: Mapping[str, str]
+    candidate_pattern: re.Pattern
+    ordinal_trie: Mapping[str, Any]
+    ordinal_words: Mapping[Tuple[str, ...], int]
+    simplify_french_tens: bool
+
+
+def _compile_locale_engine(locale: str, snapshot: Optional[Dict[str, Any]] = None) -> _LocaleEngine:
+    """
+    Compile le moteur d'un profil régional.
+
+    Le profil "mixed" garde toutes les formes et la réécriture des dizaines françaises
+    (comportement historique). Les autres ne gardent que leurs dizaines régionales et
+    sautent la réécriture : l'automate de parse_compound_number lit directement
+    "soixante dix" (60 + 10) et "quatre vingt dix" (quatre + vingt, puis + 10).
+
+    Args:
+        locale (str): Nom du profil (voir LOCALE_PROFILES)
+        snapshot (Optional[Dict[str, Any]]): Tables d'un instantané du même profil, à réutiliser
+
+    Returns:
+        _LocaleEngine: Le moteur compilé
+    """
+    excluded_stems = tuple(_REGIONAL_TENS_STEMS - _LOCALE_REGIONAL_TENS[locale])
+    ordinal_spellings: Dict[int, Tuple[str, ...]] = {}
+    for spellings_by_value in (_ORDINAL_DENOMINATOR_SPELLINGS, _UNSIMPLIFIED_ORDINAL_SPELLINGS):
+        for value, spellings in spellings_by_value.items():
+            kept = tuple(spelling for spelling in spellings if not spelling.startswith(excluded_stems))
+            ordinal_spellings[value] = ordinal_spellings.get(value, ()) + kept
+
+    if snapshot is not None:
+        lexicon = _lexicon_from_snapshot(snapshot)
+        candidate_pattern = snapshot['candidate_pattern']
+    else:
+        number_words = {word: value for word, value in _FRENCH_NUMBER_WORDS.items()
+                        if not word.startswith(excluded_stems)}
+        if locale != LOCALE_MIXED:
+            number_words.update(_GLUED_FRENCH_TENS)
+        variants = {word: value for word, value in _NUMBER_WORD_VARIANTS.items()
+                    if _REGIONAL_TENS_VARIANTS.get(word) not in excluded_stems}
+        lexicon = _build_lexicon(number_words, variants, ordinal_spellings)
+        candidate_pattern = _candidate_pattern(lexicon)
+
+    all_spellings = {value: spellings + _ORDINAL_DENOMINATOR_VARIANTS.get(value, ())
+                     for value, spellings in ordinal_spellings.items()}
+    return _LocaleEngine(
+        locale=locale,
+        lexicon=lexicon,
+        token_kinds=MappingProxyType({**dict.fromkeys(lexicon.values, TOKEN_NUMBER_WORD),
+                                      **_TOKEN_KEYWORD_KINDS}),
+        candidate_pattern=re.compile(candidate_pattern),
+        ordinal_trie=_build_token_trie(all_spellings),
+        ordinal_words=MappingProxyType({
+            tuple(spelling.split()): value
+            for value, spellings in all_spellings.items()
+            for spelling in spellings
+        }),
+        simplify_french_tens=locale == LOCALE_MIXED,
+    )
+
+
+def _load_locale_engine() -> _LocaleEngine:
+    """
+    Moteur chargé à l'import : profil NUMBER_EXTRACT_LOCALE, depuis l'instantané
+    NUMBER_EXTRACT_SNAPSHOT s'il a été écrit pour ce profil.
+
+    Un profil inconnu, ou un instantané d'un autre profil, est signalé par un
+    avertissement et ignoré.
+    """
+    locale = os.environ.get(LOCALE_ENV) or LOCALE_MIXED
+    if locale not in LOCALE_PROFILES:
+        warnings.warn(f"profil régional inconnu ignoré : {locale}", RuntimeWarning)
+        locale = LOCALE_MIXED
+    snapshot = _load_engine_snapshot()
+    if snapshot is not None and snapshot.get('locale') != locale:
+        warnings.warn(f"instantané du moteur ignoré (profil {snapshot.get('locale')}, attendu {locale})",
+                      RuntimeWarning)
+        snapshot = None
+    return _compile_locale_engine(locale, snapshot)
+
+
+_ENGINE = _load_locale_engine()
+
+
+def set_locale_profile(locale: str) -> None:
+    """
+    Choisit le profil régional du moteur.
+
+    - "mixed" (défaut) : toutes les dizaines (septante, huitante, octante, nonante,
+      soixante-dix, quatre-vingt) ; les formes françaises sont réécrites en formes
+      simplifiées à la normalisation
+    - "france" : soixante-dix, quatre-vingt, quatre-vingt-dix ; "septante" n'est pas un nombre
+    - "belgium" : septante, nonante, et quatre-vingt
+    - "switzerland" : septante, huitante (octante), nonante, et quatre-vingt
+
+    Hors "mixed", normalize_text garde les formes françaises telles quelles (lues
+    directement par l'automate) : la passe de réécriture est sautée, et le lexique,
+    le correcteur et le préfiltre ne connaissent que les mots du profil.
+
+    Le profil se choisit au démarrage (ou par la variable d'environnement
+    NUMBER_EXTRACT_LOCALE, lue à l'import) : un appel en cours dans un autre fil
+    pendant le changement peut lire un mélange des deux profils. Le cache de
+    résultats est vidé (les clés du cache persistant incluent déjà le profil).
+
+    Args:
+        locale (str): Nom du profil (voir LOCALE_PROFILES)
+
+    Raises:
+        ValueError: Si le profil est inconnu
+    """
+    global _ENGINE
+    if locale not in LOCALE_PROFILES:
+        raise ValueError(f"profil régional inconnu : {locale}")
+    if locale != _ENGINE.locale:
+        _ENGINE = _compile_locale_engine(locale)
+        clear_result_cache()
+
+
+def get_locale_profile() -> str:
+    """
+    Nom du profil régional actif (voir set_locale_profile).
+    """
+    return _ENGINE.locale
+
+
+def may_contain_number(input_text: str) -> bool:
+    """
+    Préfiltre rapide : indique si un texte brut peut contenir un nombre.
+
+    Un seul parcours du texte à la recherche d'un chiffre, de "%", de "/" ou d'un
+    radical de mot numérique, ordinal, de groupe ou d'expression spéciale ; à défaut,
+    les mots d'au moins _FUZZY_MIN_LENGTH lettres sont soumis au correcteur ("quatorse"),
+    sans exiger le contexte numérique de tokenize (une fausse alerte coûte seulement la lecture complète).
+    Sans faux négatif : si la fonction renvoie False, text_to_understanding renvoie
+    "AUCUN CHIFFRE" et text_to_number None.
+
+    Args:
+        input_text (str): Le texte brut
+
+    Returns:
+        bool: False si le texte ne contient certainement aucun nombre
+    """
+    return _may_contain_number_folded(input_text.lower().translate(_ACCENT_TABLE))
+
+
+def _may_contain_number_folded(folded_text: str) -> bool:
+    """
+    may_contain_number sur un texte déjà en minuscules et sans accents.
+    """
+    if _ENGINE.candidate_pattern.search(folded_text) is not None:
+        return True
+    # Mêmes mots que ceux que tokenize soumet au correcteur
+    correctable_words = set(_CORRECTABLE_WORD_PATTERN.findall(folded_text.translate(_SEPARATOR_TABLE)))
+    return any(_ENGINE.lexicon.speller.correct(word) is not None for word in correctable_words)
+
+
+class _NumeralAccumulator:
+    """
+    État de l'automate pour un seul nombre bien formé ("deux cent mille trois").
+
+    Attributes:
+        state (str): Classe du dernier token accepté
+        total_value (int): Partie fermée par une échelle (mille, million...)
+        current_value (int): Groupe courant (< 1000)
+        last_scale (int): Dernière échelle appliquée
+    """
+
+    __slots__ = ('state', 'total_value', 'current_value', 'last_scale')
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Revient à l'état initial (aucun token accepté).
+        """
+        self.state = _START
+        self.total_value = 0
+        self.current_value = 0
+        self.last_scale = 0
+
+    @property
+    def value(self) -> int:
+        """
+        Valeur du nombre accumulé (0 si aucun token accepté).
+        """
+        return self.total_value + self.current_value
+
+    def push(self, token_value: int, token_class: Optional[str] = None) -> str:
+        """
+        Applique un mot numérique au nombre courant.
+
+        Args:
+            token_value (int): La valeur du mot numérique
+            token_class (Optional[str]): Sa classe si elle est connue (index _ENGINE.lexicon.classes)
+
+        Returns:
+            str: L'action de la table ; _COORDINATE (le token commence un nouveau nombre)
+                 et _REJECT (séquence mal formée) laissent l'état inchangé
+        """
+        if token_class is None:
+            token_class = _number_word_class(token_value)
+        action = _COMPOUND_TRANSITIONS[self.state, token_class]
+
+        if action == _ADD:
+            self.current_value += token_value
+        elif action == _MULTIPLY_HUNDRED:
+            if self.current_value >= 100:  # "deux cent trois cent"
+                return _REJECT
+            self.current_value = (self.current_value or 1) * 100
+        elif action == _APPLY_SCALE:
+            if token_value == self.last_scale:  # "mille mille"
+                return _REJECT
+            if self.last_scale and token_value > self.last_scale:  # "mille milliards"
+                self.total_value = (self.total_value + self.current_value) * token_value
+            else:
+                self.total_value += (self.current_value or 1) * token_value
+            self.current_value = 0
+            self.last_scale = token_value
+        elif action == _QUATRE_VINGT:
+            self.current_value += 76  # le 4 déjà compté devient 80
+            token_class = _TENS_VIG
+        elif action == _TENS_DIX:
+            self.current_value += token_value
+            token_class = _TENS
+        else:  # _COORDINATE, _REJECT
+            return action
+
+        self.state = token_class
+        return action
+
+
 def parse_compound_number(token_list: List[str], number_words: Dict[str, int]) -> Optional[int]:
     """
     Parse un nombre composé français complexe.
     
+    Automate à états dirigé par une table de transitions (_COMPOUND_TRANSITIONS) :
+    chaque token est classé (unité, dizaine, cent, échelle...) puis l'action associée
+    au couple (état, classe) est appliquée, en un seul passage et en O(1) par token.
+
     Gère :
-    - Formes belges/suisses (septante, octante, nonante) en priorité
-    - Formes françaises traditionnelles (soixante-dix, quatre-vingts) en fallback
+    - Formes belges/suisses (septante, octante, nonante)
+    - Formes françaises traditionnelles (soixante-dix, quatre-vingts)
     - Grandes unités (millions, milliers, centaines)
-    - Composition additive et multiplicative
+    - Composition additive et multiplicative ("mille deux cent millions")
+    - Coordination de nombres complets ("un et un" -> 2)
+    - Rejet des séquences mal formées ("cent cent", "vingt cent", "mille mille")
     
     Exemples :
     - "vingt-trois" -> 23
@@ -765,78 +3624,1117 @@ def parse_compound_number(token_list: List[str], number_words: Dict[str, int]) -
         number_words (Dict[str, int]): Dictionnaire des mots numériques
         
     Returns:
-        Optional[int]: Le nombre composé parsé ou None
+        Optional[int]: Le nombre composé parsé ou None (absent ou mal formé)
     """
     
-    total_value = 0
-    current_value = 0
-    
-    token_index = 0
-    while token_index < len(token_list):
-        current_token = token_list[token_index]
-        
-        # Priorité aux formes belges/suisses simplifiées
-        if current_token == 'septante':
-            current_value += 70
-        elif current_token in ['huitante', 'octante']:
-            current_value += 80
-        elif current_token == 'nonante':
-            current_value += 90
-        elif current_token in number_words:
-            token_value = number_words[current_token]
-            
-            # Gestion des grandes unités (milliards, millions, milliers)
-            if token_value >= 1000000000:  # Milliards
-                total_value += (current_value or 1) * token_value
-                current_value = 0
-            elif token_value >= 1000000:  # Millions
-                total_value += (current_value or 1) * token_value
-                current_value = 0
-            elif token_value >= 1000:  # Milliers
-                total_value += (current_value or 1) * token_value
-                current_value = 0
-            elif token_value == 100:  # Centaines
-                current_value = (current_value or 1) * 100
-            else:  # Unités et dizaines
-                current_value += token_value
-        
-        # Gestion des formes françaises traditionnelles (fallback)
-        elif current_token == 'soixante' and token_index + 1 < len(token_list) and token_list[token_index + 1] == 'dix':
-            # "soixante dix" -> 70 (si "septante" n'a pas été utilisé)
-            base_value = 70
-            token_index += 1  # Skip "dix"
-            
-            # Vérification d'un nombre suivant (soixante dix sept)
-            if token_index + 1 < len(token_list) and token_list[token_index + 1] in number_words:
-                next_value = number_words[token_list[token_index + 1]]
-                if next_value < 10:  # soixante dix un, soixante dix deux, etc.
-                    current_value += base_value + next_value
-                    token_index += 1
-                else:
-                    current_value += base_value
+    coordinated_value = 0   # Somme des nombres complets précédents ("un et un")
+    accumulator = _NumeralAccumulator()
+    # Classes précalculées pour le lexique partagé ; calculées depuis la valeur sinon
+    word_classes = _ENGINE.lexicon.classes if number_words is _ENGINE.lexicon.values else {}
+
+    for current_token in token_list:
+        token_value = number_words.get(current_token)
+        if token_value is None:
+            continue  # Connecteurs et mots non numériques ignorés
+
+        token_class = word_classes.get(current_token)
+        action = accumulator.push(token_value, token_class)
+        if action == _COORDINATE:
+            coordinated_value += accumulator.value
+            accumulator.reset()
+            action = accumulator.push(token_value, token_class)
+        if action == _REJECT:
+            return None
+
+    final_result = coordinated_value + accumulator.value
+    return final_result if final_result > 0 else None
+
+
+class IncrementalExtractor:
+    """
+    Lecture mot à mot d'un énoncé qui s'allonge (transcription vocale en direct).
+
+    Chaque appel à append ne traite que les mots ajoutés : le nombre est accumulé par
+    le même automate que parse_compound_number (partie fermée total_value, groupe
+    courant current_value), le signe, le pourcentage et la fraction sont des états
+    mis à jour au passage. Le coût est O(1) amorti par mot, au lieu de ré-analyser
+    tout l'énoncé à chaque transcription partielle.
+
+    Lecture (mêmes résultats que text_to_understanding sur les énoncés parlés courants) :
+    - mots-nombres accumulés ("deux", "deux cent", "deux cent quatre vingt" -> 280) ;
+      une séquence mal formée ("cent cent") n'a pas de valeur
+    - nombre en chiffres : prioritaire sur les mots
+    - "moins" (sauf "moins de") et "-" devant des chiffres : valeur négative
+    - "%", "pourcent", "pour cent" : pourcentage
+    - "sur" ou "/" : fraction, le dénominateur s'accumule ("un sur quatre vingt")
+    - dénominateur ordinal ("trois quarts", "un dix-septième") ou groupe ("trois
+      douzaines") : l'expression est complète, la suite est ignorée
+    - "aucun", "rien", "tout", "presque tout"... : 0%, 100%, 95% sans nombre en chiffres
+    - "pour cent" après une expression complète : pourcentage des mots-nombres qui la
+      précèdent ("deux et demi pour cent" -> 2%, "la moitié pour cent" -> 50%)
+    - "virgule" : la suite de l'énoncé est ignorée ("cinq virgule cinq pour cent" -> 5)
+    - "plus" devant un nombre écrit : nombre + 1 ("plus de mille" -> 1001)
+    - le numérateur de "sur" est la suite de mots-nombres qui le précède ("vingt ans,
+      trois sur quatre" -> 75%)
+
+    Une transcription partielle qui corrige des mots déjà envoyés se relit après reset.
+
+    Exemple :
+        extractor = IncrementalExtractor()
+        extractor.append("moins deux")     # value=-2
+        extractor.append("cent")           # value=-200
+        extractor.append("pour cent")      # value=-200, is_percent=True
+        extractor.finalize()               # résultat final, puis remise à zéro
+    """
+
+    __slots__ = ('_accumulator', '_denominator', '_history', '_coordinated_value', '_has_number', '_rejected',
+                 '_explicit_value', '_negative', '_pending_sign', '_is_percent',
+                 '_decimal_part', '_numerator', '_complete', '_special_words', '_previous_word',
+                 '_left_context', '_held_text', '_run', '_run_interrupted', '_approximation',
+                 '_window', '_complete_percent')
+
+    def __init__(self):
+        self._accumulator = _NumeralAccumulator()
+        self._denominator = _NumeralAccumulator()
+        # Suite de mots-nombres depuis le dernier mot ordinaire (numérateur de "sur")
+        self._run = _NumeralAccumulator()
+        # Derniers mots-nombres et valeur du groupe courant avant chacun ("dix" de "dix-septième")
+        self._history: deque = deque(maxlen=_MAX_ORDINAL_DENOMINATOR_WORDS - 1)
+        # Derniers mots-nombres, articles exceptés, depuis le dernier mot ordinaire (fenêtre
+        # de _number_window devant "pour cent")
+        self._window: deque = deque(maxlen=_MAX_NUMBER_WINDOW)
+        self._special_words: set = set()
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Oublie l'énoncé en cours (sans produire de résultat).
+        """
+        self._accumulator.reset()
+        self._denominator.reset()
+        self._run.reset()
+        self._run_interrupted = False
+        self._approximation = 0
+        self._history.clear()
+        self._window.clear()
+        self._special_words.clear()
+        self._coordinated_value = 0
+        self._has_number = False
+        self._rejected = False
+        self._explicit_value: Optional[int] = None
+        self._negative = False
+        self._pending_sign: Optional[str] = None    # "moins" ou "-" en attente du mot suivant
+        self._is_percent = False
+        self._decimal_part = False
+        self._numerator: Optional[int] = None       # fixé par "sur" ou "/"
+        self._complete: Optional[UnderstandingResult] = None  # ordinal ou groupe (sans signe)
+        self._complete_percent: Optional[int] = None  # "deux et demi pour cent" -> 2
+        self._previous_word = ''
+        self._left_context = _NO_CONTEXT   # contexte du mot suivant (correction des fautes)
+        self._held_text = ''         # dernier mot, à corriger ou non selon le mot suivant
+
+    def append(self, text: str) -> UnderstandingResult:
+        """
+        Ajoute des mots à l'énoncé (un mot ou plus, jamais un morceau de mot).
+
+        Args:
+            text (str): Les mots ajoutés depuis l'appel précédent
+
+        Returns:
+            UnderstandingResult: Le résultat courant de l'énoncé
+        """
+        self._read(text, True)
+        return self.result
+
+    def finalize(self) -> UnderstandingResult:
+        """
+        Termine l'énoncé : renvoie son résultat final et remet l'extracteur à zéro.
+
+        Returns:
+            UnderstandingResult: Le résultat de l'énoncé complet
+        """
+        self._read('', False)
+        final_result = self.result
+        self.reset()
+        return final_result
+
+    def _read(self, text: str, hold_last_word: bool) -> None:
+        """
+        Lit les tokens d'un morceau d'énoncé, précédé du mot laissé en attente.
+
+        Args:
+            text (str): Les mots ajoutés
+            hold_last_word (bool): Garde en attente un dernier mot qui ne serait corrigé
+                que par le mot suivant ("cinquente" de "cinquente pour cent")
+        """
+        if self._held_text:
+            text = self._held_text + ' ' + text
+        held_tail: Optional[List[Token]] = [] if hold_last_word else None
+        known_words = _ENGINE.lexicon.speller.known_words
+        for token in _iter_tokens(text, left_context=self._left_context, held_tail=held_tail):
+            if self._decimal_part:  # après "virgule", comme la normalisation
+                break
+            if token.kind != TOKEN_CONNECTOR:
+                self._left_context = _left_correction_context(token, known_words)
+            if token.kind == TOKEN_OTHER and not token.text[0].isalnum():
+                self._interrupt_run()
+                continue
+            self._push(token)
+            self._previous_word = token.text
+        self._held_text = text[held_tail[0].start:held_tail[-1].end] if held_tail else ''
+
+    @property
+    def result(self) -> UnderstandingResult:
+        """
+        Résultat de l'énoncé lu jusqu'ici (un "moins" final compte comme signe).
+        """
+        sign = -1 if self._negative or self._pending_sign == 'moins' else 1
+
+        if self._complete is not None:
+            if self._complete_percent is not None:  # find_percentages passe avant les fractions
+                return UnderstandingResult(sign * self._complete_percent, True, sign, 'percentages', None, False)
+            return self._complete._replace(value=sign * self._complete.value, sign=sign)
+        if self._numerator is not None and self._denominator.state != _START and self._denominator.value:
+            return _fraction_result(self._numerator, self._denominator.value, sign, 'word_fraction')
+
+        # Indicateurs de pourcentage de text_to_understanding ("sur" sans dénominateur, "aucun", "tiers"...)
+        value = self._number_value()
+        is_percent = self._is_percent or 'indicator' in self._special_words
+        if self._explicit_value is not None:
+            return UnderstandingResult(sign * value, is_percent, sign, 'explicit_numbers', None, False)
+        if value is not None and self._approximation == 1:  # "plus de", comme parse_numeric_sequence
+            value += 1
+        if value is not None and self._is_percent:
+            return UnderstandingResult(sign * value, True, sign, 'percentages', None, False)
+
+        special_value = self._special_value()
+        if special_value is not None:
+            return UnderstandingResult(sign * special_value, is_percent, sign, 'special_expressions', None, False)
+        if value is None:
+            return _NO_NUMBER_RESULT
+        return UnderstandingResult(sign * value, is_percent, sign, 'written_numbers', None, False)
+
+    def _number_value(self) -> Optional[int]:
+        """
+        Nombre lu jusqu'ici (numérateur d'une fraction en cours compris), ou None.
+        """
+        if self._numerator is not None:
+            return self._numerator
+        if self._explicit_value is not None:
+            return self._explicit_value
+        if not self._has_number or self._rejected:
+            return None
+        return self._coordinated_value + self._accumulator.value
+
+    def _special_value(self) -> Optional[int]:
+        """
+        Valeur des expressions spéciales vues (priorités de find_special_expressions), ou None.
+        """
+        special_words = self._special_words
+        if 'almost_nothing' in special_words:
+            return 5
+        # Mot de zéro en fin d'énoncé : rien ne peut plus l'annuler
+        if 'nothing' in special_words or self._previous_word in _ZERO_WORDS:
+            return 0
+        if 'approximation' in special_words:
+            return 95 if 'almost_all' in special_words else None
+        return 100 if 'all' in special_words else None
+
+    def _push(self, token: Token) -> None:
+        """
+        Applique un token à l'état de l'énoncé.
+        """
+        word = token.text
+        if word in _DECIMAL_SEPARATOR_WORDS:
+            self._decimal_part = True
+            return
+        previous_word = self._previous_word
+        # Un mot d'approximation compte s'il est suivi d'un autre mot (extract_numeric_tokens)
+        if previous_word in _APPROXIMATION_MODIFIERS:
+            self._approximation = _APPROXIMATION_MODIFIERS[previous_word]
+
+        # Signe en attente : "moins de" n'est pas un signe ("moins deux" l'est), "-" l'est devant des chiffres
+        if self._pending_sign is not None:
+            if self._pending_sign == 'moins':
+                self._negative = self._negative or not (word.startswith('de') and not word.startswith('deu'))
+            elif token.kind == TOKEN_DIGITS:
+                self._negative = True
+            self._pending_sign = None
+        if token.kind == TOKEN_SIGN:
+            self._pending_sign = word
+            return
+
+        self._push_special(word, previous_word)
+
+        # Premier "pour cent" après une expression complète : pourcentage des mots-nombres
+        # qui la précèdent (fenêtre de find_percentages)
+        is_percent_word = word == 'pourcent' or (previous_word == 'pour' and word == 'cent')
+        if is_percent_word and self._complete is not None and not self._is_percent:
+            self._complete_percent = parse_compound_number(list(self._window), _ENGINE.lexicon.values)
+
+        # "pour" n'est un marqueur qu'avec "cent" juste après
+        if previous_word == 'pour' and word in ('cent', 'cents'):
+            self._is_percent = True
+            return
+        if token.kind == TOKEN_PERCENT:
+            self._is_percent = True
+            return
+
+        if self._complete is not None:
+            return
+        if token.kind == TOKEN_FRACTION_OPERATOR:
+            if self._numerator is None:
+                interrupted_run = self._run_interrupted and self._run.state != _START
+                self._numerator = self._run.value if interrupted_run else self._number_value()
+            return
+        if self._numerator is None and self._explicit_value is None and self._read_complete_expression(word):
+            return
+
+        if self._numerator is not None:
+            self._push_number(token, self._denominator)
+        elif self._explicit_value is None:
+            self._push_number(token, self._accumulator)
+
+    def _push_special(self, word: str, previous_word: str) -> None:
+        """
+        Note les mots des expressions spéciales ("rien", "presque tout", "pas de").
+        """
+        special_words = self._special_words
+        if word in _PERCENTAGE_INDICATOR_WORDS or 'ieme' in word or word in _ORDINAL_VARIANT_INDICATOR_WORDS:
+            special_words.add('indicator')
+        # Un mot de zéro compte sauf s'il est suivi de "de" / "du" ("aucun des deux")
+        if previous_word in _ZERO_WORDS and not word.startswith(_ZERO_EXCLUDED_FOLLOWERS):
+            special_words.add('nothing')
+        if previous_word == 'pas' and word in _NONE_FOLLOWERS:
+            special_words.add('nothing')
+        if previous_word == 'presque' and word in _NOTHING_WORDS:
+            special_words.add('almost_nothing')
+        if previous_word in _APPROXIMATION_WORDS and word in _ALL_WORDS:
+            special_words.add('almost_all')
+        if word in _APPROXIMATION_WORDS:
+            special_words.add('approximation')
+        elif word in _TOTAL_WORDS:
+            special_words.add('all')
+        elif word in _ZERO_WORDS:
+            special_words.add('zero_word')
+
+    def _push_number(self, token: Token, accumulator: _NumeralAccumulator) -> None:
+        """
+        Ajoute un mot-nombre ou des chiffres au numérateur ou au dénominateur.
+        """
+        is_numerator = accumulator is self._accumulator
+        if token.kind == TOKEN_DIGITS:
+            digits_value = _decimal_to_int(token.text)
+            if digits_value is None:
+                return
+            if is_numerator:
+                self._explicit_value = digits_value
+            elif accumulator.state == _START:
+                accumulator.current_value, accumulator.state = digits_value, _SCALE
+            return
+
+        token_value = _ENGINE.lexicon.values.get(token.text)
+        if token_value is None:
+            if is_numerator and token.kind == TOKEN_OTHER:
+                self._interrupt_run(token.text)
+            return
+        if is_numerator:
+            self._window.append(token.text)
+            self._history.append((token.text, accumulator.value if accumulator.state != _START else None))
+            self._has_number = True
+            if self._rejected:
+                return
+
+        token_class = _ENGINE.lexicon.classes.get(token.text)
+        action = accumulator.push(token_value, token_class)
+        if action == _COORDINATE and is_numerator:
+            self._coordinated_value += accumulator.value
+            accumulator.reset()
+            action = accumulator.push(token_value, token_class)
+        if action == _REJECT and is_numerator:
+            self._rejected = True
+        # Une suite mal formée à elle seule laisse le numérateur à l'énoncé entier
+        if is_numerator and self._run.push(token_value, token_class) in (_COORDINATE, _REJECT):
+            self._run_interrupted = False
+
+    def _interrupt_run(self, word: str = '') -> None:
+        """
+        Un mot ordinaire ou une ponctuation termine la suite de mots-nombres en cours
+        (un article ou un mot d'approximation laisse la fenêtre de "pour cent" ouverte).
+        """
+        if not _is_number_window_token(word, _ENGINE.lexicon.values):
+            self._window.clear()
+        if self._has_number:
+            self._run.reset()
+            self._run_interrupted = True
+
+    def _read_complete_expression(self, word: str) -> bool:
+        """
+        Lit un dénominateur ordinal ("dix" + "septieme") ou un groupe ("trois douzaines")
+        qui termine l'expression.
+
+        Returns:
+            bool: True si l'expression est formée
+        """
+        group_base = _group_base(word)
+        if group_base is not None:
+            multiplier = self._accumulator.value if self._accumulator.state != _START else 1
+            self._complete = UnderstandingResult((multiplier or 1) * group_base, False, 1, 'fractions', None, False)
+            return True
+        if word not in _ORDINAL_DENOMINATOR_LAST_WORDS:
+            return False
+        ordinal_words = _ENGINE.ordinal_words
+
+        # Plus longue suite connue parmi les derniers mots-nombres, précédée d'un numérateur
+        # ("un dix-septième" : 1/17 ; "dix-septième" seul : 10/7 comme text_to_understanding)
+        history = list(self._history)
+        for prefix_length in range(len(history), 0, -1):
+            prefix = history[len(history) - prefix_length:]
+            denominator = ordinal_words.get(tuple(entry[0] for entry in prefix) + (word,))
+            if denominator is not None and prefix[0][1] is not None:
+                self._complete = _fraction_percent(prefix[0][1] or 1, denominator)
+                return True
+        denominator = ordinal_words.get((word,))
+        if denominator is None:
+            return False
+        numerator = self._accumulator.value if self._accumulator.state != _START else 1
+        self._complete = _fraction_percent(numerator or 1, denominator)
+        return True
+
+
+def _fraction_percent(numerator: int, denominator: int) -> UnderstandingResult:
+    """
+    Pourcentage arrondi d'une fraction ordinale (étape 'fractions', sans fraction exacte).
+    """
+    return UnderstandingResult(round(numerator / denominator * 100), True, 1, 'fractions', None, False)
+
+
+# Natures des expressions produites par extract_all
+MATCH_KINDS = ('number', 'percent', 'fraction')
+
+# Connecteurs internes à un nombre écrit ("vingt et un", "vingt-deux"), et longueur
+# maximale d'une suite de connecteurs entre deux mots ("vingt-et-un" : "-", "et", "-")
+_NUMERAL_CONNECTORS = frozenset({'et', '-'})
+_MAX_NUMERAL_CONNECTORS = 3
+
+# Marqueurs de pourcentage placés après le nombre ("pour cent" est traité à part)
+_PERCENT_SUFFIXES = frozenset({'%', 'pourcent', 'pourcents'})
+
+# Opérateurs de fraction placés entre deux nombres ("3/4", "trois sur quatre")
+_FRACTION_OPERATORS = frozenset({'/', 'sur'})
+
+# Moitiés sans numérateur ("la moitié", "demi")
+_HALF_WORDS = frozenset(_ORDINAL_DENOMINATOR_SPELLINGS[2] + _ORDINAL_DENOMINATOR_VARIANTS[2])
+
+
+class NumberMatch(NamedTuple):
+    """
+    Expression numérique trouvée par extract_all.
+
+    Attributes:
+        value (int): La valeur (pourcentage arrondi pour une fraction, comme text_to_understanding)
+        kind (str): 'number', 'percent' ou 'fraction' (voir MATCH_KINDS)
+        start (int): Position du premier caractère dans le texte original
+        end (int): Position qui suit le dernier caractère (text[start:end])
+        text (str): Le texte original de l'expression
+    """
+    value: int
+    kind: str
+    start: int
+    end: int
+    text: str
+
+
+class _SpanTokenStream:
+    """
+    Tokens d'un texte (tokenize) avec leurs positions d'origine, lus à la demande.
+
+    La ponctuation est ignorée. Seuls les quelques tokens d'anticipation demandés
+    par peek sont conservés : la mémoire ne dépend pas de la taille du texte.
+    """
+
+    __slots__ = ('_tokens', '_lookahead')
+
+    def __init__(self, text: str):
+        self._tokens = _iter_tokens(text, correct_after_digits=True)
+        self._lookahead: deque = deque()
+
+    def peek(self, offset: int = 0) -> Optional[Token]:
+        """
+        Args:
+            offset (int): Rang du token à partir du token courant
+
+        Returns:
+            Optional[Token]: Le token (forme minuscule sans accents et corrigée), None en fin de texte
+        """
+        while len(self._lookahead) <= offset:
+            token = next(self._tokens, None)
+            if token is None:
+                return None
+            if token.kind == TOKEN_OTHER and not token.text[0].isalnum():
+                continue
+            self._lookahead.append(token)
+        return self._lookahead[offset]
+
+    def advance(self, count: int = 1) -> None:
+        """
+        Consomme les count premiers tokens.
+        """
+        for _ in range(count):
+            self._lookahead.popleft()
+
+
+def extract_all(text: str) -> Iterator[NumberMatch]:
+    """
+    Trouve toutes les expressions numériques d'un document, en un seul parcours paresseux.
+
+    Chaque chiffre, nombre écrit, fraction ou pourcentage produit un NumberMatch dont
+    les positions se rapportent au texte original. Le texte n'est ni normalisé ni
+    découpé en entier : la mémoire reste bornée quelle que soit sa taille.
+
+    Exemples :
+    - "vingt-deux pommes et 3/4 des poires" -> 22 (number), 75 (fraction)
+    - "moins 5, puis cinquante pour cent" -> -5 (number), 50 (percent)
+
+    Args:
+        text (str): Le document à analyser
+
+    Returns:
+        Iterator[NumberMatch]: Les expressions, dans l'ordre du texte
+    """
+    number_words = _ENGINE.lexicon.values
+    stream = _SpanTokenStream(text)
+    while True:
+        token = stream.peek()
+        if token is None:
+            return
+        word, start = token.text, token.start
+
+        # Signe : "moins" (hors "moins de") ou tiret détaché d'un mot devant des chiffres ("-5", pas "10-5")
+        sign = 1
+        if token.kind == TOKEN_SIGN:
+            next_token = stream.peek(1)
+            if next_token is None:
+                is_sign = False
+            elif word == 'moins':
+                is_sign = _starts_number(next_token.text, number_words)
             else:
-                current_value += base_value
-        
-        elif current_token == 'quatre' and token_index + 1 < len(token_list) and token_list[token_index + 1] in ['vingt', 'vingts']:
-            # "quatre vingt" -> 80 (si "huitante/octante" n'a pas été utilisé)
-            base_value = 80
-            token_index += 1  # Skip "vingt"
-            
-            # Vérification d'un nombre suivant
-            if token_index + 1 < len(token_list) and token_list[token_index + 1] in number_words:
-                next_value = number_words[token_list[token_index + 1]]
-                if next_value <= 19:  # quatre vingt dix, quatre vingt un, etc.
-                    current_value += base_value + next_value
-                    token_index += 1
-                else:
-                    current_value += base_value
-            elif token_index + 1 < len(token_list) and token_list[token_index + 1] == 'dix':  # quatre vingt dix
-                current_value += 90
-                token_index += 1
+                is_sign = next_token.text[0].isdigit()
+            if is_sign:
+                sign = -1
+                stream.advance()
+        elif not _starts_number(word, number_words):
+            stream.advance()
+            continue
+
+        expression = _read_number_expression(stream, number_words)
+        if expression is None:
+            stream.advance()
+            continue
+        value, kind, end = expression
+        yield NumberMatch(sign * value, kind, start, end, text[start:end])
+
+
+def _starts_number(word: str, number_words: Dict[str, int]) -> bool:
+    """
+    Indique si un token peut commencer une expression numérique.
+    """
+    return (word[0].isdigit() or word in number_words or word in _HALF_WORDS
+            or _group_base(word) is not None)
+
+
+def _read_number_expression(stream: _SpanTokenStream,
+                            number_words: Dict[str, int]) -> Optional[Tuple[int, str, int]]:
+    """
+    Lit l'expression numérique qui commence au token courant (rien n'est consommé sinon).
+
+    Args:
+        stream (_SpanTokenStream): Les tokens du document
+        number_words (Dict[str, int]): Dictionnaire des mots numériques
+
+    Returns:
+        Optional[Tuple[int, str, int]]: (valeur, nature, fin dans le texte original) ou None
+    """
+    numeral = _read_numeral(stream, number_words)
+    if numeral is None:
+        token = stream.peek()
+        word, end = token.text, token.end
+        if word in _HALF_WORDS:
+            stream.advance()
+            return 50, 'fraction', end
+        base_value = _group_base(word)
+        if base_value is not None:
+            stream.advance()
+            return base_value, 'number', end
+        return None
+
+    value, end = numeral
+    token = stream.peek()
+    if token is None:
+        return value, 'number', end
+    word, token_end = token.text, token.end
+
+    # Pourcentages : "50%", "cinquante pourcent", "cinquante pour cent"
+    if word in _PERCENT_SUFFIXES:
+        stream.advance()
+        return value, 'percent', token_end
+    if word == 'pour':
+        next_token = stream.peek(1)
+        if next_token is not None and next_token.text in ('cent', 'cents'):
+            stream.advance(2)
+            return value, 'percent', next_token.end
+
+    # Fractions explicites : "3/4", "trois sur quatre"
+    if word in _FRACTION_OPERATORS:
+        next_token = stream.peek(1)
+        if next_token is not None and (next_token.text[0].isdigit() or next_token.text in number_words):
+            stream.advance()
+            denominator = _read_numeral(stream, number_words)
+            if denominator is not None and denominator[0] > 0:
+                return int(round(value / denominator[0] * 100)), 'fraction', denominator[1]
+            return value, 'number', end
+
+    # Fractions ordinales : "trois quarts", "un quatre-vingtième"
+    ordinal = _match_ordinal_denominator(stream)
+    if ordinal is not None:
+        denominator_value, token_count, ordinal_end = ordinal
+        stream.advance(token_count)
+        return int(round(value / denominator_value * 100)), 'fraction', ordinal_end
+
+    # Groupes : "trois douzaines"
+    base_value = _group_base(word)
+    if base_value is not None:
+        stream.advance()
+        return value * base_value, 'number', token_end
+
+    return value, 'number', end
+
+
+def _read_numeral(stream: _SpanTokenStream, number_words: Dict[str, int]) -> Optional[Tuple[int, int]]:
+    """
+    Lit un nombre en chiffres ou un nombre écrit bien formé à partir du token courant.
+
+    Le nombre écrit s'arrête au premier token que l'automate de parse_compound_number
+    coordonne ou rejette : "un et un" donne deux nombres.
+
+    Args:
+        stream (_SpanTokenStream): Les tokens du document
+        number_words (Dict[str, int]): Dictionnaire des mots numériques
+
+    Returns:
+        Optional[Tuple[int, int]]: (valeur, fin dans le texte original) ou None (rien n'est consommé)
+    """
+    token = stream.peek()
+    word, end = token.text, token.end
+    if word[0].isdigit():
+        value = _decimal_to_int(word)
+        if value is None:
+            return None
+        stream.advance()
+        return value, end
+
+    token_value = number_words.get(word)
+    if token_value is None:
+        return None
+    word_classes = _ENGINE.lexicon.classes if number_words is _ENGINE.lexicon.values else {}
+    accumulator = _NumeralAccumulator()
+    accumulator.push(token_value, word_classes.get(word))
+    stream.advance()
+
+    while True:
+        token = stream.peek()
+        if token is None:
+            break
+        offset = 0
+        while token is not None and token.text in _NUMERAL_CONNECTORS and offset < _MAX_NUMERAL_CONNECTORS:
+            offset += 1
+            token = stream.peek(offset)
+        if token is None:
+            break
+        token_value = number_words.get(token.text)
+        if token_value is None:
+            break
+        # "un quatre-vingtième" : le dénominateur multi-mots n'appartient pas au numérateur
+        if offset == 0 and _match_ordinal_denominator(stream) is not None:
+            break
+        if accumulator.push(token_value, word_classes.get(token.text)) in (_COORDINATE, _REJECT):
+            break
+        stream.advance(offset + 1)
+        end = token.end
+
+    return accumulator.value, end
+
+
+def _match_ordinal_denominator(stream: _SpanTokenStream) -> Optional[Tuple[int, int, int]]:
+    """
+    Cherche le plus long dénominateur ordinal qui commence au token courant.
+
+    Returns:
+        Optional[Tuple[int, int, int]]: (dénominateur, nombre de tokens, fin dans le texte original) ou None
+    """
+    ordinal_trie = node = _ENGINE.ordinal_trie
+    longest_match = None
+    offset = 0
+    while True:
+        token = stream.peek(offset)
+        if token is None:
+            break
+        offset += 1
+        if token.text == '-' and node is not ordinal_trie:
+            continue  # "dix-septième"
+        node = node.get(token.text)
+        if node is None:
+            break
+        if _TRIE_VALUE in node:
+            longest_match = (node[_TRIE_VALUE], offset, token.end)
+    return longest_match
+
+
+# Formats d'entrée/sortie reconnus par extract_stream et la ligne de commande
+STREAM_FORMATS = ('text', 'csv', 'jsonl')
+
+
+def extract_stream(input_file: TextIO, output_file: TextIO, input_format: str = 'text',
+                   column: Union[int, str] = 0, field: str = 'text', result_name: str = 'result',
+                   has_header: bool = True, chunk_size: int = 1000, flush_every: int = 10000) -> int:
+    """
+    Analyse un flux ligne par ligne et écrit chaque entrée accompagnée de son résultat.
+
+    La mémoire utilisée est constante : les lignes sont lues et traitées par paquets de
+    chunk_size (avec déduplication dans le paquet), chaque paquet est écrit d'un bloc et
+    la sortie est vidée toutes les flush_every entrées.
+
+    Formats :
+    - "text" : une entrée par ligne, sortie "entrée<TAB>résultat"
+    - "csv" : la colonne column est analysée, une colonne result_name est ajoutée
+    - "jsonl" : le champ field de chaque objet est analysé, un champ result_name est ajouté
+
+    Args:
+        input_file (TextIO): Le flux d'entrée
+        output_file (TextIO): Le flux de sortie
+        input_format (str): "text", "csv" ou "jsonl"
+        column (Union[int, str]): Colonne CSV analysée (index ou nom si has_header)
+        field (str): Champ JSON analysé
+        result_name (str): Nom de la colonne ou du champ ajouté
+        has_header (bool): Le CSV commence par une ligne d'en-tête
+        chunk_size (int): Nombre d'entrées par paquet
+        flush_every (int): Nombre d'entrées entre deux vidages de la sortie
+
+    Returns:
+        int: Le nombre d'entrées traitées
+
+    Raises:
+        ValueError: Format inconnu, colonne CSV introuvable ou taille de paquet invalide
+    """
+    if input_format not in STREAM_FORMATS:
+        raise ValueError(f"format inconnu : {input_format}")
+    if chunk_size <= 0:
+        raise ValueError("chunk_size doit être strictement positif")
+
+    if input_format == 'csv':
+        records: Iterator[Any] = csv.reader(input_file)
+        column_index = column if isinstance(column, int) else None
+        if has_header:
+            header = next(records, None)
+            if header is None:
+                return 0
+            if column_index is None:
+                if column not in header:
+                    raise ValueError(f"colonne introuvable : {column}")
+                column_index = header.index(column)
+            _write_csv_rows(output_file, [header + [result_name]])
+        elif column_index is None:
+            raise ValueError("sans en-tête, la colonne CSV doit être un index")
+        extract_text: Callable[[Any], str] = (
+            lambda row: row[column_index] if column_index < len(row) else ''
+        )
+    elif input_format == 'jsonl':
+        records = (json.loads(line) for line in input_file if line.strip())
+        extract_text = lambda record: _json_field_text(record, field)
+    else:
+        records = (line.rstrip('\r\n') for line in input_file)
+        extract_text = lambda line: line
+
+    processed_count = 0
+    unflushed_count = 0
+    chunk = list(islice(records, chunk_size))
+    while chunk:
+        results = text_to_understanding_many(extract_text(record) for record in chunk)
+
+        if input_format == 'csv':
+            _write_csv_rows(output_file, [row + [result] for row, result in zip(chunk, results)])
+        elif input_format == 'jsonl':
+            output_file.write(''.join(
+                json.dumps(_with_result(record, result_name, result), ensure_ascii=False) + '\n'
+                for record, result in zip(chunk, results)
+            ))
+        else:
+            output_file.write(''.join(f"{line}\t{result}\n" for line, result in zip(chunk, results)))
+
+        processed_count += len(chunk)
+        unflushed_count += len(chunk)
+        if unflushed_count >= flush_every:
+            output_file.flush()
+            unflushed_count = 0
+        chunk = list(islice(records, chunk_size))
+
+    output_file.flush()
+    return processed_count
+
+
+def _write_csv_rows(output_file: TextIO, rows: List[List[str]]) -> None:
+    """
+    Écrit des lignes CSV en un seul bloc.
+
+    Args:
+        output_file (TextIO): Le flux de sortie
+        rows (List[List[str]]): Les lignes à écrire
+    """
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    output_file.write(buffer.getvalue())
+
+
+def _json_field_text(record: Any, field: str) -> str:
+    """
+    Texte d'un champ d'objet JSON ("" si absent ou si la ligne n'est pas un objet).
+
+    Args:
+        record (Any): L'objet JSON décodé
+        field (str): Le nom du champ
+
+    Returns:
+        str: Le texte à analyser
+    """
+    if not isinstance(record, dict):
+        return ''
+    value = record.get(field)
+    return '' if value is None else str(value)
+
+
+def _with_result(record: Any, result_name: str, result: str) -> Any:
+    """
+    Ajoute le résultat à un objet JSON (une valeur non objet est enveloppée).
+
+    Args:
+        record (Any): L'objet JSON décodé
+        result_name (str): Le nom du champ résultat
+        result (str): Le résultat de text_to_understanding
+
+    Returns:
+        Any: L'objet complété
+    """
+    if isinstance(record, dict):
+        record[result_name] = result
+        return record
+    return {'input': record, result_name: result}
+
+
+# Fichier binaire de extract_file_mmap : un en-tête puis un enregistrement de taille fixe par ligne
+_BULK_MAGIC = b'NXRB'
+_BULK_VERSION = 1
+_BULK_HEADER = struct.Struct('<4sHHQ')  # signature, version, taille d'un enregistrement, nombre de lignes
+_BULK_RECORD = struct.Struct('<QqIB3x')  # début de la ligne, valeur, longueur de la ligne, drapeaux
+
+# Drapeaux d'un enregistrement
+BULK_FOUND = 1      # un nombre (ou une expression absolue) a été trouvé
+BULK_PERCENT = 2    # la valeur est un pourcentage
+BULK_NEGATIVE = 4   # signe négatif détecté
+BULK_OVERFLOW = 8   # valeur hors de l'intervalle int64 (champ valeur à 0)
+
+
+class BulkRecord(NamedTuple):
+    """
+    Enregistrement d'un fichier de résultats binaire.
+
+    Attributes:
+        line_offset (int): Position (en octets) du début de la ligne dans le fichier source
+        line_length (int): Longueur (en octets) de la ligne, sans fin de ligne
+        value (Optional[int]): La valeur, None sans nombre ou si elle dépasse int64
+        flags (int): Combinaison de BULK_FOUND, BULK_PERCENT, BULK_NEGATIVE, BULK_OVERFLOW
+    """
+    line_offset: int
+    line_length: int
+    value: Optional[int]
+    flags: int
+
+    @property
+    def found(self) -> bool:
+        return bool(self.flags & BULK_FOUND)
+
+    @property
+    def is_percent(self) -> bool:
+        return bool(self.flags & BULK_PERCENT)
+
+
+def _line_spans(source: mmap.mmap, chunk_size: int) -> Iterator[List[Tuple[int, int]]]:
+    """
+    Limites des lignes d'un fichier projeté, par paquets de chunk_size, sans copier le texte.
+
+    Returns:
+        Iterator[List[Tuple[int, int]]]: Paquets de (début, fin) ; la fin exclut "\n" et "\r"
+    """
+    size = len(source)
+    start = 0
+    spans: List[Tuple[int, int]] = []
+    while start < size:
+        newline = source.find(b'\n', start)
+        next_start = size if newline < 0 else newline + 1
+        end = next_start if newline < 0 else newline
+        if end > start and source[end - 1] == 13:  # "\r" des fins de ligne Windows
+            end -= 1
+        spans.append((start, end))
+        if len(spans) >= chunk_size:
+            yield spans
+            spans = []
+        start = next_start
+    if spans:
+        yield spans
+
+
+def extract_file_mmap(input_path: str, output_path: str, encoding: str = 'utf-8',
+                      chunk_size: int = 10000) -> int:
+    """
+    Analyse un gros fichier (une entrée par ligne) et écrit un fichier de résultats binaire.
+
+    Le fichier source est projeté en mémoire : les fins de ligne sont cherchées dans la
+    projection, seule chaque ligne est décodée, et les paquets de chunk_size lignes
+    passent par text_to_result_many (déduplication dans le paquet). Chaque ligne donne
+    un enregistrement de taille fixe (position et longueur de la ligne, valeur,
+    drapeaux) : le résultat se relit avec BulkResults et se joint à la source par
+    position, sans relire le texte.
+
+    Args:
+        input_path (str): Le fichier texte source
+        output_path (str): Le fichier de résultats à écrire
+        encoding (str): Encodage du fichier source (octets invalides remplacés)
+        chunk_size (int): Nombre de lignes par paquet
+
+    Returns:
+        int: Le nombre de lignes traitées
+
+    Raises:
+        ValueError: Si chunk_size n'est pas strictement positif
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size doit être strictement positif")
+
+    line_count = 0
+    with open(input_path, 'rb') as input_file, open(output_path, 'wb') as output_file:
+        output_file.write(_BULK_HEADER.pack(_BULK_MAGIC, _BULK_VERSION, _BULK_RECORD.size, 0))
+        # Un fichier vide ne peut pas être projeté
+        if os.fstat(input_file.fileno()).st_size:
+            with mmap.mmap(input_file.fileno(), 0, access=mmap.ACCESS_READ) as source:
+                for spans in _line_spans(source, chunk_size):
+                    results = text_to_result_many(
+                        source[start:end].decode(encoding, errors='replace') for start, end in spans
+                    )
+                    records = bytearray(_BULK_RECORD.size * len(spans))
+                    for record_index, ((start, end), result) in enumerate(zip(spans, results)):
+                        value, flags = _bulk_value_and_flags(result)
+                        _BULK_RECORD.pack_into(records, record_index * _BULK_RECORD.size,
+                                               start, value, end - start, flags)
+                    output_file.write(records)
+                    line_count += len(spans)
+        output_file.seek(0)
+        output_file.write(_BULK_HEADER.pack(_BULK_MAGIC, _BULK_VERSION, _BULK_RECORD.size, line_count))
+    return line_count
+
+
+def _bulk_value_and_flags(result: UnderstandingResult) -> Tuple[int, int]:
+    """
+    Champs valeur et drapeaux de l'enregistrement binaire d'un résultat.
+    """
+    if result.no_number:
+        return 0, 0
+    flags = BULK_FOUND
+    if result.is_percent:
+        flags |= BULK_PERCENT
+    if result.sign < 0:
+        flags |= BULK_NEGATIVE
+    if not _INT64_MIN <= result.value <= _INT64_MAX:
+        return 0, flags | BULK_OVERFLOW
+    return result.value, flags
+
+
+class BulkResults:
+    """
+    Fichier de résultats de extract_file_mmap, projeté en mémoire en lecture seule.
+
+    Se lit comme une séquence de BulkRecord (dans l'ordre des lignes, donc des positions) ;
+    find retrouve l'enregistrement d'une ligne à partir de sa position dans la source.
+    """
+
+    __slots__ = ('_file', '_map', '_count')
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path (str): Le fichier de résultats
+
+        Raises:
+            ValueError: Si le fichier n'est pas un fichier de résultats valide
+        """
+        self._file = open(path, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"fichier de résultats invalide : {path}")
+        header = self._map[:_BULK_HEADER.size]
+        magic, version, record_size, self._count = (
+            _BULK_HEADER.unpack(header) if len(header) == _BULK_HEADER.size else (b'', 0, 0, 0)
+        )
+        expected_size = _BULK_HEADER.size + self._count * _BULK_RECORD.size
+        if (magic != _BULK_MAGIC or version != _BULK_VERSION or record_size != _BULK_RECORD.size
+                or len(self._map) != expected_size):
+            self.close()
+            raise ValueError(f"fichier de résultats invalide : {path}")
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> BulkRecord:
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("indice d'enregistrement hors limites")
+        line_offset, value, line_length, flags = _BULK_RECORD.unpack_from(
+            self._map, _BULK_HEADER.size + index * _BULK_RECORD.size)
+        found_value = value if flags & BULK_FOUND and not flags & BULK_OVERFLOW else None
+        return BulkRecord(line_offset, line_length, found_value, flags)
+
+    def __iter__(self) -> Iterator[BulkRecord]:
+        return (self[index] for index in range(self._count))
+
+    def find(self, line_offset: int) -> Optional[BulkRecord]:
+        """
+        Enregistrement de la ligne qui commence à line_offset (recherche dichotomique).
+
+        Args:
+            line_offset (int): Position du début de la ligne dans le fichier source
+
+        Returns:
+            Optional[BulkRecord]: L'enregistrement, ou None si aucune ligne ne commence là
+        """
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            middle_offset = _BULK_RECORD.unpack_from(self._map, _BULK_HEADER.size + middle * _BULK_RECORD.size)[0]
+            if middle_offset < line_offset:
+                low = middle + 1
             else:
-                current_value += base_value
-        
-        token_index += 1
-    
-    final_result = total_value + current_value
-    return final_result if final_result > 0 else None
\ No newline at end of file
+                high = middle
+        if low < self._count:
+            record = self[low]
+            if record.line_offset == line_offset:
+                return record
+        return None
+
+    def close(self) -> None:
+        """
+        Libère la projection et le fichier.
+        """
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self) -> 'BulkResults':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Point d'entrée de `python -m number_extract`.
+
+    Args:
+        argv (Optional[List[str]]): Arguments de la ligne de commande (par défaut sys.argv)
+
+    Returns:
+        int: Le code de sortie
+    """
+    import argparse  # import différé : inutile hors de la ligne de commande
+
+    parser = argparse.ArgumentParser(
+        prog='python -m number_extract',
+        description="Extrait le nombre ou pourcentage de chaque ligne d'un fichier texte, CSV ou JSONL.",
+    )
+    parser.add_argument('input', nargs='?', default='-', help="fichier d'entrée (défaut : entrée standard)")
+    parser.add_argument('-o', '--output', default='-', help="fichier de sortie (défaut : sortie standard)")
+    parser.add_argument('-f', '--format', choices=STREAM_FORMATS, default='text', help="format d'entrée")
+    parser.add_argument('--column', default='0', help="colonne CSV analysée (index ou nom)")
+    parser.add_argument('--no-header', action='store_true', help="le CSV n'a pas de ligne d'en-tête")
+    parser.add_argument('--field', default='text', help="champ JSONL analysé")
+    parser.add_argument('--result-name', default='result', help="nom de la colonne ou du champ résultat")
+    parser.add_argument('--chunk-size', type=int, default=1000, help="entrées traitées par paquet")
+    parser.add_argument('--flush-every', type=int, default=10000, help="entrées entre deux vidages de la sortie")
+    parser.add_argument('--encoding', default='utf-8', help="encodage des fichiers")
+    parser.add_argument('--save-snapshot', metavar='FICHIER',
+                        help="écrit un instantané du moteur compilé (voir NUMBER_EXTRACT_SNAPSHOT) et s'arrête")
+    parser.add_argument('--binary', action='store_true',
+                        help="sortie binaire indexée par position (format text, fichiers projetés en mémoire)")
+    parser.add_argument('--locale', choices=LOCALE_PROFILES,
+                        help="profil régional (défaut : NUMBER_EXTRACT_LOCALE, sinon mixed)")
+    parser.add_argument('--cache', metavar='FICHIER',
+                        help="cache persistant des résultats (SQLite), partagé entre exécutions")
+    parser.add_argument('--cache-max-entries', type=int, metavar='N',
+                        help="nombre maximal d'entrées du cache persistant (défaut : sans limite)")
+    args = parser.parse_args(argv)
+
+    if args.locale:
+        set_locale_profile(args.locale)
+    if args.cache:
+        try:
+            enable_persistent_cache(args.cache, args.cache_max_entries)
+        except ValueError as error:
+            parser.error(str(error))
+
+    if args.save_snapshot:
+        save_engine_snapshot(args.save_snapshot)
+        return 0
+    if args.binary:
+        if args.format != 'text' or args.input == '-' or args.output == '-':
+            parser.error("--binary nécessite un fichier d'entrée texte et un fichier de sortie (-o)")
+        try:
+            extract_file_mmap(args.input, args.output, encoding=args.encoding, chunk_size=args.chunk_size)
+        except ValueError as error:
+            parser.error(str(error))
+        return 0
+
+    column: Union[int, str] = int(args.column) if args.column.isdigit() else args.column
+    newline = '' if args.format == 'csv' else None
+
+    if args.input == '-':
+        input_file = io.TextIOWrapper(sys.stdin.buffer, encoding=args.encoding, newline=newline)
+    else:
+        input_file = open(args.input, encoding=args.encoding, newline=newline)
+    if args.output == '-':
+        output_file = io.TextIOWrapper(sys.stdout.buffer, encoding=args.encoding, newline=newline,
+                                       write_through=False)
+    else:
+        output_file = open(args.output, 'w', encoding=args.encoding, newline=newline, buffering=1 << 20)
+
+    try:
+        extract_stream(input_file, output_file, input_format=args.format, column=column, field=args.field,
+                       result_name=args.result_name, has_header=not args.no_header,
+                       chunk_size=args.chunk_size, flush_every=args.flush_every)
+    except ValueError as error:
+        parser.error(str(error))
+    finally:
+        output_file.flush()
+        # Les flux standard sont détachés plutôt que fermés
+        if args.input == '-':
+            input_file.detach()
+        else:
+            input_file.close()
+        if args.output == '-':
+            output_file.detach()
+        else:
+            output_file.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,323 @@
+import argparse
+import asyncio
+import json
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional, List, Tuple, Any
+
+from number_extract import (LOCALE_PROFILES, enable_persistent_cache, set_locale_profile,
+                            text_to_understanding_many, warm_up, _initialize_worker, _worker_initargs)
+
+# Taille maximale acceptée pour le corps d'une requête (octets)
+MAX_BODY_SIZE = 10 * 1024 * 1024
+
+_HTTP_REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+                 413: 'Payload Too Large', 500: 'Internal Server Error', 503: 'Service Unavailable'}
+
+
+class MicroBatcher:
+    """
+    Regroupe les textes de requêtes concurrentes en micro-lots.
+
+    Le premier texte d'un lot arme une fenêtre de batch_window secondes ; le lot est
+    envoyé au pool à la fin de la fenêtre, ou dès qu'il atteint max_batch_size textes.
+    Chaque lot est traité par text_to_understanding_many (déduplication comprise).
+    """
+
+    def __init__(self, executor: Executor, batch_window: float = 0.002, max_batch_size: int = 512):
+        """
+        Args:
+            executor (Executor): Pool qui exécute les lots
+            batch_window (float): Durée maximale d'attente d'un lot, en secondes
+            max_batch_size (int): Nombre maximal de textes par lot
+        """
+        self.executor = executor
+        self.batch_window = batch_window
+        self.max_batch_size = max_batch_size
+        self._pending_texts: List[str] = []
+        self._pending_futures: List[asyncio.Future] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+
+    async def extract(self, texts: List[str]) -> List[str]:
+        """
+        Analyse des textes en les ajoutant au micro-lot courant.
+
+        Args:
+            texts (List[str]): Les textes d'une requête
+
+        Returns:
+            List[str]: Les résultats de text_to_understanding, dans l'ordre
+        """
+        loop = asyncio.get_running_loop()
+        futures = []
+        for text in texts:
+            future = loop.create_future()
+            self._pending_texts.append(text)
+            self._pending_futures.append(future)
+            futures.append(future)
+            if len(self._pending_texts) >= self.max_batch_size:
+                self._flush()
+        if self._pending_texts and self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.batch_window, self._flush)
+        return list(await asyncio.gather(*futures))
+
+    def _flush(self) -> None:
+        """
+        Envoie le lot courant au pool.
+        """
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._pending_texts:
+            return
+        texts, futures = self._pending_texts, self._pending_futures
+        self._pending_texts, self._pending_futures = [], []
+        loop = asyncio.get_running_loop()
+        try:
+            batch_future = loop.run_in_executor(self.executor, text_to_understanding_many, texts)
+        except Exception as error:  # pool cassé ou arrêté : l'envoi échoue tout de suite
+            batch_future = loop.create_future()
+            batch_future.set_exception(error)
+        batch_future.add_done_callback(lambda done: _resolve_batch(done, futures))
+
+
+def _resolve_batch(batch_future: asyncio.Future, futures: List[asyncio.Future]) -> None:
+    """
+    Distribue les résultats (ou l'erreur) d'un lot aux requêtes en attente.
+
+    Args:
+        batch_future (asyncio.Future): Le calcul du lot
+        futures (List[asyncio.Future]): Une future par texte du lot
+    """
+    if batch_future.cancelled():  # pool arrêté (close) avant le calcul du lot
+        error: Optional[BaseException] = _ServiceUnavailable('lot annulé : arrêt du service')
+    else:
+        error = batch_future.exception()
+    results = None if error is not None else batch_future.result()
+    for index, future in enumerate(futures):
+        if future.done():
+            continue
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(results[index])
+
+
+class ExtractionServer:
+    """
+    Service HTTP/JSON d'extraction (bibliothèque standard uniquement).
+
+    Routes :
+    - POST /extract : corps "texte", ["t1", "t2"], {"text": "..."} ou {"texts": [...]} ;
+      réponse {"result": "..."} ou {"results": [...]}
+    - GET /health : {"status": "ok"}
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 8000, batch_window: float = 0.002,
+                 max_batch_size: int = 512, workers: Optional[int] = None):
+        """
+        Args:
+            host (str): Adresse d'écoute
+            port (int): Port d'écoute (0 : port libre choisi par le système)
+            batch_window (float): Fenêtre de regroupement des requêtes, en secondes
+            max_batch_size (int): Nombre maximal de textes par lot
+            workers (Optional[int]): Nombre de processus du pool (0 : un seul thread,
+                dans le processus du serveur ; None : nombre de cœurs)
+        """
+        self.host = host
+        self.port = port
+        self.batch_window = batch_window
+        self.max_batch_size = max_batch_size
+        self.workers = workers
+        self.executor: Optional[Executor] = None
+        self.batcher: Optional[MicroBatcher] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self) -> None:
+        """
+        Démarre le pool (processus initialisés une fois, avec le profil régional et le cache
+        persistant du serveur) et l'écoute TCP.
+        """
+        if self.workers == 0:
+            self.executor = ThreadPoolExecutor(max_workers=1, initializer=warm_up)
+        else:
+            self.executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_initialize_worker,
+                                                initargs=_worker_initargs())
+        self.batcher = MicroBatcher(self.executor, self.batch_window, self.max_batch_size)
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        """
+        Démarre le service si besoin puis traite les requêtes jusqu'à l'arrêt.
+        """
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self) -> None:
+        """
+        Arrête l'écoute et le pool.
+        """
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Traite les requêtes d'une connexion (keep-alive HTTP/1.1).
+        """
+        try:
+            while True:
+                request = await _read_request(reader)
+                if request is None:
+                    break
+                method, path, headers, body = request
+                try:
+                    status, payload = await self._route(method, path, body)
+                except _ServiceUnavailable as error:
+                    status, payload = 503, {'error': str(error)}
+                except Exception as error:  # pool cassé (BrokenProcessPool) ou arrêté : réponse quand même
+                    status, payload = 500, {'error': f'erreur interne : {type(error).__name__}'}
+                keep_alive = headers.get('connection', '').lower() != 'close'
+                _write_response(writer, status, payload, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except _PayloadTooLarge:
+            _write_response(writer, 413, {'error': 'corps de requête trop volumineux'}, False)
+        except ValueError:
+            _write_response(writer, 400, {'error': 'requête HTTP invalide'}, False)
+        finally:
+            writer.close()
+
+    async def _route(self, method: str, path: str, body: bytes) -> Tuple[int, Any]:
+        """
+        Calcule la réponse d'une requête.
+
+        Returns:
+            Tuple[int, Any]: Le code HTTP et l'objet JSON à renvoyer
+        """
+        path = path.split('?', 1)[0]
+        if path == '/health':
+            return 200, {'status': 'ok'}
+        if path != '/extract':
+            return 404, {'error': 'route inconnue'}
+        if method != 'POST':
+            return 405, {'error': 'utiliser POST'}
+
+        try:
+            payload = json.loads(body or b'null')
+        except ValueError:
+            return 400, {'error': 'JSON invalide'}
+
+        if isinstance(payload, dict):
+            payload = payload.get('texts', payload.get('text'))
+        if isinstance(payload, str):
+            return 200, {'result': (await self.batcher.extract([payload]))[0]}
+        if isinstance(payload, list) and all(isinstance(text, str) for text in payload):
+            return 200, {'results': await self.batcher.extract(payload) if payload else []}
+        return 400, {'error': 'attendu : une chaîne ou une liste de chaînes'}
+
+
+class _PayloadTooLarge(Exception):
+    pass
+
+
+class _ServiceUnavailable(Exception):
+    pass
+
+
+async def _read_request(reader: asyncio.StreamReader) -> Optional[Tuple[str, str, dict, bytes]]:
+    """
+    Lit une requête HTTP/1.1 (ligne de requête, en-têtes, corps Content-Length).
+
+    Returns:
+        Optional[Tuple[str, str, dict, bytes]]: (méthode, chemin, en-têtes, corps), None en fin de flux
+    """
+    request_line = await reader.readline()
+    if not request_line.strip():
+        return None
+    parts = request_line.decode('latin-1').split()
+    if len(parts) < 2:
+        return None
+    method, path = parts[0].upper(), parts[1]
+
+    headers = {}
+    while True:
+        header_line = await reader.readline()
+        if header_line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = header_line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+
+    content_length = int(headers.get('content-length', '0') or 0)
+    if content_length > MAX_BODY_SIZE:
+        raise _PayloadTooLarge()
+    body = await reader.readexactly(content_length) if content_length else b''
+    return method, path, headers, body
+
+
+def _write_response(writer: asyncio.StreamWriter, status: int, payload: Any, keep_alive: bool) -> None:
+    """
+    Écrit une réponse HTTP/1.1 JSON.
+    """
+    body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+    head = (
+        f"HTTP/1.1 {status} {_HTTP_REASONS.get(status, '')}\r\n"
+        f"Content-Type: application/json; charset=utf-8\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    )
+    writer.write(head.encode('latin-1') + body)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Point d'entrée de `python -m number_extract_server`.
+
+    Args:
+        argv (Optional[List[str]]): Arguments de la ligne de commande (par défaut sys.argv)
+
+    Returns:
+        int: Le code de sortie
+    """
+    parser = argparse.ArgumentParser(prog='python -m number_extract_server',
+                                     description="Service HTTP/JSON d'extraction de nombres.")
+    parser.add_argument('--host', default='127.0.0.1', help="adresse d'écoute")
+    parser.add_argument('--port', type=int, default=8000, help="port d'écoute")
+    parser.add_argument('--batch-window-ms', type=float, default=2.0, help="fenêtre de regroupement (ms)")
+    parser.add_argument('--max-batch-size', type=int, default=512, help="textes maximum par lot")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(),
+                        help="processus de calcul (0 : un thread dans le serveur)")
+    parser.add_argument('--locale', choices=LOCALE_PROFILES,
+                        help="profil régional (défaut : NUMBER_EXTRACT_LOCALE, sinon mixed)")
+    parser.add_argument('--cache', metavar='FICHIER',
+                        help="cache persistant des résultats (SQLite), partagé entre processus")
+    parser.add_argument('--cache-max-entries', type=int, metavar='N',
+                        help="nombre maximal d'entrées du cache persistant (défaut : sans limite)")
+    args = parser.parse_args(argv)
+
+    if args.locale:
+        set_locale_profile(args.locale)
+    if args.cache:
+        try:
+            enable_persistent_cache(args.cache, args.cache_max_entries)
+        except ValueError as error:
+            parser.error(str(error))
+
+    server = ExtractionServer(args.host, args.port, args.batch_window_ms / 1000, args.max_batch_size, args.workers)
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
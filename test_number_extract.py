@@ -1,8 +1,20 @@
+import asyncio
+import io
+import json
+import os
+import random
+import tempfile
+import threading
+import time
+import warnings
+from fractions import Fraction
+
+import number_extract
 from number_extract import *
+from number_extract_server import ExtractionServer
 
-def run_tests():
-    
-    test_cases = {
+# Phrase -> résultat attendu de text_to_understanding (repris par bench_number_extract.py)
+test_cases = {
     
     # Nombres de base (0 à 100)
     "zero": "0",
@@ -229,6 +241,8 @@ def run_tests():
     "Les frais représentent environ trente-cinq pour cent du budget.": "35%",
     "trente pour cent" : "30%",
     "quarente pour cent" : "40%",
+    "deux et demi pour cent": "2%",
+    "cinquante personnes pour cent": "50%",
 
 
 
@@ -295,7 +309,21 @@ def run_tests():
     "7/10": "70%",
     "neuf dixièmes": "90%",
     "9/10": "90%",
+    "un dix-septième": "6%",
+    "un quatre-vingtième": "1%",
+    "quatre vingtièmes": "20%",
+    "il a deux chats et trois quarts": "75%",
+    "un bon tiers": "33%",
+    "deux petits tiers": "67%",
+    "trois gros quarts": "75%",
     "85 / 100": "85%",
+    "huit personnes sur dix": "80%",
+    "trois élèves sur quatre": "75%",
+    "une fois sur deux": "50%",
+    "deux jours sur trois": "67%",
+    "neuf fois sur dix": "90%",
+    "huit personnes sur dix, vraiment": "80%",
+    "il a vingt ans, trois sur quatre": "75%",
 
 
 
@@ -320,6 +348,8 @@ def run_tests():
     "douzaine de pommes": "12",
     "trois douzaine": "36",
     "quatre douzaine": "48",
+    "trois belles douzaines d'oeufs": "36",
+    "deux grosses douzaines": "24",
     "trois vingtaines": "60",
     "trois vingtaine": "60",
     "six vingtaines": "120",
@@ -369,6 +399,12 @@ def run_tests():
     "deux millions cinq cent mille": "2500000",
     "billion": "1000000000000",
     "quatre vingt mille deux cent quatre vingt dix huit" : "80298",
+    "mille milliards": "1000000000000",
+    "mille deux cent millions": "1200000000",
+    "soixante onze": "71",
+    "cent cent": "AUCUN CHIFFRE",
+    "mille mille": "AUCUN CHIFFRE",
+    "deux cent trois cent": "AUCUN CHIFFRE",
 
 
 
@@ -419,6 +455,9 @@ def run_tests():
     "comme nous pouvons le voir": "AUCUN CHIFFRE",
 }
 
+
+def run_tests():
+
     print("--- Résultats des Tests ---")
     failed = 0
     total = 0
@@ -430,6 +469,671 @@ def run_tests():
         total += 1
     print("Accuracy de : ", str(total-failed),"/", str(total) )
 
+    # Le traitement par lot doit rendre exactement les mêmes résultats, dans l'ordre
+    batch_phrases = list(test_cases) * 2
+    batch_results = text_to_understanding_many(batch_phrases)
+    batch_failed = 0
+    for phrase, result in zip(batch_phrases, batch_results):
+        if result != test_cases[phrase]:
+            print(f"❌ lot '{phrase}' → {result} (attendu: {test_cases[phrase]})")
+            batch_failed += 1
+    print("Traitement par lot : ", str(len(batch_phrases)-batch_failed),"/", str(len(batch_phrases)) )
+
+    # Le cache de résultats doit rendre des résultats identiques, puis servir les répétitions
+    uncached_numbers = {phrase: text_to_number(phrase) for phrase in test_cases}
+    enable_result_cache(maxsize=len(test_cases) // 2)
+    cache_failed = 0
+    for phrase in batch_phrases:
+        if text_to_understanding(phrase) != test_cases[phrase] or text_to_number(phrase) != uncached_numbers[phrase]:
+            cache_failed += 1
+    understanding_cache_info = result_cache_info()["text_to_understanding"]
+    if understanding_cache_info.evictions == 0 or understanding_cache_info.currsize > len(test_cases) // 2:
+        cache_failed += 1
+    disable_result_cache()
+    print("Cache de résultats : ", str(len(batch_phrases)-cache_failed),"/", str(len(batch_phrases)) )
+
+def run_adversarial_tests():
+    
+    # Entrées longues sans correspondance : le temps d'analyse doit rester linéaire
+    adversarial_inputs = {
+    "mots": "mot " * 4000,
+    "mots puis sur": "mot " * 4000 + "sur",
+    "sur alternés": "sur mot " * 2000,
+    "mots puis pourcent collé": "mot " * 4000 + ",pourcent",
+    "mots puis groupe": "mot " * 4000 + "dizaines",
+    "mots puis dénominateur": "mot " * 4000 + "quarts",
+    "mots ponctués": "mot, " * 3200,
+    "chiffres": "1" * 16000,
+    "chiffres puis sur": "1" * 16000 + " sur",
+    "chiffres puis barre": "1" * 16000 + " x/",
+    "sans espace": "x" * 16000,
+    "nombres écrits": "vingt " * 2700,
+    "fractions répétées": "trois quarts sur cent pour cent dizaine " * 400,
+    "moitiés": "la moitie " * 1600,
+    "sur après des mots": "un mot sur " * 1600,
+    "pourcents collés": "a%" * 8000,
+}
+    max_seconds_per_call = 0.5
+
+    print("--- Entrées adverses ---")
+    failed = 0
+    for name, phrase in adversarial_inputs.items():
+        start_time = time.perf_counter()
+        text_to_understanding(phrase)
+        list(extract_all(phrase))
+        elapsed = time.perf_counter() - start_time
+        if elapsed > max_seconds_per_call:
+            print(f"❌ '{name}' ({len(phrase)} caractères) → {elapsed:.3f}s (limite: {max_seconds_per_call}s)")
+            failed += 1
+    print("Entrées adverses sous la limite : ", str(len(adversarial_inputs)-failed),"/", str(len(adversarial_inputs)) )
+    assert failed == 0, "analyse trop lente sur une entrée adverse"
+
+def run_stream_tests():
+    
+    # Chaque format de flux doit recopier l'entrée et ajouter le résultat
+    stream_cases = {
+    "text": ("trois quarts\naucun\n", "trois quarts\t75%\naucun\t0%\n", {}),
+    "csv": ("id,texte\n1,la moitié\n", "id,texte,result\r\n1,la moitié,50%\r\n", {"column": "texte"}),
+    "jsonl": ('{"text": "moins quatre"}\n\n', '{"text": "moins quatre", "result": "-4"}\n', {}),
+}
+
+    print("--- Flux ---")
+    failed = 0
+    for input_format, (input_data, expected, options) in stream_cases.items():
+        output_file = io.StringIO()
+        extract_stream(io.StringIO(input_data), output_file, input_format=input_format, chunk_size=1, **options)
+        if output_file.getvalue() != expected:
+            print(f"❌ '{input_format}' → {output_file.getvalue()!r} (attendu: {expected!r})")
+            failed += 1
+    print("Flux : ", str(len(stream_cases)-failed),"/", str(len(stream_cases)) )
+
+def run_extract_all_tests():
+    
+    # Chaque expression du document, avec sa valeur, sa nature et son texte d'origine
+    extract_all_cases = {
+    "vingt-deux pommes et 3/4 des poires": [(22, "number", "vingt-deux"), (75, "fraction", "3/4")],
+    "Moins 5, puis cinquante pour cent": [(-5, "number", "Moins 5"), (50, "percent", "cinquante pour cent")],
+    "il a deux chats et trois quarts": [(2, "number", "deux"), (75, "fraction", "trois quarts")],
+    "un quatre-vingtième, un dix-septième": [(1, "fraction", "un quatre-vingtième"), (6, "fraction", "un dix-septième")],
+    "10-5 et -7 ; la moitié": [(10, "number", "10"), (5, "number", "5"), (-7, "number", "-7"), (50, "fraction", "moitié")],
+    "12,5 % et trois douzaines": [(12, "percent", "12,5 %"), (36, "number", "trois douzaines")],
+    "un et un, soixante-dix-sept mille trois cent": [(1, "number", "un"), (1, "number", "un"), (77300, "number", "soixante-dix-sept mille trois cent")],
+    "vingt-et-un ans et soixante-et-onze pour cent": [(21, "number", "vingt-et-un"), (71, "percent", "soixante-et-onze pour cent")],
+    "trente-et-un jours": [(31, "number", "trente-et-un")],
+    "nous sommes mardi": [],
+}
+
+    print("--- Extraction de toutes les expressions ---")
+    failed = 0
+    for text, expected in extract_all_cases.items():
+        matches = list(extract_all(text))
+        found = [(match.value, match.kind, match.text) for match in matches]
+        if found != expected or any(text[match.start:match.end] != match.text for match in matches):
+            print(f"❌ '{text}' → {found} (attendu: {expected})")
+            failed += 1
+    print("Extraction complète : ", str(len(extract_all_cases)-failed),"/", str(len(extract_all_cases)) )
+
+def run_tokenize_tests():
+
+    # Texte brut -> tokens (nature, texte) ; les positions doivent couvrir le texte d'origine
+    tokenize_cases = {
+    "Moins 3/4": [("sign", "moins"), ("digits", "3"), ("fraction_operator", "/"), ("digits", "4")],
+    "vingt-deux %": [("number_word", "vingt"), ("connector", "-"), ("number_word", "deux"), ("percent", "%")],
+    "10-5 et -7": [("digits", "10"), ("connector", "-"), ("digits", "5"), ("connector", "et"), ("sign", "-"), ("digits", "7")],
+    "12,5 pour cent": [("digits", "12,5"), ("other", "pour"), ("number_word", "cent")],
+    "Les quatorse_Élèves": [("other", "les"), ("number_word", "quatorze"), ("connector", "-"), ("other", "eleves")],
+    "quatorse_Élèves": [("number_word", "quatorze"), ("connector", "-"), ("other", "eleves")],
+    "deux sur trois.": [("number_word", "deux"), ("fraction_operator", "sur"), ("number_word", "trois"), ("other", ".")],
+}
+
+    print("--- Analyse lexicale ---")
+    failed = 0
+    for text, expected in tokenize_cases.items():
+        tokens = tokenize(text)
+        found = [(token.kind, token.text) for token in tokens]
+        spans_ok = ''.join(text[token.start:token.end] for token in tokens) == ''.join(text.split())
+        if found != expected or not spans_ok or any(token.kind not in TOKEN_KINDS for token in tokens):
+            print(f"❌ '{text}' → {found} (attendu: {expected})")
+            failed += 1
+    print("Analyse lexicale : ", str(len(tokenize_cases)-failed),"/", str(len(tokenize_cases)) )
+
+def run_result_tests():
+
+    # Résultat structuré : (valeur, pourcentage, signe, étape, fraction exacte, aucun nombre)
+    result_cases = {
+    "trois sur quatre": (75, True, 1, "word_fraction", Fraction(3, 4), False),
+    "-3/4": (-75, True, -1, "numeric_fraction", Fraction(-3, 4), False),
+    "moins quatre": (-4, False, -1, "written_numbers", None, False),
+    "50 %": (50, True, 1, "percentages", None, False),
+    "trois quarts": (75, True, 1, "fractions", None, False),
+    "il y a 12 pommes": (12, False, 1, "explicit_numbers", None, False),
+    "aucun": (0, True, 1, "special_expressions", None, False),
+    "nous sommes mardi": (None, False, 1, None, None, True),
+}
+
+    print("--- Résultats structurés ---")
+    failed = 0
+    for text, expected in result_cases.items():
+        result = text_to_result(text)
+        if tuple(result) != expected or format_understanding(result) != text_to_understanding(text):
+            print(f"❌ '{text}' → {result} (attendu: {expected})")
+            failed += 1
+    print("Résultats structurés : ", str(len(result_cases)-failed),"/", str(len(result_cases)) )
+
+def run_instrumentation_tests():
+    
+    # Chaque résultat de text_to_number est attribué à l'étape qui l'a produit
+    stage_cases = {
+    "50%": "percentages",
+    "trois quarts": "fractions",
+    "il y a 12 pommes": "explicit_numbers",
+    "presque tout": "special_expressions",
+    "vingt-trois": "written_numbers",
+    "le quartier est calme": None,
+}
+
+    print("--- Instrumentation des étapes ---")
+    failed = 0
+    for text, expected_stage in stage_cases.items():
+        callback_calls = []
+        enable_stage_instrumentation(lambda *arguments: callback_calls.append(arguments))
+        value = text_to_number(text)
+        statistics = stage_statistics()
+        hit_stages = [stage for stage, stats in statistics.items() if stats.hits]
+        called_stages = [stage for stage, stats in statistics.items() if stats.calls]
+        expected_hits = [expected_stage] if expected_stage else []
+        if (hit_stages != expected_hits or len(callback_calls) != 1
+                or callback_calls[0][1:3] != (expected_stage, value)
+                or called_stages != list(statistics)[:len(called_stages)]):
+            print(f"❌ '{text}' → étapes {hit_stages}, rappels {callback_calls} (attendu: {expected_stage})")
+            failed += 1
+    disable_stage_instrumentation()
+    if stage_statistics() is not None:
+        print("❌ instrumentation toujours active après disable_stage_instrumentation")
+        failed += 1
+    print("Instrumentation : ", str(len(stage_cases)-failed),"/", str(len(stage_cases)) )
+
+def run_fuzzy_tests():
+    
+    # Fautes de frappe corrigées (ou volontairement ignorées) -> résultat de text_to_understanding
+    fuzzy_cases = {
+    "il y a quatorse pommes": "14",
+    "il y a quatorse pour cent": "14%",
+    "quatorse pommes sur vingt": "70%",
+    "vingtt-trois": "23",
+    "quatre vinght dix": "90",
+    "trois quatriemmes": "75%",
+    "la moitiee": "50%",
+    "une douzainnes": "12",
+    "cinquente pour cent": "50%",
+    "deux milions": "2000000",
+    "un fixieme": "1%",
+    "les fontaines de la ville": "AUCUN CHIFFRE",
+    "il reste des nerfs": "AUCUN CHIFFRE",
+    "il y a des habitants": "AUCUN CHIFFRE",
+    # Fautes courantes reconnues telles quelles, sans contexte
+    "j ai cinqante ans": "50",
+    "il y a trent pommes": "30",
+    "j'ai quatorz ans": "14",
+    "il a quinz ans": "15",
+    "il y a treiz chats": "13",
+    "noeuf personnes": "9",
+    "soissante personnes": "60",
+    "trent": "30",
+    "quinz": "15",
+    "treiz": "13",
+    "noeuf": "9",
+    "trois quardts": "75%",
+}
+
+    print("--- Fautes de frappe ---")
+    failed = 0
+    for text, expected in fuzzy_cases.items():
+        result = text_to_understanding(text)
+        found = [match.value for match in extract_all(text)]
+        if (result != expected or may_contain_number(text) != (expected != "AUCUN CHIFFRE")
+                or (expected != "AUCUN CHIFFRE") != bool(found)):
+            print(f"❌ '{text}' → {result}, extract_all {found} (attendu: {expected})")
+            failed += 1
+
+    # Mots proches d'un mot numérique, sans contexte numérique voisin : jamais corrigés
+    # (le préfiltre, lui, peut les laisser passer)
+    uncorrected_cases = {
+    "elle est douée": "AUCUN CHIFFRE",
+    "une élève très douée en maths": "1",
+    "ceints": "AUCUN CHIFFRE",
+    "billon": "AUCUN CHIFFRE",
+    "cinquante centimes": "50",
+    "il a pris douze onces": "12",
+    "le billon": "AUCUN CHIFFRE",
+    "la pièce manquante": "AUCUN CHIFFRE",
+}
+    extractor = IncrementalExtractor()
+    for text, expected in uncorrected_cases.items():
+        result = text_to_understanding(text)
+        found = [match.value for match in extract_all(text)]
+        for word in text.split():
+            extractor.append(word)
+        incremental = format_understanding(extractor.finalize())
+        if result != expected or incremental != expected or (expected != "AUCUN CHIFFRE") != bool(found):
+            print(f"❌ '{text}' → {result}, mot à mot {incremental}, extract_all {found} (attendu: {expected})")
+            failed += 1
+    total = len(fuzzy_cases) + len(uncorrected_cases)
+    print("Fautes de frappe : ", str(total-failed),"/", str(total) )
+
+def run_array_tests():
+    
+    # Colonne avec doublons et valeurs manquantes -> (valeur ou None, pourcentage, trouvé)
+    array_cases = [
+    ("trois quarts", (75, True, True)),
+    ("nous sommes mardi", (None, False, False)),
+    (None, (None, False, False)),
+    ("trois quarts", (75, True, True)),
+    ("moins quatre", (-4, False, True)),
+    ("tout", (100, True, True)),
+]
+
+    print("--- Tableaux NumPy / pandas ---")
+    try:
+        import numpy
+    except ImportError:
+        print("Tableaux : ignorés (NumPy non installé)")
+        return
+    texts = [text for text, _ in array_cases]
+    arrays = text_to_result_array(texts)
+    found = [(None if arrays.values.mask[row] else int(arrays.values[row]), bool(arrays.is_percent[row]),
+              bool(arrays.found[row])) for row in range(len(texts))]
+    failed = 0
+    for (text, expected), row in zip(array_cases, found):
+        if row != expected or arrays.values.dtype != numpy.int64:
+            print(f"❌ '{text}' → {row} (attendu: {expected})")
+            failed += 1
+    try:
+        import pandas
+    except ImportError:
+        pass
+    else:
+        frame = text_to_result_frame(pandas.Series(texts, index=range(10, 10 + len(texts))))
+        frame_rows = [(None if pandas.isna(value) else int(value), bool(is_percent), bool(row_found))
+                      for value, is_percent, row_found in frame.itertuples(index=False)]
+        if frame_rows != found or list(frame.index) != list(range(10, 10 + len(texts))):
+            print(f"❌ text_to_result_frame → {frame_rows} (attendu: {found})")
+            failed += 1
+    print("Tableaux : ", str(len(array_cases)-failed),"/", str(len(array_cases)) )
+
+def run_bulk_tests():
+    
+    # Fichier source (fins de ligne mixtes) -> (valeur, drapeaux) de chaque enregistrement binaire
+    bulk_lines = [
+    ("trois quarts", (75, BULK_FOUND | BULK_PERCENT)),
+    ("nous sommes mardi", (None, 0)),
+    ("", (None, 0)),
+    ("moins quatre\r", (-4, BULK_FOUND | BULK_NEGATIVE)),
+    ("99999999999999999999 élèves", (None, BULK_FOUND | BULK_OVERFLOW)),
+    ("Vingt-deux élèves", (22, BULK_FOUND)),
+]
+
+    print("--- Fichier projeté en mémoire ---")
+    failed = 0
+    with tempfile.TemporaryDirectory() as directory:
+        input_path = os.path.join(directory, "source.txt")
+        output_path = os.path.join(directory, "resultats.bin")
+        source = "\n".join(line for line, _ in bulk_lines).encode("utf-8")
+        with open(input_path, "wb") as input_file:
+            input_file.write(source)
+        line_count = extract_file_mmap(input_path, output_path, chunk_size=4)
+        with BulkResults(output_path) as records:
+            if line_count != len(bulk_lines) or len(records) != len(bulk_lines):
+                print(f"❌ {line_count} lignes, {len(records)} enregistrements (attendu: {len(bulk_lines)})")
+                failed += 1
+            for (line, expected), record in zip(bulk_lines, records):
+                line_text = source[record.line_offset:record.line_offset + record.line_length].decode("utf-8")
+                if ((record.value, record.flags) != expected or line_text != line.rstrip("\r")
+                        or records.find(record.line_offset) != record):
+                    print(f"❌ '{line}' → {record} (attendu: {expected})")
+                    failed += 1
+    print("Fichier projeté : ", str(len(bulk_lines)-failed),"/", str(len(bulk_lines)) )
+
+def run_snapshot_tests():
+    
+    # Instantané du moteur : mêmes index une fois rechargé, fichier invalide ignoré
+    snapshot_cases = ["quatorse", "vingtt", "moitiee", "habitants", "douzainnes", "trois"]
+
+    print("--- Instantané du moteur ---")
+    failed = 0
+    with tempfile.TemporaryDirectory() as directory:
+        snapshot_path = os.path.join(directory, "moteur.snapshot")
+        save_engine_snapshot(snapshot_path)
+        invalid_path = os.path.join(directory, "invalide.snapshot")
+        with open(invalid_path, "wb") as invalid_file:
+            invalid_file.write(b"pas un instantane")
+        previous = os.environ.get(ENGINE_SNAPSHOT_ENV)
+        try:
+            os.environ[ENGINE_SNAPSHOT_ENV] = snapshot_path
+            lexicon = number_extract._lexicon_from_snapshot(number_extract._load_engine_snapshot())
+            os.environ[ENGINE_SNAPSHOT_ENV] = invalid_path
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter("always")
+                if number_extract._load_engine_snapshot() is not None or not caught:
+                    print("❌ instantané invalide chargé ou sans avertissement")
+                    failed += 1
+        finally:
+            if previous is None:
+                os.environ.pop(ENGINE_SNAPSHOT_ENV, None)
+            else:
+                os.environ[ENGINE_SNAPSHOT_ENV] = previous
+    reference = number_extract._ENGINE.lexicon
+    if lexicon.values != reference.values or lexicon.stems != reference.stems:
+        print("❌ lexique différent après rechargement")
+        failed += 1
+    for word in snapshot_cases:
+        if lexicon.speller.correct(word) != reference.speller.correct(word):
+            print(f"❌ '{word}' → {lexicon.speller.correct(word)} (attendu: {reference.speller.correct(word)})")
+            failed += 1
+    print("Instantané : ", str(len(snapshot_cases)+2-failed),"/", str(len(snapshot_cases)+2) )
+
+def run_persistent_cache_tests():
+
+    # Cache persistant : mêmes résultats que sans cache, relus par une autre connexion
+    persistent_texts = list(test_cases) + [
+        "La moitié.", "la moitie", "moins quatre", "2/3", "99999999999999999999999 pour cent",
+    ]
+
+    print("--- Cache persistant ---")
+    failed = 0
+    disable_result_cache()
+    expected = text_to_result_many(persistent_texts)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "resultats.sqlite")
+        try:
+            enable_persistent_cache(path)
+            cached_many = text_to_result_many(persistent_texts)
+            cached_single = [text_to_result(text) for text in persistent_texts]
+            if cached_many != expected or cached_single != expected:
+                print("❌ résultats différents avec le cache persistant")
+                failed += 1
+            # Nouvelle connexion (comme un autre processus) : tout est servi par le disque
+            cache = enable_persistent_cache(path)
+            if text_to_result_many(persistent_texts) != expected or cache.info().misses:
+                print(f"❌ relecture depuis le disque : {cache.info()}")
+                failed += 1
+            # Quasi-doublon jamais vu : servi par la clé normalisée
+            if text_to_result("  LA   MOITIE.") != text_to_result("la moitie") or cache.info().misses:
+                print(f"❌ quasi-doublon recalculé : {cache.info()}")
+                failed += 1
+            if text_to_understanding_parallel(persistent_texts, max_workers=2, chunk_size=50) != \
+                    [format_understanding(result) for result in expected]:
+                print("❌ text_to_understanding_parallel différent avec le cache persistant")
+                failed += 1
+        finally:
+            disable_persistent_cache()
+
+        # Un autre profil régional (autre version du moteur) ne relit pas ces entrées
+        with PersistentResultCache(path) as cache:
+            stored = len(cache)
+            try:
+                set_locale_profile(LOCALE_SWITZERLAND)
+                cache.result("trois sur quatre")
+            finally:
+                set_locale_profile(LOCALE_MIXED)
+            if cache.info().misses != 1 or len(cache) != stored + 2:
+                print(f"❌ entrée d'un autre profil relue : {cache.info()}")
+                failed += 1
+            if cache.prune(10) != stored - 8 or len(cache) != 10 or cache.results_many(persistent_texts) != expected:
+                print(f"❌ élagage : {len(cache)} entrées")
+                failed += 1
+
+        with PersistentResultCache(path, max_entries=5) as cache:
+            cache.results_many(persistent_texts)
+            if len(cache) > 5:
+                print(f"❌ max_entries dépassé : {len(cache)} entrées")
+                failed += 1
+    try:
+        PersistentResultCache(path, max_entries=0)
+        print("❌ max_entries=0 accepté")
+        failed += 1
+    except ValueError:
+        pass
+    print("Cache persistant : ", str(7-failed),"/", "7" )
+
+async def _post_extract(port, body):
+    """
+    Envoie un POST /extract au serveur local et renvoie (code HTTP, objet JSON).
+    """
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    writer.write(b"POST /extract HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n"
+                 b"Content-Length: %d\r\n\r\n%s" % (len(body), body))
+    await writer.drain()
+    try:
+        response = await asyncio.wait_for(reader.read(), 5)
+    except asyncio.TimeoutError:  # requête jamais résolue
+        response = b""
+    writer.close()
+    if not response:  # connexion fermée sans réponse
+        return 0, None
+    head, _, payload = response.partition(b"\r\n\r\n")
+    return int(head.split()[1]), json.loads(payload or b"null")
+
+async def _check_server():
+    server = ExtractionServer(port=0, workers=0)
+    await server.start()
+    try:
+        answers = [await _post_extract(server.port, b'"trois quarts"')]
+        # Lot en attente annulé par l'arrêt du pool (close) : une réponse 503
+        release = threading.Event()
+        server.executor.submit(release.wait)
+        request = asyncio.ensure_future(_post_extract(server.port, b'"trois quarts"'))
+        await asyncio.sleep(0.1)
+        server.executor.shutdown(wait=False, cancel_futures=True)
+        release.set()
+        answers.append(await request)
+        # Pool arrêté (comme un BrokenProcessPool) : une réponse 500, pas une connexion coupée
+        server.executor.shutdown(wait=True)
+        answers.append(await _post_extract(server.port, b'"trois quarts"'))
+    finally:
+        await server.close()
+    return answers
+
+def run_server_tests():
+
+    print("--- Serveur HTTP ---")
+    failed = 0
+    answers = asyncio.run(_check_server())
+    if answers[0] != (200, {"result": "75%"}):
+        print(f"❌ POST /extract → {answers[0]}")
+        failed += 1
+    if answers[1][0] != 503 or "error" not in (answers[1][1] or {}):
+        print(f"❌ lot annulé → {answers[1]} (attendu: 503)")
+        failed += 1
+    if answers[2][0] != 500 or "error" not in (answers[2][1] or {}):
+        print(f"❌ erreur du pool → {answers[2]} (attendu: 500)")
+        failed += 1
+    print("Serveur HTTP : ", str(3-failed),"/", "3" )
+
+def run_locale_tests():
+
+    # Profil régional -> (texte -> résultat attendu) ; normalize_text garde les formes françaises hors "mixed"
+    locale_cases = {
+    "france": {
+        "soixante-dix-sept": "77",
+        "quatre-vingt-dix-neuf pour cent": "99%",
+        "un sur quatre-vingt": "1%",
+        "trois quatre-vingt-dixièmes": "3%",
+        "cent quatre-vingts dixièmes": "1800%",
+        "quatrevingt": "80",
+        "septante": "AUCUN CHIFFRE",
+    },
+    "belgium": {
+        "septante-deux": "72",
+        "nonante pour cent": "90%",
+        "quatre-vingts": "80",
+        "soixante-dix": "70",
+        "huitante": "AUCUN CHIFFRE",
+    },
+    "switzerland": {
+        "huitante-trois": "83",
+        "octante": "80",
+        "quatre-vingt-un": "81",
+    },
+}
+
+    print("--- Profils régionaux ---")
+    failed = 0
+    total = sum(len(cases) for cases in locale_cases.values()) + 3
+    try:
+        for locale, cases in locale_cases.items():
+            set_locale_profile(locale)
+            for text, expected in cases.items():
+                result = text_to_understanding(text)
+                if result != expected:
+                    print(f"❌ [{locale}] '{text}' → {result} (attendu: {expected})")
+                    failed += 1
+            # Le jeu de test principal, hors dizaines des autres régions, donne les mêmes résultats
+            excluded_stems = number_extract._REGIONAL_TENS_STEMS - number_extract._LOCALE_REGIONAL_TENS[locale]
+            for text, expected in test_cases.items():
+                if not any(stem in text.lower() for stem in excluded_stems) and text_to_understanding(text) != expected:
+                    print(f"❌ [{locale}] '{text}' → {text_to_understanding(text)} (attendu: {expected})")
+                    failed += 1
+        if normalize_text("quatre-vingt-deux") != "quatre vingt deux" or get_locale_profile() != "switzerland":
+            print(f"❌ [switzerland] normalize_text → {normalize_text('quatre-vingt-deux')}")
+            failed += 1
+    finally:
+        set_locale_profile(LOCALE_MIXED)
+    if normalize_text("quatre-vingt-deux") != "octante deux":
+        print(f"❌ [mixed] normalize_text → {normalize_text('quatre-vingt-deux')}")
+        failed += 1
+    try:
+        set_locale_profile("quebec")
+        print("❌ profil inconnu accepté")
+        failed += 1
+    except ValueError:
+        pass
+    print("Profils régionaux : ", str(total-failed),"/", str(total) )
+
+def run_incremental_tests():
+
+    # Mots ajoutés un à un -> résultat après chaque ajout (puis finalize, celui de text_to_understanding)
+    incremental_cases = {
+    ("deux", "cent", "quatre", "vingt"): ["2", "200", "204", "280"],
+    ("moins", "deux", "cent", "pour", "cent"): ["AUCUN CHIFFRE", "-2", "-200", "-200", "-200%"],
+    ("moins", "de", "trois"): ["AUCUN CHIFFRE", "AUCUN CHIFFRE", "3"],
+    ("un", "sur", "quatre", "vingt"): ["1", "1%", "25%", "1%"],
+    ("trois", "quarts", "de", "la", "classe"): ["3", "75%", "75%", "75%", "75%"],
+    ("un", "dix-septième"): ["1", "6%"],
+    ("presque", "tout"): ["AUCUN CHIFFRE", "95%"],
+    ("il y a", "12", "pour cent"): ["AUCUN CHIFFRE", "12", "12%"],
+    ("trois", "douzaines", "et", "deux"): ["3", "36", "36", "36"],
+    ("deux", "cent", "trois", "cent"): ["2", "200", "203", "AUCUN CHIFFRE"],
+    ("quinzz", "pour", "cent"): ["AUCUN CHIFFRE", "15", "15%"],
+    ("elle", "est", "douée"): ["AUCUN CHIFFRE", "AUCUN CHIFFRE", "AUCUN CHIFFRE"],
+    ("plus", "de", "mille"): ["AUCUN CHIFFRE", "AUCUN CHIFFRE", "1001"],
+    ("vingt", "ans,", "trois", "sur", "quatre"): ["20", "20", "23", "3%", "75%"],
+    ("deux", "et", "demi", "pour", "cent"): ["2", "2", "100%", "100%", "2%"],
+    ("un", "et", "demi", "pour", "cent"): ["1", "1", "50%", "50%", "1%"],
+    ("deux", "et", "demi", "%"): ["2", "2", "100%", "100%"],
+    ("la", "moitié", "pour", "cent"): ["AUCUN CHIFFRE", "50%", "50%", "50%"],
+    ("un", "dix-septième", "pour cent"): ["1", "6%", "11%"],
+    ("cinq", "virgule", "cinq", "pour", "cent"): ["5", "5", "5", "5", "5"],
+    ("virgule", "cinq", "pour cent"): ["AUCUN CHIFFRE", "AUCUN CHIFFRE", "AUCUN CHIFFRE"],
+    ("zéro", "virgule", "cinq"): ["0", "0", "0"],
+}
+
+    print("--- Lecture incrémentale ---")
+    failed = 0
+    extractor = IncrementalExtractor()
+    for chunks, expected in incremental_cases.items():
+        found = [format_understanding(extractor.append(chunk)) for chunk in chunks]
+        final_result = extractor.finalize()
+        if (found != expected or format_understanding(final_result) != expected[-1]
+                or text_to_understanding(" ".join(chunks)) != expected[-1] or extractor.result != text_to_result("")):
+            print(f"❌ {chunks} → {found} (attendu: {expected})")
+            failed += 1
+
+    # Sur les énoncés du jeu de test, mot à mot, même résultat que text_to_understanding
+    mismatches = []
+    for text in test_cases:
+        extractor.reset()
+        for word in text.split():
+            extractor.append(word)
+        found = format_understanding(extractor.finalize())
+        if found != text_to_understanding(text):
+            mismatches.append((text, found))
+    if mismatches:
+        print(f"❌ {len(mismatches)} énoncés différents de text_to_understanding : {mismatches[:5]}")
+        failed += 1
+    print("Lecture incrémentale : ", str(len(incremental_cases)+1-failed),"/", str(len(incremental_cases)+1) )
+
+def run_thread_tests():
+
+    # Textes analysés par plusieurs fils à la fois (fautes de frappe comprises : mémoire
+    # du correcteur), comparés aux résultats d'un seul fil
+    thread_texts = list(test_cases) + [
+        "il y a quatorse pommes", "vingtt-trois", "une douzainnes", "cinquente pour cent",
+        "deux milions", "trois quatriemmes", "les fontaines de la ville", "soixante-dix-sept mille trois cent",
+    ]
+    thread_count, rounds = 8, 3
+
+    print("--- Fils d'exécution ---")
+    failed = 0
+    disable_result_cache()
+    expected_understanding = [text_to_understanding(text) for text in thread_texts]
+    expected_numbers = [text_to_number(text) for text in thread_texts]
+
+    # Cache de résultats petit (évictions concurrentes) et mémoire du correcteur vide
+    enable_result_cache(maxsize=64)
+    number_extract._ENGINE.lexicon.speller._corrections.clear()
+    barrier = threading.Barrier(thread_count)
+    mismatches = []
+
+    def stress(seed):
+        order = list(range(len(thread_texts)))
+        random.Random(seed).shuffle(order)
+        barrier.wait()
+        for _ in range(rounds):
+            for index in order:
+                text = thread_texts[index]
+                if (text_to_understanding(text) != expected_understanding[index]
+                        or text_to_number(text) != expected_numbers[index]):
+                    mismatches.append(text)
+
+    threads = [threading.Thread(target=stress, args=(seed,)) for seed in range(thread_count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    disable_result_cache()
+    if mismatches:
+        print(f"❌ {len(mismatches)} résultat(s) différent(s) en parallèle, par exemple '{mismatches[0]}'")
+        failed += 1
+
+    threaded_results = text_to_understanding_threaded(thread_texts, max_workers=4, chunk_size=7)
+    if threaded_results != expected_understanding:
+        print("❌ text_to_understanding_threaded différent de text_to_understanding")
+        failed += 1
+
+    # Aucun conteneur mutable au niveau du module : les tables sont figées
+    mutable_globals = [name for name, value in vars(number_extract).items()
+                       if isinstance(value, (dict, list, set, bytearray)) and not name.startswith("__")]
+    if mutable_globals:
+        print(f"❌ état mutable partagé : {mutable_globals}")
+        failed += 1
+    print("Fils d'exécution : ", str(3-failed),"/", "3" )
+
 # Lancer les tests
 if __name__ == "__main__":
-    run_tests()
\ No newline at end of file
+    run_tests()
+    run_result_tests()
+    run_tokenize_tests()
+    run_instrumentation_tests()
+    run_stream_tests()
+    run_bulk_tests()
+    run_extract_all_tests()
+    run_incremental_tests()
+    run_locale_tests()
+    run_fuzzy_tests()
+    run_array_tests()
+    run_snapshot_tests()
+    run_persistent_cache_tests()
+    run_server_tests()
+    run_thread_tests()
+    run_adversarial_tests()